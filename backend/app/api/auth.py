@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
-from backend.app.dependencies.use_cases import get_create_user_use_case, get_auth_user_use_case
+from backend.app.dependencies.use_cases import (
+    get_create_user_use_case,
+    get_auth_user_use_case,
+    get_refresh_tokens_use_case,
+    get_logout_user_use_case,
+)
 from backend.app.logs.logger import logger
-from backend.app.schemas.user_schemas import UserRegistrationSchema, TokenInfo
+from backend.app.schemas.user_schemas import UserRegistrationSchema, TokenInfo, RefreshTokenSchema
 from backend.app.use_case.auth_user import AuthUserUseCase
 from backend.app.use_case.create_user import CreateUserUseCase
+from backend.app.use_case.logout_user import LogoutUserUseCase
+from backend.app.use_case.refresh_tokens import RefreshTokensUseCase
 
 router = APIRouter(prefix='/auth', tags=["authentication"])
 
@@ -35,6 +42,7 @@ async def registration(
 
 @router.post("/login/", summary="Авторизация пользователя", response_model=TokenInfo)
 async def auth_user(
+    request: Request,
     form: OAuth2PasswordRequestForm = Depends(),
     use_case: AuthUserUseCase = Depends(get_auth_user_use_case),
 ) -> TokenInfo:
@@ -42,8 +50,11 @@ async def auth_user(
     Авторизация пользователя и генерация JWT-токена.
 
     Проверяет логин и пароль пользователя и возвращает access token.
+    Слишком частые попытки с одного IP-адреса или для одного имени
+    отклоняются с 429 до проверки пароля.
 
     Args:
+        request (Request): Входящий запрос, из него берётся IP-адрес клиента.
         form (OAuth2PasswordRequestForm): Стандартная форма OAuth2 с полями username и password.
         use_case (AuthUserUseCase): Use-case для аутентификации пользователя.
 
@@ -51,6 +62,49 @@ async def auth_user(
         TokenInfo: Информация о токене, включает:
             - access_token: сам JWT-токен
             - token_type: тип токена
+            - refresh_token: токен для обновления без повторного входа
     """
     logger.info("Авторизация пользователя")
-    return await use_case.execute(form.username, form.password)
+    client_ip = request.client.host if request.client else None
+    return await use_case.execute(form.username, form.password, client_ip)
+
+
+@router.post("/refresh/", summary="Обновление токенов", response_model=TokenInfo)
+async def refresh_tokens(
+    data: RefreshTokenSchema,
+    use_case: RefreshTokensUseCase = Depends(get_refresh_tokens_use_case),
+) -> TokenInfo:
+    """
+    Обменивает refresh-токен на новую пару токенов без проверки пароля.
+
+    Каждый refresh-токен можно использовать один раз; повторное
+    использование отзывает всю сессию входа.
+
+    Args:
+        data (RefreshTokenSchema): Refresh-токен клиента.
+        use_case (RefreshTokensUseCase): Use-case для обновления токенов.
+
+    Returns:
+        TokenInfo: Новые access- и refresh-токены.
+    """
+    logger.info("Обновление токенов")
+    return await use_case.execute(data.refresh_token)
+
+
+@router.post("/logout/", summary="Выход пользователя")
+async def logout(
+    data: RefreshTokenSchema,
+    use_case: LogoutUserUseCase = Depends(get_logout_user_use_case),
+) -> dict:
+    """
+    Завершает сессию входа: отзывает её refresh- и access-токены.
+
+    Args:
+        data (RefreshTokenSchema): Refresh-токен сессии.
+        use_case (LogoutUserUseCase): Use-case для выхода пользователя.
+
+    Returns:
+        dict: Сообщение о выходе.
+    """
+    logger.info("Выход пользователя")
+    return await use_case.execute(data.refresh_token)
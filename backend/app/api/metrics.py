@@ -0,0 +1,85 @@
+from backend.app.core.events import task_events
+from backend.app.core.internal_server import internal_server
+from backend.app.core.login_limiter import login_limiter
+from backend.app.core.metrics import metrics
+from backend.app.core.password_hasher import password_hasher
+from backend.app.core.task_cache import task_list_cache
+from backend.app.database.database import database
+
+metrics.callback(
+    "db_pool_connections",
+    "Соединения основного пула БД по состоянию",
+    lambda: {
+        ("checked_out",): database.pool_stats()["checked_out"],
+        ("checked_in",): database.pool_stats()["checked_in"],
+        ("overflow",): database.pool_stats()["overflow"],
+    },
+    ("state",),
+)
+metrics.callback(
+    "db_pool_timeouts_total",
+    "Запросы, не дождавшиеся соединения из пула",
+    lambda: database.pool_stats()["timeouts"],
+    kind="counter",
+)
+metrics.callback(
+    "password_hash_tasks",
+    "Задачи пула bcrypt по состоянию",
+    lambda: {
+        ("active",): password_hasher.stats()["active"],
+        ("queued",): password_hasher.stats()["queued"],
+    },
+    ("state",),
+)
+metrics.callback(
+    "password_hash_rejected_total",
+    "Запросы, отклонённые из-за переполнения очереди bcrypt",
+    lambda: password_hasher.stats()["rejected"],
+    kind="counter",
+)
+metrics.callback(
+    "task_list_cache_requests_total",
+    "Обращения к кэшу списка задач",
+    lambda: {("hit",): task_list_cache.hits, ("miss",): task_list_cache.misses},
+    ("result",),
+    kind="counter",
+)
+metrics.callback(
+    "task_events_subscribers",
+    "Открытые потоки /tasks/stream/",
+    lambda: task_events.stats()["subscribers"],
+)
+
+metrics.callback(
+    "login_attempts_total",
+    "Попытки входа, пропущенные и отклонённые ограничителем",
+    lambda: {("allowed",): login_limiter.allowed, ("rejected",): login_limiter.rejected},
+    ("result",),
+    kind="counter",
+)
+metrics.callback(
+    "login_lockouts_total",
+    "Блокировки входа после серии неудачных попыток",
+    lambda: login_limiter.lockouts,
+    kind="counter",
+)
+
+
+@internal_server.get("/metrics", media_type="text/plain; version=0.0.4; charset=utf-8")
+async def get_metrics() -> str:
+    """
+    Возвращает метрики воркера в текстовом формате Prometheus.
+
+    Гистограммы времени запросов по маршрутам, числа и времени SQL-запросов
+    на запрос, ожидания соединения из пула, проверки JWT и bcrypt, а также
+    текущее состояние пулов и кэшей.
+
+    Метрики относятся к одному процессу, поэтому отдаются не на основном
+    порту (где запрос попал бы к случайному воркеру), а на служебном порту
+    воркера. Prometheus опрашивает каждый порт диапазона `internal_port`
+    как отдельную цель и суммирует ряды в запросах (`sum without (instance)`).
+
+    Returns:
+        str: Метрики в формате text/plain; version=0.0.4.
+    """
+    return metrics.render()
@@ -0,0 +1,39 @@
+from backend.app.core.events import task_events
+from backend.app.core.internal_server import internal_server
+from backend.app.core.key_manager import key_manager
+from backend.app.core.login_limiter import login_limiter
+from backend.app.core.password_hasher import password_hasher
+from backend.app.core.refresh_tokens import revoked_sessions
+from backend.app.core.task_cache import task_list_cache
+from backend.app.database.database import database
+
+
+@internal_server.get("/system/stats/")
+async def get_stats() -> dict:
+    """
+    Возвращает текущие метрики загрузки внутренних ресурсов воркера.
+
+    Доступен только на служебном порту воркера (`internal_port`), а не на
+    основном порту приложения: ответ раскрывает внутреннее состояние.
+
+    Returns:
+        dict: Метрики, сгруппированные по компонентам:
+            - password_hasher: загрузка пула хеширования паролей;
+            - db_pool: состояние пула соединений с БД и время ожидания соединений;
+            - db_replicas: маршрутизация чтений по репликам и их пулы;
+            - task_list_cache: попадания в кэш списка задач;
+            - task_events: подписчики и события потока изменений задач;
+            - login_limiter: пропущенные и отклонённые попытки входа;
+            - revoked_sessions: отозванные сессии в памяти воркера;
+            - jwt_keys: текущий ключ подписи и ключи для проверки токенов.
+    """
+    return {
+        "password_hasher": password_hasher.stats(),
+        "db_pool": database.pool_stats(),
+        "db_replicas": database.replica_stats(),
+        "task_list_cache": task_list_cache.stats(),
+        "task_events": task_events.stats(),
+        "login_limiter": login_limiter.stats(),
+        "revoked_sessions": revoked_sessions.stats(),
+        "jwt_keys": key_manager.stats(),
+    }
@@ -1,45 +1,163 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from typing import Literal
 
-from backend.app.database.models import UserModels
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from backend.app.config import settings
+from backend.app.core.events import task_events
 from backend.app.dependencies.auth import get_current_is_user
 from backend.app.dependencies.use_cases import (
     get_list_tasks_use_case,
+    get_export_tasks_use_case,
     get_create_task_use_case,
     get_change_task_state_use_case,
-    get_delete_task_use_case
+    get_delete_task_use_case,
+    get_batch_create_tasks_use_case,
+    get_batch_change_tasks_state_use_case,
+    get_batch_delete_tasks_use_case,
+    get_import_tasks_use_case,
+)
+from backend.app.schemas.task_schemas import (
+    TaskSchema,
+    TaskFilterSchema,
+    TaskBatchCreateSchema,
+    TaskIdsSchema,
+    TaskPageSchema,
 )
-from backend.app.schemas.task_schemas import TaskSchema
+from backend.app.schemas.user_schemas import UserPrincipal
+from backend.app.use_case.batch_change_tasks_state import BatchChangeTasksStateUseCase
+from backend.app.use_case.batch_create_tasks import BatchCreateTasksUseCase
+from backend.app.use_case.batch_delete_tasks import BatchDeleteTasksUseCase
 from backend.app.use_case.create_task import CreateTaskUseCase
 from backend.app.use_case.delete_task import DeleteTaskUseCase
+from backend.app.use_case.export_tasks import ExportTasksUseCase
+from backend.app.use_case.import_tasks import ImportTasksUseCase
 from backend.app.use_case.get_list_tasks import GetListTasksUseCase
 from backend.app.use_case.change_task_state import ChangeTaskStateUseCase
 
 router = APIRouter(prefix='/tasks', tags=["tasks"])
 
 
-@router.get("/get/", summary="Получение списка задач пользователя")
+@router.get("/get/", summary="Получение списка задач пользователя", response_model=TaskPageSchema)
 async def get_list_tasks(
-    current_user: UserModels = Depends(get_current_is_user),
+    filters: TaskFilterSchema = Depends(),
+    limit: int = Query(settings.tasks_page_size, ge=1, le=settings.tasks_page_size_max),
+    cursor: str | None = Query(None, description="Курсор следующей страницы"),
+    if_none_match: str | None = Header(None),
+    current_user: UserPrincipal = Depends(get_current_is_user),
     use_case: GetListTasksUseCase = Depends(get_list_tasks_use_case),
 ):
     """
-    Получает список всех задач текущего пользователя.
+    Получает страницу задач текущего пользователя, от новых к старым.
+
+    Ответ содержит сильный ETag. Если клиент прислал его в `If-None-Match`
+    и список задач не изменился, возвращается 304 без тела.
+    Страница сериализуется напрямую через orjson, минуя повторную
+    валидацию по `response_model`, который описывает формат ответа в OpenAPI.
 
     Args:
-        current_user (UserModels): Текущий аутентифицированный пользователь.
+        filters (TaskFilterSchema): Фильтры по статусу и времени создания.
+        limit (int): Размер страницы.
+        cursor (str | None): Курсор следующей страницы из предыдущего ответа.
+        if_none_match (str | None): ETag ранее полученной страницы.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
         use_case (GetListTasksUseCase): Use-case для получения списка задач.
 
     Returns:
-        list: Список задач пользователя (TaskModels).
+        Response: Страница задач (TaskPageSchema) или пустой ответ 304.
+    """
+    etag, page = await use_case.execute(current_user, filters, limit, cursor, if_none_match)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if page is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return ORJSONResponse(page, headers=headers)
+
+
+@router.get("/export/", summary="Выгрузка задач пользователя в NDJSON или CSV")
+async def export_tasks(
+    filters: TaskFilterSchema = Depends(),
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Формат выгрузки"),
+    current_user: UserPrincipal = Depends(get_current_is_user),
+    use_case: ExportTasksUseCase = Depends(get_export_tasks_use_case),
+):
+    """
+    Выгружает все задачи текущего пользователя потоком, от новых к старым.
+
+    Задачи читаются из БД серверным курсором и отправляются частями,
+    поэтому память воркера не растёт с количеством задач.
+
+    Args:
+        filters (TaskFilterSchema): Фильтры по статусу и времени создания.
+        fmt (str): Формат выгрузки: "ndjson" (по умолчанию) или "csv".
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
+        use_case (ExportTasksUseCase): Use-case для выгрузки задач.
+
+    Returns:
+        StreamingResponse: Файл выгрузки.
+    """
+    media_type = "text/csv; charset=utf-8" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        use_case.execute(current_user, filters, fmt),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{fmt}"'},
+    )
+
+
+@router.get("/stream/", summary="Поток изменений задач пользователя")
+async def stream_tasks(
+    request: Request,
+    current_user: UserPrincipal = Depends(get_current_is_user),
+):
+    """
+    Отправляет изменения задач текущего пользователя в формате Server-Sent Events.
+
+    Каждое событие имеет тип `task` и JSON-данные вида
+    `{"type": "created" | "updated" | "deleted" | "resync", ...}`.
+    При `resync` клиент должен заново загрузить список задач. Пока
+    событий нет, раз в `task_events_heartbeat_seconds` отправляется
+    комментарий, чтобы прокси не закрывали соединение. Соединение с БД
+    на время потока не удерживается.
+
+    Args:
+        request (Request): Входящий запрос, используется для отслеживания отключения клиента.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
+
+    Returns:
+        StreamingResponse: Поток `text/event-stream`.
     """
-    return await use_case.execute(current_user)
+    queue = task_events.subscribe(current_user.id)
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), timeout=settings.task_events_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if payload is None:
+                    break
+                yield f"event: task\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            task_events.unsubscribe(current_user.id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/create/", summary="Создание новой задачи")
 async def create_task(
     credentials: TaskSchema,
     use_case: CreateTaskUseCase = Depends(get_create_task_use_case),
-    current_user: UserModels = Depends(get_current_is_user),
+    current_user: UserPrincipal = Depends(get_current_is_user),
 ):
     """
     Создаёт новую задачу для текущего пользователя.
@@ -47,7 +165,7 @@ async def create_task(
     Args:
         credentials (TaskSchema): Данные новой задачи (title, description).
         use_case (CreateTaskUseCase): Use-case для создания задачи.
-        current_user (UserModels): Текущий аутентифицированный пользователь.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
 
     Returns:
         dict: Сообщение об успешном создании задачи.
@@ -60,7 +178,7 @@ async def create_task(
 async def change_task_state(
     task_id: int,
     use_case: ChangeTaskStateUseCase = Depends(get_change_task_state_use_case),
-    current_user: UserModels = Depends(get_current_is_user),
+    current_user: UserPrincipal = Depends(get_current_is_user),
 ):
     """
     Изменяет статус выполнения задачи (выполнена / не выполнена).
@@ -68,20 +186,23 @@ async def change_task_state(
     Args:
         task_id (int): ID задачи для обновления.
         use_case (ChangeTaskStateUseCase): Use-case для изменения статуса задачи.
-        current_user (UserModels): Текущий аутентифицированный пользователь.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
 
     Returns:
         dict: Сообщение о новом статусе задачи.
             Например: {'msg': "Задача отмечена как 'выполнена'"}.
+
+    Raises:
+        HTTPException: 404 — если задача не найдена или принадлежит другому пользователю.
     """
-    return await use_case.execute(task_id)
+    return await use_case.execute(task_id, current_user)
 
 
 @router.delete("/delete/{task_id}", summary="Удаление задачи")
 async def delete_task(
     task_id: int,
     use_case: DeleteTaskUseCase = Depends(get_delete_task_use_case),
-    current_user: UserModels = Depends(get_current_is_user),
+    current_user: UserPrincipal = Depends(get_current_is_user),
 ):
     """
     Удаляет задачу по её ID.
@@ -89,10 +210,105 @@ async def delete_task(
     Args:
         task_id (int): ID задачи для удаления.
         use_case (DeleteTaskUseCase): Use-case для удаления задачи.
-        current_user (UserModels): Текущий аутентифицированный пользователь.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
 
     Returns:
         dict: Сообщение об успешном удалении задачи.
             Например: {'msg': "Задача успешно удалена"}.
     """
-    return await use_case.execute(task_id)
+    return await use_case.execute(task_id, current_user)
+
+
+@router.post("/batch/create/", summary="Пакетное создание задач")
+async def batch_create_tasks(
+    credentials: TaskBatchCreateSchema,
+    use_case: BatchCreateTasksUseCase = Depends(get_batch_create_tasks_use_case),
+    current_user: UserPrincipal = Depends(get_current_is_user),
+):
+    """
+    Создаёт несколько задач текущего пользователя одним запросом и одной транзакцией.
+
+    Args:
+        credentials (TaskBatchCreateSchema): Данные новых задач.
+        use_case (BatchCreateTasksUseCase): Use-case для пакетного создания задач.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
+
+    Returns:
+        dict: ID созданных задач по каждому элементу запроса.
+            Например: {'items': [{'index': 0, 'task_id': 10}]}.
+    """
+    return await use_case.execute(credentials, current_user)
+
+
+@router.put("/batch/update/", summary="Пакетное изменение статуса задач")
+async def batch_change_tasks_state(
+    credentials: TaskIdsSchema,
+    use_case: BatchChangeTasksStateUseCase = Depends(get_batch_change_tasks_state_use_case),
+    current_user: UserPrincipal = Depends(get_current_is_user),
+):
+    """
+    Переключает статус нескольких задач текущего пользователя одним запросом.
+
+    Args:
+        credentials (TaskIdsSchema): Идентификаторы задач.
+        use_case (BatchChangeTasksStateUseCase): Use-case для пакетного изменения статуса.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
+
+    Returns:
+        dict: Новый статус по каждому ID.
+            Например: {'items': [{'task_id': 1, 'status': 'ok', 'is_done': True}]}.
+    """
+    return await use_case.execute(credentials, current_user)
+
+
+@router.post("/batch/delete/", summary="Пакетное удаление задач")
+async def batch_delete_tasks(
+    credentials: TaskIdsSchema,
+    use_case: BatchDeleteTasksUseCase = Depends(get_batch_delete_tasks_use_case),
+    current_user: UserPrincipal = Depends(get_current_is_user),
+):
+    """
+    Удаляет несколько задач текущего пользователя одним запросом.
+
+    Args:
+        credentials (TaskIdsSchema): Идентификаторы задач.
+        use_case (BatchDeleteTasksUseCase): Use-case для пакетного удаления задач.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
+
+    Returns:
+        dict: Результат удаления по каждому ID.
+            Например: {'items': [{'task_id': 1, 'status': 'deleted'}]}.
+    """
+    return await use_case.execute(credentials, current_user)
+
+
+@router.post("/import/", summary="Импорт задач из NDJSON или CSV")
+async def import_tasks(
+    request: Request,
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Формат файла"),
+    use_case: ImportTasksUseCase = Depends(get_import_tasks_use_case),
+    current_user: UserPrincipal = Depends(get_current_is_user),
+):
+    """
+    Импортирует задачи текущего пользователя из тела запроса.
+
+    Тело запроса — сам файл (не multipart). Он читается потоком, строки
+    проверяются по TaskSchema и записываются в БД пачками через COPY.
+
+    Args:
+        request (Request): Входящий запрос, тело которого читается потоком.
+        fmt (str): Формат файла: "ndjson" (по умолчанию) или "csv".
+        use_case (ImportTasksUseCase): Use-case для импорта задач.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
+
+    Returns:
+        dict: Отчёт об импорте: количество импортированных и ошибочных строк,
+            ошибки по строкам и скорость импорта.
+            Например: {'imported': 2, 'failed': 1, 'errors': [{'line': 3, 'error': '...'}],
+            'seconds': 0.01, 'rows_per_second': 200.0}.
+
+    Raises:
+        HTTPException: 400 — если файл не в UTF-8 или в CSV нет колонки title;
+            413 — если строка файла слишком длинная.
+    """
+    return await use_case.execute(current_user, request.stream(), fmt)
@@ -1,5 +1,6 @@
-import subprocess
+from typing import Literal
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from pathlib import Path
 
@@ -15,12 +16,126 @@ class Settings(BaseSettings):
         db_name (str): Название базы данных.
         port (str): Порт подключения к БД.
         pg_url (str): Полный URL подключения к PostgreSQL.
+        pg_replica_urls (list[str]): URL реплик PostgreSQL для запросов на чтение
+            (JSON-список в .env, по умолчанию пусто — всё читается из основной БД).
         echo (bool): Включение логирования SQL-запросов (по умолчанию False).
+        db_pool_size (int): Число постоянно открытых соединений в пуле (по умолчанию 5).
+        db_max_overflow (int): Сколько соединений можно открыть сверх db_pool_size (по умолчанию 10).
+        db_pool_timeout (float): Сколько секунд ждать свободного соединения (по умолчанию 30).
+        db_pool_recycle (int): Через сколько секунд пересоздавать соединение (по умолчанию 1800, -1 — никогда).
+        db_pool_pre_ping (bool): Проверять соединение перед выдачей из пула (по умолчанию True).
+        db_statement_cache_size (int): Размер кэша подготовленных выражений asyncpg
+            на соединение (по умолчанию 100, 0 — отключён).
+        db_statement_timeout_ms (int | None): Серверный statement_timeout в миллисекундах
+            (по умолчанию не задан).
+        db_replica_sticky_seconds (float): Сколько секунд после записи пользователя его чтения
+            идут в основную БД (по умолчанию 5).
+        db_replica_retry_seconds (float): На сколько секунд реплика с ошибкой исключается
+            из ротации (по умолчанию 30).
+        db_max_connections (int | None): Бюджет соединений с БД на все воркеры `server.py`;
+            делится между воркерами (по умолчанию не задан — каждый воркер берёт db_pool_size
+            и db_max_overflow).
+
+        server_host (str): Адрес, который слушает `server.py` (по умолчанию 0.0.0.0).
+        server_port (int): Порт `server.py` (по умолчанию 8000).
+        server_workers (int | None): Количество воркеров (по умолчанию — число CPU).
+        server_graceful_timeout (float): Сколько секунд при остановке ждать завершения
+            начатых запросов.
+        server_keep_alive_timeout (int): Сколько секунд держать открытым простаивающее
+            keep-alive соединение.
+        server_access_log (bool): Писать access-лог uvicorn (по умолчанию выключен).
+        server_require_shared_state (bool): Не запускать несколько воркеров, если кэш, лимит
+            входа или события задач хранятся в памяти воркера (по умолчанию — только
+            предупреждение в лог).
+        internal_host (str): Адрес служебного сервера воркера с эндпоинтами мониторинга
+            (по умолчанию 127.0.0.1 — доступен только локально).
+        internal_port (int | None): Первый порт служебных серверов: воркеры занимают порты
+            internal_port .. internal_port + server_workers - 1; None — служебный сервер
+            не запускается (по умолчанию 9100).
 
         private_key_path (Path): Путь к приватному ключу для JWT.
         public_key_path (Path): Путь к публичному ключу для JWT.
-        algorithm (str): Алгоритм для JWT (по умолчанию RS256).
+        jwt_previous_keys_dir (Path): Каталог публичных ключей, выведенных из подписи
+            при ротации; ими проверяются ранее выданные токены.
+        algorithm (str): Алгоритм новых ключей JWT: "EdDSA" (Ed25519), "ES256" (P-256)
+            или "RS256" (RSA 2048), по умолчанию "EdDSA". Подпись выполняется алгоритмом
+            текущего ключа, поэтому уже существующие ключи RSA продолжают работать.
         access_token_expire_minutes (int): Время жизни access token в минутах (по умолчанию 15).
+        refresh_token_expire_days (int): Время жизни refresh token в днях (по умолчанию 30).
+        refresh_token_reuse_grace_seconds (float): Сколько секунд после обмена повторное
+            предъявление того же refresh-токена отклоняется без отзыва сессии — так
+            одновременные обновления из нескольких вкладок не завершают вход (по умолчанию 10).
+        revoked_sessions_sync_seconds (float): Как часто (в секундах) подгружать из БД сессии,
+            отозванные другими воркерами.
+        revoked_sessions_max_size (int): Максимальное число отозванных сессий в памяти воркера.
+        jwt_key_reload_interval (float): Как часто (в секундах) проверять изменение файлов ключей.
+        jwt_token_cache_size (int): Максимальное число проверенных токенов в кэше (0 — кэш отключён).
+        auth_mode (str): Способ получения текущего пользователя: "stateless" — только из claims
+            JWT без обращения к БД, "database" — с проверкой пользователя в БД (по умолчанию "stateless").
+        user_cache_ttl_seconds (float): Время жизни записей кэша пользователей в режиме "database"
+            (0 — кэш отключён).
+        user_cache_size (int): Максимальное число пользователей в кэше.
+
+        password_hash_scheme (str): Схема новых хешей паролей: "bcrypt" или "argon2id"
+            (по умолчанию "bcrypt", для argon2id нужен пакет argon2-cffi).
+        bcrypt_rounds (int): Стоимость bcrypt — логарифм числа раундов от 4 до 31 (по умолчанию 12).
+        argon2_time_cost (int): Число проходов argon2id по памяти (по умолчанию 3).
+        argon2_memory_cost_kib (int): Память argon2id на один хеш в КиБ (по умолчанию 65536).
+        argon2_parallelism (int): Число потоков argon2id на один хеш (по умолчанию 1:
+            параллельность даёт пул хеширования).
+        password_rehash_on_login (bool): Пересчитывать при входе хеши, схема или параметры
+            которых отличаются от заданных (по умолчанию True).
+        password_hash_executor (str): Пул для bcrypt: "thread" или "process" (по умолчанию "thread").
+        password_hash_workers (int | None): Размер пула bcrypt (по умолчанию min(4, число CPU)).
+        password_hash_max_queue (int): Сколько задач bcrypt может ждать воркера, прежде чем
+            новые запросы начнут отклоняться с 503.
+
+        login_limiter_backend (str): Ограничение попыток входа: "memory" — в памяти воркера,
+            "redis" — общее в Redis (`redis_url`), "none" — отключено (по умолчанию "memory").
+        login_ip_burst (int): Сколько попыток входа подряд допускается с одного IP-адреса.
+        login_ip_per_minute (float): Сколько попыток в минуту восстанавливается для IP-адреса.
+        login_user_burst (int): Сколько попыток входа подряд допускается для одного имени.
+        login_user_per_minute (float): Сколько попыток в минуту восстанавливается для имени.
+        login_ip_lockout_threshold (int): После скольких неудач подряд блокируется IP-адрес.
+        login_user_lockout_threshold (int): После скольких неудач подряд блокируется имя.
+        login_lockout_base_seconds (float): Длительность первой блокировки; каждая следующая
+            вдвое дольше.
+        login_lockout_max_seconds (float): Максимальная длительность блокировки.
+        login_failure_window_seconds (float): Через сколько секунд без неудач счётчик сбрасывается.
+        login_limiter_max_keys (int): Максимальное число ключей в ограничителе "memory".
+
+        tasks_page_size (int): Размер страницы списка задач по умолчанию.
+        tasks_page_size_max (int): Максимально допустимый размер страницы списка задач.
+        tasks_batch_max_items (int): Максимальное число элементов в одном пакетном запросе.
+        tasks_export_batch_size (int): Сколько строк читается из курсора и отправляется
+            клиенту за раз при выгрузке задач.
+        tasks_import_batch_size (int): Сколько задач записывается в БД одним COPY при импорте.
+        tasks_import_max_errors (int): Сколько ошибок по строкам возвращается в отчёте импорта.
+        tasks_import_max_line_bytes (int): Максимальная длина строки (записи CSV) импортируемого
+            файла; более длинная строка прерывает импорт с 413.
+
+        task_cache_backend (str): Кэш списка задач: "memory" — в памяти воркера, "redis" — общий
+            в Redis, "none" — отключён (по умолчанию "memory").
+        task_cache_max_entries (int): Максимальное число страниц в кэше "memory".
+        task_cache_ttl_seconds (float): Время жизни закэшированной страницы в секундах.
+        redis_url (str | None): URL Redis для кэша и ограничителя входа "redis".
+
+        task_events_backend (str): Доставка событий `/tasks/stream/`: "local" — в пределах воркера,
+            "postgres" — между всеми воркерами через LISTEN/NOTIFY (по умолчанию "local").
+        task_events_queue_size (int): Сколько событий может ждать одного подписчика.
+        task_events_heartbeat_seconds (float): Интервал служебных сообщений в открытом потоке.
+
+        log_level (str): Минимальный уровень записей в консоль (по умолчанию INFO).
+        log_file_level (str): Минимальный уровень записей в файл logs/app.log (по умолчанию DEBUG).
+        log_file_enabled (bool): Писать лог в файл logs/app.log. При нескольких воркерах
+            `server.py` выключает запись в файл, и лог идёт только в консоль.
+        log_format (str): Формат записей: "json" — по одной JSON-строке, "text" — текст
+            (по умолчанию "json").
+        log_max_bytes (int): Размер файла лога, после которого он ротируется.
+        log_backup_count (int): Сколько ротированных файлов лога хранить.
+        log_debug_sample_rate (float): Доля сохраняемых DEBUG-записей (1 — все).
+        log_debug_sample_rates (dict[str, float]): Доля DEBUG-записей по имени логгера,
+            по умолчанию 1% для частых записей `app_logger.database`.
     """
 
     # PostgreSQL / база данных
@@ -30,53 +145,104 @@ class Settings(BaseSettings):
     db_name: str
     port: str
     pg_url: str
+    pg_replica_urls: list[str] = []
     echo: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    db_statement_timeout_ms: int | None = None
+    db_replica_sticky_seconds: float = 5
+    db_replica_retry_seconds: float = 30
+    db_max_connections: int | None = None
+
+    # Сервер
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int | None = None
+    server_graceful_timeout: float = 30
+    server_keep_alive_timeout: int = 5
+    server_access_log: bool = False
+    server_require_shared_state: bool = False
+    internal_host: str = "127.0.0.1"
+    internal_port: int | None = 9100
 
     # JWT / безопасность
     private_key_path: Path = Path(__file__).parent / "certs" / "jwt-private.pem"
     public_key_path: Path = Path(__file__).parent / "certs" / "jwt-public.pem"
-    algorithm: str = "RS256"
+    jwt_previous_keys_dir: Path = Path(__file__).parent / "certs" / "previous"
+    algorithm: Literal["RS256", "ES256", "EdDSA"] = "EdDSA"
     access_token_expire_minutes: int = 15
+    refresh_token_expire_days: int = 30
+    refresh_token_reuse_grace_seconds: float = 10
+    revoked_sessions_sync_seconds: float = 5
+    revoked_sessions_max_size: int = 100_000
+    jwt_key_reload_interval: float = 5.0
+    jwt_token_cache_size: int = 10_000
+    auth_mode: Literal["stateless", "database"] = "stateless"
+    user_cache_ttl_seconds: float = 0
+    user_cache_size: int = 10_000
+
+    # Хеширование паролей
+    password_hash_scheme: Literal["bcrypt", "argon2id"] = "bcrypt"
+    bcrypt_rounds: int = Field(12, ge=4, le=31)
+    argon2_time_cost: int = 3
+    argon2_memory_cost_kib: int = 65536
+    argon2_parallelism: int = 1
+    password_rehash_on_login: bool = True
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_workers: int | None = None
+    password_hash_max_queue: int = 32
+
+    # Ограничение попыток входа
+    login_limiter_backend: Literal["none", "memory", "redis"] = "memory"
+    login_ip_burst: int = 20
+    login_ip_per_minute: float = 10
+    login_user_burst: int = 5
+    login_user_per_minute: float = 5
+    login_ip_lockout_threshold: int = 20
+    login_user_lockout_threshold: int = 5
+    login_lockout_base_seconds: float = 30
+    login_lockout_max_seconds: float = 900
+    login_failure_window_seconds: float = 900
+    login_limiter_max_keys: int = 100_000
+
+    # Задачи
+    tasks_page_size: int = 50
+    tasks_page_size_max: int = 200
+    tasks_batch_max_items: int = 500
+    tasks_export_batch_size: int = 1000
+    tasks_import_batch_size: int = 1000
+    tasks_import_max_errors: int = 100
+    tasks_import_max_line_bytes: int = 16_384
+
+    # Кэш
+    task_cache_backend: Literal["none", "memory", "redis"] = "memory"
+    task_cache_max_entries: int = 10_000
+    task_cache_ttl_seconds: float = 30
+    redis_url: str | None = None
+
+    # События задач
+    task_events_backend: Literal["local", "postgres"] = "local"
+    task_events_queue_size: int = 100
+    task_events_heartbeat_seconds: float = 15
+
+    # Логирование
+    log_level: str = "INFO"
+    log_file_level: str = "DEBUG"
+    log_file_enabled: bool = True
+    log_format: Literal["json", "text"] = "json"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
+    log_debug_sample_rate: float = 1.0
+    log_debug_sample_rates: dict[str, float] = {"app_logger.database": 0.01}
 
     class Config:
         """Настройки для работы с .env файлом."""
         env_file = ".env"
         env_file_encoding = "utf-8"
 
-    def generate_keys_if_not_exist(self):
-        """Генерирует приватный и публичный ключ"""
-        certs_dir = self.private_key_path.parent
-        private_key_path = self.private_key_path
-        public_key_path = self.public_key_path
-
-        if private_key_path.exists() and public_key_path.exists():
-            return
-
-        print("Ключи JWT не найдены → генерируем новые для разработки...")
-
-        certs_dir.mkdir(parents=True, exist_ok=True)
-
-        try:
-            # Генерация приватного ключа
-            subprocess.run(
-                ["openssl", "genrsa", "-out", str(private_key_path), "2048"],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            # Извлечение публичного ключа
-            subprocess.run(
-                ["openssl", "rsa", "-in", str(private_key_path), "-pubout", "-out", str(public_key_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            print(f"Ключи сгенерированы:\n  {private_key_path}\n  {public_key_path}")
-        except subprocess.CalledProcessError as e:
-            print("Ошибка генерации ключей:", e.stderr)
-            raise RuntimeError("Не удалось сгенерировать JWT-ключи")
-
 
 settings = Settings()
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Ограниченный по размеру LRU-кэш с индивидуальным временем жизни записей.
+
+    Каждая запись хранится до момента `expires_at` (в секундах, по часам
+    `time.time()`). При превышении `maxsize` вытесняется давно не
+    использованная запись.
+
+    Attributes:
+        maxsize (int): Максимальное количество записей в кэше.
+        hits (int): Количество попаданий в кэш.
+        misses (int): Количество промахов кэша.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Инициализация кэша.
+
+        Args:
+            maxsize (int): Максимальное количество записей.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Возвращает значение по ключу, если запись существует и не истекла.
+
+        Args:
+            key (Hashable): Ключ записи.
+
+        Returns:
+            Any | None: Сохранённое значение или None.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            value, expires_at = item
+            if expires_at <= time.time():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """
+        Сохраняет значение до указанного момента времени.
+
+        Args:
+            key (Hashable): Ключ записи.
+            value (Any): Значение.
+            expires_at (float): Unix-время истечения записи.
+        """
+        if self.maxsize <= 0 or expires_at <= time.time():
+            return
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Удаляет запись по ключу, если она есть."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,39 @@
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """
+    Строит сильный ETag из частей, однозначно определяющих представление.
+
+    Args:
+        *parts: Значения, от которых зависит тело ответа (пользователь,
+            версия данных, параметры запроса).
+
+    Returns:
+        str: ETag в кавычках, например `"1f3a...c9"`.
+    """
+    raw = "|".join(str(part) for part in parts).encode()
+    return f'"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Проверяет заголовок `If-None-Match` на совпадение с ETag.
+
+    Сравнение слабое, как требует RFC 9110 для `If-None-Match`:
+    префикс `W/` игнорируется, `*` совпадает с любым ETag.
+
+    Args:
+        if_none_match (str | None): Значение заголовка `If-None-Match`.
+        etag (str): Текущий ETag ресурса.
+
+    Returns:
+        bool: True, если у клиента актуальная версия ресурса.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -0,0 +1,206 @@
+import asyncio
+import json
+from collections import defaultdict
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.app.config import settings
+from backend.app.logs.logger import logger
+
+# PostgreSQL отклоняет NOTIFY с полезной нагрузкой от 8000 байт, и ошибка
+# откатывает всю транзакцию записи. Берём порог с запасом.
+NOTIFY_MAX_BYTES = 7000
+
+
+class TaskEventBus:
+    """
+    Шина событий об изменении задач для подписок `/tasks/stream/`.
+
+    События публикуются use-case'ами внутри транзакции записи и доставляются
+    подписчикам только после успешного COMMIT. В режиме "local" события
+    остаются в процессе воркера. В режиме "postgres" публикация выполняется
+    через `pg_notify` в той же транзакции, а каждый воркер слушает канал
+    `LISTEN` на отдельном соединении, поэтому событие получают подписчики
+    всех воркеров.
+
+    У каждого подписчика ограниченная очередь: если клиент не успевает
+    читать, очередь очищается и ему отправляется событие `resync`, по
+    которому клиент заново загружает список задач. Событие, которое не
+    помещается в NOTIFY (например, пакетное изменение сотен задач),
+    тоже заменяется на `resync`.
+
+    Attributes:
+        backend (str): "local" или "postgres".
+        queue_size (int): Размер очереди одного подписчика.
+        channel (str): Канал LISTEN/NOTIFY.
+        published (int): Количество доставленных в шину событий.
+        dropped (int): Количество переполнений очередей подписчиков.
+        oversized (int): Количество событий, заменённых на `resync` из-за размера.
+    """
+
+    def __init__(self, backend: str, queue_size: int, channel: str = "task_events"):
+        """
+        Инициализация шины.
+
+        Args:
+            backend (str): "local" или "postgres".
+            queue_size (int): Размер очереди одного подписчика.
+            channel (str): Канал LISTEN/NOTIFY для режима "postgres".
+        """
+        self.backend = backend
+        self.queue_size = queue_size
+        self.channel = channel
+        self.published = 0
+        self.dropped = 0
+        self.oversized = 0
+        self._subscribers: dict[int, set[asyncio.Queue]] = defaultdict(set)
+        self._listener_task: asyncio.Task | None = None
+
+    async def publish(self, session: AsyncSession, user_id: int, payload: dict) -> None:
+        """
+        Публикует событие пользователя после COMMIT текущей транзакции.
+
+        В режиме "postgres" событие длиннее `NOTIFY_MAX_BYTES` отправляется
+        как `{"type": "resync"}`, чтобы размер события не мог сорвать запись.
+
+        Args:
+            session (AsyncSession): Сессия, в которой выполнена запись.
+            user_id (int): Идентификатор владельца задач.
+            payload (dict): Событие, например `{"type": "created", "task_ids": [1]}`.
+        """
+        if self.backend == "postgres":
+            message = json.dumps({"user_id": user_id, "event": payload})
+            if len(message) > NOTIFY_MAX_BYTES:
+                # json.dumps экранирует не-ASCII символы, поэтому длина строки равна длине в байтах.
+                self.oversized += 1
+                message = json.dumps({"user_id": user_id, "event": {"type": "resync"}})
+            await session.execute(select(func.pg_notify(self.channel, message)))
+        else:
+            session.info.setdefault("task_events", []).append((user_id, payload))
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """
+        Создаёт очередь событий пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            asyncio.Queue: Очередь событий; None в очереди означает остановку шины.
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        """
+        Удаляет очередь подписчика.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            queue (asyncio.Queue): Очередь, полученная от `subscribe`.
+        """
+        queues = self._subscribers.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    def dispatch(self, user_id: int, payload: dict) -> None:
+        """
+        Раскладывает событие по очередям подписчиков пользователя в этом воркере.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            payload (dict): Событие.
+        """
+        self.published += 1
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync"})
+
+    async def start(self) -> None:
+        """Запускает прослушивание канала LISTEN в режиме "postgres"."""
+        if self.backend == "postgres" and self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Останавливает прослушивание и завершает все подписки."""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        dsn = make_url(settings.pg_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+        def on_notify(connection, pid, channel, message):
+            try:
+                data = json.loads(message)
+                self.dispatch(data["user_id"], data["event"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Некорректное событие задач из канала {channel}: {e}")
+
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(self.channel, on_notify)
+                logger.info(f"Подписка на канал событий задач {self.channel}")
+                while not connection.is_closed():
+                    await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Соединение LISTEN для событий задач потеряно: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(1)
+
+    def stats(self) -> dict:
+        """Возвращает количество подписчиков и событий."""
+        return {
+            "backend": self.backend,
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self.published,
+            "dropped": self.dropped,
+            "oversized": self.oversized,
+        }
+
+
+task_events = TaskEventBus(
+    backend=settings.task_events_backend,
+    queue_size=settings.task_events_queue_size,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_task_events(session: Session) -> None:
+    """Доставляет события зафиксированной транзакции подписчикам."""
+    for user_id, payload in session.info.pop("task_events", ()):
+        task_events.dispatch(user_id, payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_task_events(session: Session) -> None:
+    """Отбрасывает события отменённой транзакции."""
+    session.info.pop("task_events", None)
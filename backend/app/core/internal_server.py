@@ -0,0 +1,155 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import orjson
+
+from backend.app.config import settings
+from backend.app.logs.logger import logger
+
+"""Служебный HTTP-сервер воркера для эндпоинтов мониторинга.
+
+Служебные эндпоинты (статистика пулов, метрики) раскрывают внутреннее
+состояние приложения и не публикуются на основном порту. Каждый воркер
+поднимает свой небольшой сервер и занимает первый свободный порт из
+диапазона `internal_port .. internal_port + server_workers - 1`, поэтому
+каждый воркер опрашивается отдельно, а не случайный воркер за общим
+портом. По умолчанию сервер слушает только 127.0.0.1.
+
+Поддерживаются только GET-запросы без тела; соединение закрывается после
+ответа."""
+
+REQUEST_TIMEOUT_SECONDS = 5
+
+Handler = Callable[[], Awaitable[dict | str]]
+
+
+class InternalServer:
+    """
+    HTTP-сервер служебных эндпоинтов на отдельном порту воркера.
+
+    Обработчики регистрируются декоратором `get`. Обработчик без аргументов
+    возвращает dict (ответ в JSON) или str (ответ с заданным `media_type`).
+
+    Attributes:
+        host (str): Адрес для прослушивания.
+        port (int | None): Первый порт диапазона; None — сервер не запускается.
+        slots (int): Размер диапазона портов (число воркеров).
+        bound_port (int | None): Порт, который занял этот воркер.
+    """
+
+    def __init__(self, host: str, port: int | None, slots: int):
+        """
+        Инициализация сервера. Порт занимается при вызове `start`.
+
+        Args:
+            host (str): Адрес для прослушивания.
+            port (int | None): Первый порт диапазона; None — сервер не запускается.
+            slots (int): Размер диапазона портов (число воркеров).
+        """
+        self.host = host
+        self.port = port
+        self.slots = max(slots, 1)
+        self.bound_port: int | None = None
+        self._routes: dict[str, tuple[Handler, str]] = {}
+        self._server: asyncio.Server | None = None
+
+    def get(self, path: str, media_type: str = "application/json"):
+        """
+        Регистрирует обработчик GET-запросов по пути.
+
+        Args:
+            path (str): Путь эндпоинта, например "/metrics".
+            media_type (str): Content-Type строкового ответа.
+
+        Returns:
+            Декоратор, возвращающий обработчик без изменений.
+        """
+        def decorator(handler: Handler) -> Handler:
+            self._routes[path] = (handler, media_type)
+            return handler
+        return decorator
+
+    async def start(self) -> int | None:
+        """
+        Занимает первый свободный порт диапазона и начинает принимать запросы.
+
+        Returns:
+            int | None: Занятый порт или None, если сервер выключен
+                или все порты диапазона заняты.
+        """
+        if self.port is None:
+            return None
+        for port in range(self.port, self.port + self.slots):
+            try:
+                self._server = await asyncio.start_server(self._handle, self.host, port)
+            except OSError:
+                continue
+            self.bound_port = port
+            logger.info(f"Служебные эндпоинты воркера доступны на {self.host}:{port}")
+            return port
+        logger.warning(
+            f"Служебные эндпоинты недоступны: порты {self.port}-{self.port + self.slots - 1} заняты"
+        )
+        return None
+
+    async def stop(self) -> None:
+        """Перестаёт принимать запросы и освобождает порт."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            self.bound_port = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            async with asyncio.timeout(REQUEST_TIMEOUT_SECONDS):
+                request_line = await reader.readline()
+                # Заголовки не используются, но их нужно дочитать до пустой строки.
+                while await reader.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        except (TimeoutError, ValueError, ConnectionError):
+            writer.close()
+            return
+
+        route = self._routes.get(target.split("?", 1)[0])
+        if method != "GET":
+            response = _response("405 Method Not Allowed", b"", "text/plain")
+        elif route is None:
+            response = _response("404 Not Found", b"", "text/plain")
+        else:
+            handler, media_type = route
+            try:
+                result = await handler()
+            except Exception as e:
+                logger.exception(f"Ошибка служебного эндпоинта {target}: {e}")
+                response = _response("500 Internal Server Error", b"", "text/plain")
+            else:
+                if isinstance(result, str):
+                    response = _response("200 OK", result.encode(), media_type)
+                else:
+                    response = _response("200 OK", orjson.dumps(result), "application/json")
+        try:
+            writer.write(response)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _response(status: str, body: bytes, media_type: str) -> bytes:
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {media_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+internal_server = InternalServer(
+    host=settings.internal_host,
+    port=settings.internal_port,
+    slots=settings.server_workers or 1,
+)
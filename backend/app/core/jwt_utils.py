@@ -1,11 +1,21 @@
+import hashlib
+import time
 from datetime import datetime, timezone, timedelta
+
+import jwt
+
 from backend.app.config import settings
-from jose import jwt
+from backend.app.core.cache import TTLCache
+from backend.app.core.key_manager import key_manager
+from backend.app.core.metrics import jwt_decode_seconds
+
+verified_tokens = TTLCache(maxsize=settings.jwt_token_cache_size)
+key_manager.on_reload(verified_tokens.clear)
 
 
 def encode_jwt(
         payload: dict,
-        algorithm=settings.algorithm,
+        algorithm: str | None = None,
         expire_minutes: int = settings.access_token_expire_minutes,
         expire_timedelta: timedelta | None = None,
 ) -> str:
@@ -24,16 +34,21 @@ def encode_jwt(
 
     Args:
         payload (dict): Данные (claims), которые будут включены в токен.
-        private_key (str): Приватный ключ для подписи токена.
-        algorithm (str): Алгоритм подписи JWT.
+        algorithm (str | None): Ожидаемый алгоритм подписи JWT. По умолчанию
+            используется алгоритм текущего ключа.
         expire_minutes (int): Время жизни токена в минутах.
         expire_timedelta (timedelta | None): Пользовательский интервал
             времени жизни токена. Если указан, `expire_minutes` игнорируется.
 
     Returns:
         str: Сформированный JWT-токен.
+
+    Raises:
+        ValueError: Если `algorithm` не совпадает с алгоритмом текущего ключа.
     """
-    private_key = settings.private_key_path.read_text()
+    key = key_manager.signing_key
+    if algorithm is not None and algorithm != key.algorithm:
+        raise ValueError(f"Текущий ключ JWT подписывает {key.algorithm}, а не {algorithm}")
 
     to_encode = payload.copy()
     now = datetime.now(timezone.utc)
@@ -50,35 +65,64 @@ def encode_jwt(
 
     encoded = jwt.encode(
         to_encode,
-        private_key,
-        algorithm=algorithm,
+        key.private_key,
+        algorithm=key.algorithm,
+        headers={"kid": key.kid},
     )
     return encoded
 
 
 def decode_jwt(
         token: str | bytes,
-        algorithm=settings.algorithm,
+        algorithm: str | None = None,
 ) -> dict:
     """
     Декодирует и валидирует JWT-токен.
 
-    Проверяет подпись токена и извлекает payload с использованием
-    публичного ключа и указанного алгоритма. Также автоматически
+    Ключ для проверки подписи выбирается по `kid` из заголовка токена
+    среди текущего и выведенных из подписи ключей, поэтому после ротации
+    ранее выданные токены остаются валидными. Токены без `kid` (выданные
+    до появления набора ключей) проверяются текущим ключом. Алгоритм
+    берётся из ключа, а не из заголовка токена. Также автоматически
     проверяются стандартные JWT-поля.
 
+    Уже проверенные токены кэшируются по SHA-256 дайджесту до момента
+    их истечения (`exp`), поэтому повторные запросы с тем же токеном
+    не выполняют проверку подписи заново.
+
     Args:
         token (str | bytes): JWT-токен для декодирования.
-        public_key (str): Публичный ключ для проверки подписи токена.
-        algorithm (str): Алгоритм проверки подписи JWT.
+        algorithm (str | None): Если указан, принимаются только токены,
+            подписанные этим алгоритмом.
 
     Returns:
         dict: Декодированное содержимое JWT (payload).
+
+    Raises:
+        jwt.InvalidTokenError: Токен невалиден, истёк или подписан неизвестным ключом.
     """
-    public_key = settings.public_key_path.read_text()
+    started = time.perf_counter()
+    if isinstance(token, str):
+        token = token.encode()
+    cache_key = (algorithm, hashlib.sha256(token).digest())
+    cached = verified_tokens.get(cache_key)
+    if cached is not None:
+        jwt_decode_seconds.observe(time.perf_counter() - started, "true")
+        return dict(cached)
+
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = key_manager.signing_key if kid is None else key_manager.get(kid)
+    if key is None:
+        raise jwt.InvalidTokenError(f"Неизвестный ключ JWT: {kid}")
+    if algorithm is not None and algorithm != key.algorithm:
+        raise jwt.InvalidAlgorithmError(f"Ожидался алгоритм {algorithm}, ключ подписывает {key.algorithm}")
     decoded = jwt.decode(
         token,
-        public_key,
-        algorithms=[algorithm],
+        key.public_key,
+        algorithms=[key.algorithm],
     )
+    exp = decoded.get("exp")
+    if isinstance(exp, (int, float)):
+        verified_tokens.set(cache_key, dict(decoded), expires_at=exp)
+    jwt_decode_seconds.observe(time.perf_counter() - started, "false")
     return decoded
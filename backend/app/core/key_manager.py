@@ -0,0 +1,322 @@
+import base64
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from backend.app.config import settings
+from backend.app.logs.logger import logger
+
+ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
+
+def algorithm_for(key) -> str:
+    """
+    Определяет алгоритм JWT по типу ключа.
+
+    Args:
+        key: Приватный или публичный ключ `cryptography`.
+
+    Returns:
+        str: "RS256", "ES256" или "EdDSA".
+
+    Raises:
+        ValueError: Если тип ключа не поддерживается.
+    """
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return "RS256"
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        if isinstance(key.curve, ec.SECP256R1):
+            return "ES256"
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    raise ValueError(f"Неподдерживаемый тип ключа JWT: {type(key).__name__}")
+
+
+def key_id(public_key) -> str:
+    """
+    Вычисляет идентификатор ключа (`kid`) по публичному ключу.
+
+    Идентификатор — первые 16 символов base64url от SHA-256 ключа в DER,
+    поэтому он одинаков во всех воркерах и не требует отдельного хранения.
+    """
+    der = public_key.public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return base64.urlsafe_b64encode(hashlib.sha256(der).digest()).decode()[:16]
+
+
+def generate_private_key(algorithm: str):
+    """
+    Генерирует приватный ключ для алгоритма JWT.
+
+    Args:
+        algorithm (str): "RS256" (RSA 2048), "ES256" (P-256) или "EdDSA" (Ed25519).
+
+    Returns:
+        Приватный ключ `cryptography`.
+    """
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Неподдерживаемый алгоритм JWT: {algorithm}")
+
+
+def _public_pem(public_key) -> bytes:
+    return public_key.public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+
+def _write_atomic(path: Path, data: bytes, mode: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+@dataclass(frozen=True)
+class JwtKey:
+    """
+    Разобранный ключ JWT.
+
+    Attributes:
+        kid (str): Идентификатор ключа, передаётся в заголовке токена.
+        algorithm (str): Алгоритм подписи, определённый по типу ключа.
+        public_key: Публичный ключ для проверки подписи.
+        private_key: Приватный ключ для подписи (только у текущего ключа).
+    """
+
+    kid: str
+    algorithm: str
+    public_key: object
+    private_key: object | None = None
+
+
+class KeyManager:
+    """
+    Хранит набор ключей JWT в памяти и перечитывает его при изменении файлов.
+
+    Токены подписываются текущим ключом (`private_key_path`), в заголовок
+    токена записывается его `kid`. Для проверки, кроме текущего, доступны
+    публичные ключи из `previous_keys_dir` — ключи, которые были текущими
+    до ротации. Поэтому после ротации ранее выданные токены остаются
+    валидными до истечения.
+
+    PEM-файлы читаются и разбираются один раз, а не на каждый запрос.
+    Не чаще одного раза в `reload_interval` секунд проверяется время
+    модификации файлов; если оно изменилось, ключи загружаются заново.
+
+    Attributes:
+        private_key_path (Path): Путь к текущему приватному ключу.
+        public_key_path (Path): Путь к публичному ключу текущего ключа.
+        previous_keys_dir (Path): Каталог публичных ключей, выведенных из подписи.
+        reload_interval (float): Интервал проверки файлов ключей в секундах.
+    """
+
+    def __init__(
+            self,
+            private_key_path: Path,
+            public_key_path: Path,
+            previous_keys_dir: Path,
+            reload_interval: float,
+    ):
+        """
+        Инициализация менеджера ключей. Ключи загружаются лениво или через `load`.
+
+        Args:
+            private_key_path (Path): Путь к текущему приватному ключу.
+            public_key_path (Path): Путь к публичному ключу текущего ключа.
+            previous_keys_dir (Path): Каталог публичных ключей, выведенных из подписи.
+            reload_interval (float): Интервал проверки файлов ключей в секундах.
+        """
+        self.private_key_path = private_key_path
+        self.public_key_path = public_key_path
+        self.previous_keys_dir = previous_keys_dir
+        self.reload_interval = reload_interval
+        self._signing_key: JwtKey | None = None
+        self._keys: dict[str, JwtKey] = {}
+        self._mtimes: tuple | None = None
+        self._checked_at = 0.0
+        self._on_reload = []
+        self._lock = Lock()
+
+    def on_reload(self, callback) -> None:
+        """
+        Регистрирует функцию, вызываемую после перезагрузки ключей.
+
+        Args:
+            callback: Функция без аргументов.
+        """
+        self._on_reload.append(callback)
+
+    def load(self) -> None:
+        """Читает и разбирает PEM-файлы ключей."""
+        with self._lock:
+            self._load()
+
+    def _load(self) -> None:
+        mtimes = self._stat()
+        private_key = serialization.load_pem_private_key(self.private_key_path.read_bytes(), password=None)
+        public_key = private_key.public_key()
+        signing_key = JwtKey(key_id(public_key), algorithm_for(private_key), public_key, private_key)
+
+        keys = {}
+        for path in sorted(self.previous_keys_dir.glob("*.pem")) if self.previous_keys_dir.is_dir() else ():
+            try:
+                previous = serialization.load_pem_public_key(path.read_bytes())
+                keys[key_id(previous)] = JwtKey(key_id(previous), algorithm_for(previous), previous)
+            except ValueError as e:
+                logger.warning(f"Пропущен ключ JWT {path.name}: {e}")
+        keys[signing_key.kid] = signing_key
+
+        reloaded = self._mtimes is not None
+        self._signing_key = signing_key
+        self._keys = keys
+        self._mtimes = mtimes
+        self._checked_at = time.monotonic()
+        if reloaded:
+            logger.info(f"Ключи JWT изменились на диске и были перезагружены, текущий kid={signing_key.kid}")
+            for callback in self._on_reload:
+                callback()
+
+    def _stat(self) -> tuple:
+        previous = ()
+        if self.previous_keys_dir.is_dir():
+            previous = tuple(sorted((p.name, p.stat().st_mtime) for p in self.previous_keys_dir.glob("*.pem")))
+        return self.private_key_path.stat().st_mtime, previous
+
+    def _ensure_fresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if self._mtimes is not None and not force and now - self._checked_at < self.reload_interval:
+            return
+        with self._lock:
+            if self._mtimes is None:
+                self._load()
+                return
+            if not force and now - self._checked_at < self.reload_interval:
+                return
+            self._checked_at = now
+            try:
+                changed = self._stat() != self._mtimes
+            except OSError as e:
+                logger.warning(f"Не удалось проверить файлы ключей JWT: {e}")
+                return
+            if changed:
+                self._load()
+
+    @property
+    def signing_key(self) -> JwtKey:
+        """Текущий ключ для подписи токенов."""
+        self._ensure_fresh()
+        return self._signing_key
+
+    def get(self, kid: str) -> JwtKey | None:
+        """
+        Возвращает ключ для проверки подписи по `kid`.
+
+        Если ключ не найден, файлы проверяются сразу, не дожидаясь
+        `reload_interval`: токен мог подписать воркер, который уже
+        увидел ротацию ключей.
+
+        Args:
+            kid (str): Идентификатор ключа из заголовка токена.
+
+        Returns:
+            JwtKey | None: Ключ или None, если такого ключа нет.
+        """
+        self._ensure_fresh()
+        key = self._keys.get(kid)
+        if key is None:
+            self._ensure_fresh(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    def generate_if_missing(self, algorithm: str) -> bool:
+        """
+        Генерирует ключ подписи, если его нет.
+
+        Ключ создаётся в процессе через `cryptography`, файлы записываются
+        во временные и переименовываются, чтобы другой процесс не прочитал
+        недописанный ключ.
+
+        Args:
+            algorithm (str): Алгоритм нового ключа.
+
+        Returns:
+            bool: True, если ключ был сгенерирован.
+        """
+        if self.private_key_path.exists() and self.public_key_path.exists():
+            return False
+        print("Ключи JWT не найдены → генерируем новые...")
+        self._write_signing_key(generate_private_key(algorithm))
+        print(f"Ключи {algorithm} сгенерированы:\n  {self.private_key_path}\n  {self.public_key_path}")
+        return True
+
+    def rotate(self, algorithm: str, retention_seconds: float) -> str:
+        """
+        Заменяет ключ подписи новым, сохраняя старый для проверки токенов.
+
+        Публичный ключ текущего ключа переносится в `previous_keys_dir`.
+        Ключи, выведенные из подписи раньше чем `retention_seconds` назад,
+        удаляются: выданные ими токены уже истекли. Воркеры подхватывают
+        новый ключ в течение `reload_interval`.
+
+        Args:
+            algorithm (str): Алгоритм нового ключа.
+            retention_seconds (float): Сколько хранить выведенные ключи.
+
+        Returns:
+            str: `kid` нового ключа.
+        """
+        if self.private_key_path.exists():
+            current = serialization.load_pem_private_key(self.private_key_path.read_bytes(), password=None)
+            public_key = current.public_key()
+            _write_atomic(self.previous_keys_dir / f"{key_id(public_key)}.pem", _public_pem(public_key), 0o644)
+
+        if self.previous_keys_dir.is_dir():
+            expired_before = time.time() - retention_seconds
+            for path in self.previous_keys_dir.glob("*.pem"):
+                if path.stat().st_mtime < expired_before:
+                    path.unlink()
+
+        private_key = generate_private_key(algorithm)
+        self._write_signing_key(private_key)
+        return key_id(private_key.public_key())
+
+    def _write_signing_key(self, private_key) -> None:
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        _write_atomic(self.public_key_path, _public_pem(private_key.public_key()), 0o644)
+        _write_atomic(self.private_key_path, private_pem, 0o600)
+
+    def stats(self) -> dict:
+        """Возвращает `kid` и алгоритм текущего ключа и `kid` ключей для проверки."""
+        signing_key = self.signing_key
+        return {
+            "kid": signing_key.kid,
+            "algorithm": signing_key.algorithm,
+            "verification_kids": sorted(self._keys),
+        }
+
+
+key_manager = KeyManager(
+    private_key_path=settings.private_key_path,
+    public_key_path=settings.public_key_path,
+    previous_keys_dir=settings.jwt_previous_keys_dir,
+    reload_interval=settings.jwt_key_reload_interval,
+)
@@ -0,0 +1,416 @@
+import math
+import time
+from dataclasses import dataclass
+
+from backend.app.config import settings
+from backend.app.core.cache import TTLCache
+from backend.app.logs.logger import logger
+
+
+class LoginRateLimitedError(Exception):
+    """
+    Попытка входа отклонена ограничителем до обращения к БД и bcrypt.
+
+    Attributes:
+        retry_after (float): Через сколько секунд можно повторить попытку.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__("Слишком много попыток входа")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class BucketRule:
+    """
+    Параметры token bucket и блокировки для одного вида ключа.
+
+    Attributes:
+        capacity (float): Максимальное число попыток подряд.
+        refill_per_second (float): Скорость восстановления попыток.
+        lockout_threshold (int): Число неудач подряд, после которого ключ блокируется.
+    """
+
+    capacity: float
+    refill_per_second: float
+    lockout_threshold: int
+
+
+@dataclass
+class _KeyState:
+    tokens: float
+    updated_at: float
+    failures: int = 0
+    failed_at: float = 0.0
+    locked_until: float = 0.0
+
+
+class LoginRateLimiter:
+    """
+    Базовый ограничитель попыток входа: пропускает всё.
+
+    Используется при `login_limiter_backend="none"`. Наследники ведут
+    token bucket по IP-адресу и по имени пользователя и блокируют ключ
+    на экспоненциально растущее время после серии неудачных попыток.
+    Проверка выполняется до поиска пользователя и bcrypt, поэтому
+    отклонённая попытка почти ничего не стоит.
+
+    Attributes:
+        allowed (int): Количество пропущенных попыток.
+        rejected (int): Количество отклонённых попыток.
+        lockouts (int): Количество наложенных блокировок.
+    """
+
+    backend = "none"
+
+    def __init__(self):
+        self.allowed = 0
+        self.rejected = 0
+        self.lockouts = 0
+
+    @staticmethod
+    def _keys(ip: str | None, username: str) -> tuple[str, str]:
+        return f"ip:{ip or 'unknown'}", f"user:{username.strip().lower()[:128]}"
+
+    async def check(self, ip: str | None, username: str) -> None:
+        """
+        Расходует попытку входа для IP-адреса и имени пользователя.
+
+        Args:
+            ip (str | None): IP-адрес клиента.
+            username (str): Имя пользователя из формы входа.
+
+        Raises:
+            LoginRateLimitedError: Если ключ заблокирован или попытки исчерпаны.
+        """
+        retry_after = await self._take(*self._keys(ip, username))
+        if retry_after > 0:
+            self.rejected += 1
+            raise LoginRateLimitedError(retry_after)
+        self.allowed += 1
+
+    async def record_failure(self, ip: str | None, username: str) -> None:
+        """
+        Учитывает неудачную попытку входа и при необходимости блокирует ключи.
+
+        Args:
+            ip (str | None): IP-адрес клиента.
+            username (str): Имя пользователя из формы входа.
+        """
+        self.lockouts += await self._fail(*self._keys(ip, username))
+
+    async def record_success(self, ip: str | None, username: str) -> None:
+        """
+        Сбрасывает счётчик неудач пользователя после успешного входа.
+
+        Счётчик IP-адреса не сбрасывается, чтобы вход в свою учётную
+        запись не обнулял перебор чужих с того же адреса.
+
+        Args:
+            ip (str | None): IP-адрес клиента.
+            username (str): Имя пользователя из формы входа.
+        """
+        await self._reset(self._keys(ip, username)[1])
+
+    async def _take(self, ip_key: str, user_key: str) -> float:
+        return 0.0
+
+    async def _fail(self, ip_key: str, user_key: str) -> int:
+        return 0
+
+    async def _reset(self, user_key: str) -> None:
+        pass
+
+    def stats(self) -> dict:
+        """Возвращает счётчики пропущенных и отклонённых попыток."""
+        return {
+            "backend": self.backend,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "lockouts": self.lockouts,
+        }
+
+
+class LockoutPolicy:
+    """
+    Правила ограничения, общие для всех хранилищ.
+
+    Attributes:
+        ip_rule (BucketRule): Token bucket для IP-адреса.
+        user_rule (BucketRule): Token bucket для имени пользователя.
+        base_seconds (float): Длительность первой блокировки.
+        max_seconds (float): Максимальная длительность блокировки.
+        window_seconds (float): Через сколько секунд без неудач счётчик сбрасывается.
+    """
+
+    def __init__(
+            self,
+            ip_rule: BucketRule,
+            user_rule: BucketRule,
+            base_seconds: float,
+            max_seconds: float,
+            window_seconds: float,
+    ):
+        self.ip_rule = ip_rule
+        self.user_rule = user_rule
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self.window_seconds = window_seconds
+
+    def lockout_seconds(self, failures: int, rule: BucketRule) -> float:
+        """
+        Возвращает длительность блокировки после `failures` неудач подряд.
+
+        Первая блокировка длится `base_seconds`, каждая следующая — вдвое
+        дольше, но не более `max_seconds`.
+        """
+        if failures < rule.lockout_threshold:
+            return 0.0
+        return min(self.base_seconds * 2 ** min(failures - rule.lockout_threshold, 32), self.max_seconds)
+
+
+class InMemoryLoginRateLimiter(LoginRateLimiter):
+    """
+    Ограничитель попыток входа в памяти воркера.
+
+    Состояние ключей хранится в LRU-кэше ограниченного размера; при
+    нескольких воркерах лимиты действуют в каждом отдельно.
+    """
+
+    backend = "memory"
+
+    def __init__(self, policy: LockoutPolicy, max_keys: int):
+        """
+        Инициализация ограничителя.
+
+        Args:
+            policy (LockoutPolicy): Правила ограничения.
+            max_keys (int): Максимальное число отслеживаемых ключей.
+        """
+        super().__init__()
+        self.policy = policy
+        self._states = TTLCache(maxsize=max_keys)
+
+    def _state(self, key: str, rule: BucketRule, now: float) -> _KeyState:
+        state = self._states.get(key)
+        if state is None:
+            return _KeyState(tokens=rule.capacity, updated_at=now)
+        state.tokens = min(rule.capacity, state.tokens + (now - state.updated_at) * rule.refill_per_second)
+        state.updated_at = now
+        return state
+
+    def _save(self, key: str, state: _KeyState, rule: BucketRule, now: float) -> None:
+        refill = (rule.capacity - state.tokens) / rule.refill_per_second
+        expires_at = max(now + refill, state.failed_at + self.policy.window_seconds, state.locked_until)
+        self._states.set(key, state, expires_at=max(expires_at, now + 1))
+
+    async def _take(self, ip_key: str, user_key: str) -> float:
+        now = time.time()
+        items = [(ip_key, self.policy.ip_rule), (user_key, self.policy.user_rule)]
+        states = [self._state(key, rule, now) for key, rule in items]
+        retry_after = 0.0
+        for state, (_, rule) in zip(states, items):
+            if state.locked_until > now:
+                retry_after = max(retry_after, state.locked_until - now)
+            elif state.tokens < 1:
+                retry_after = max(retry_after, (1 - state.tokens) / rule.refill_per_second)
+        for state, (key, rule) in zip(states, items):
+            if not retry_after:
+                state.tokens -= 1
+            self._save(key, state, rule, now)
+        return retry_after
+
+    async def _fail(self, ip_key: str, user_key: str) -> int:
+        now = time.time()
+        lockouts = 0
+        for key, rule in ((ip_key, self.policy.ip_rule), (user_key, self.policy.user_rule)):
+            state = self._state(key, rule, now)
+            if now - state.failed_at > self.policy.window_seconds:
+                state.failures = 0
+            state.failures += 1
+            state.failed_at = now
+            lockout = self.policy.lockout_seconds(state.failures, rule)
+            if lockout:
+                state.locked_until = now + lockout
+                lockouts += 1
+                logger.warning(f"Вход для {key} заблокирован на {lockout:.0f} с после {state.failures} неудач")
+            self._save(key, state, rule, now)
+        return lockouts
+
+    async def _reset(self, user_key: str) -> None:
+        state = self._states.get(user_key)
+        if state is not None:
+            state.failures = 0
+            state.locked_until = 0.0
+
+    def stats(self) -> dict:
+        return {**super().stats(), "keys": len(self._states)}
+
+
+_TAKE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retry = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local data = redis.call('HMGET', key, 'tokens', 'ts', 'locked_until')
+    local available = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    local locked_until = tonumber(data[3]) or 0
+    available = math.min(capacity, available + (now - ts) * rate)
+    if locked_until > now then
+        retry = math.max(retry, locked_until - now)
+    elseif available < 1 then
+        retry = math.max(retry, (1 - available) / rate)
+    end
+    tokens[i] = available
+end
+for i, key in ipairs(KEYS) do
+    if retry == 0 then
+        tokens[i] = tokens[i] - 1
+    end
+    redis.call('HSET', key, 'tokens', tostring(tokens[i]), 'ts', tostring(now))
+    if redis.call('TTL', key) < tonumber(ARGV[6]) then
+        redis.call('EXPIRE', key, ARGV[6])
+    end
+end
+return tostring(retry)
+"""
+
+_FAIL_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local base = tonumber(ARGV[3])
+local max_lockout = tonumber(ARGV[4])
+local lockouts = 0
+for i, key in ipairs(KEYS) do
+    local threshold = tonumber(ARGV[4 + i])
+    local data = redis.call('HMGET', key, 'failures', 'failed_at')
+    local failures = tonumber(data[1]) or 0
+    local failed_at = tonumber(data[2]) or 0
+    if now - failed_at > window then
+        failures = 0
+    end
+    failures = failures + 1
+    redis.call('HSET', key, 'failures', failures, 'failed_at', tostring(now))
+    local ttl = window
+    if failures >= threshold then
+        local lockout = math.min(base * 2 ^ math.min(failures - threshold, 32), max_lockout)
+        redis.call('HSET', key, 'locked_until', tostring(now + lockout))
+        ttl = math.max(ttl, lockout)
+        lockouts = lockouts + 1
+    end
+    if redis.call('TTL', key) < ttl then
+        redis.call('EXPIRE', key, math.ceil(ttl))
+    end
+end
+return lockouts
+"""
+
+
+class RedisLoginRateLimiter(LoginRateLimiter):
+    """
+    Ограничитель попыток входа в Redis, общий для всех воркеров.
+
+    Состояние ключа хранится в хеше `login:<ключ>` и изменяется
+    Lua-скриптами атомарно. Подходит любой клиент с асинхронными методами
+    `eval` и `hdel` (например, `redis.asyncio.Redis` или `fakeredis`
+    для локального запуска). При недоступности Redis попытки пропускаются,
+    чтобы сбой хранилища не закрывал вход всем пользователям.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client, policy: LockoutPolicy):
+        """
+        Инициализация ограничителя.
+
+        Args:
+            client: Асинхронный Redis-совместимый клиент.
+            policy (LockoutPolicy): Правила ограничения.
+        """
+        super().__init__()
+        self.client = client
+        self.policy = policy
+        rules = (policy.ip_rule, policy.user_rule)
+        self._bucket_ttl = max(math.ceil(rule.capacity / rule.refill_per_second) for rule in rules)
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return f"login:{key}"
+
+    async def _take(self, ip_key: str, user_key: str) -> float:
+        policy = self.policy
+        try:
+            retry_after = await self.client.eval(
+                _TAKE_SCRIPT, 2, self._name(ip_key), self._name(user_key),
+                time.time(),
+                policy.ip_rule.capacity, policy.ip_rule.refill_per_second,
+                policy.user_rule.capacity, policy.user_rule.refill_per_second,
+                max(self._bucket_ttl, 1),
+            )
+        except Exception as e:
+            logger.warning(f"Ошибка ограничителя входа в Redis: {e}")
+            return 0.0
+        return float(retry_after)
+
+    async def _fail(self, ip_key: str, user_key: str) -> int:
+        policy = self.policy
+        try:
+            lockouts = await self.client.eval(
+                _FAIL_SCRIPT, 2, self._name(ip_key), self._name(user_key),
+                time.time(), policy.window_seconds, policy.base_seconds, policy.max_seconds,
+                policy.ip_rule.lockout_threshold, policy.user_rule.lockout_threshold,
+            )
+        except Exception as e:
+            logger.warning(f"Ошибка ограничителя входа в Redis: {e}")
+            return 0
+        return int(lockouts)
+
+    async def _reset(self, user_key: str) -> None:
+        try:
+            await self.client.hdel(self._name(user_key), "failures", "failed_at", "locked_until")
+        except Exception as e:
+            logger.warning(f"Ошибка ограничителя входа в Redis: {e}")
+
+
+def create_login_limiter() -> LoginRateLimiter:
+    """
+    Создаёт ограничитель попыток входа согласно `settings.login_limiter_backend`.
+
+    Returns:
+        LoginRateLimiter: Экземпляр ограничителя выбранного типа.
+
+    Raises:
+        RuntimeError: Если выбран Redis, но пакет `redis` не установлен или не задан `redis_url`.
+    """
+    policy = LockoutPolicy(
+        ip_rule=BucketRule(
+            settings.login_ip_burst,
+            settings.login_ip_per_minute / 60,
+            settings.login_ip_lockout_threshold,
+        ),
+        user_rule=BucketRule(
+            settings.login_user_burst,
+            settings.login_user_per_minute / 60,
+            settings.login_user_lockout_threshold,
+        ),
+        base_seconds=settings.login_lockout_base_seconds,
+        max_seconds=settings.login_lockout_max_seconds,
+        window_seconds=settings.login_failure_window_seconds,
+    )
+    if settings.login_limiter_backend == "memory":
+        return InMemoryLoginRateLimiter(policy, max_keys=settings.login_limiter_max_keys)
+    if settings.login_limiter_backend == "redis":
+        if not settings.redis_url:
+            raise RuntimeError("Для login_limiter_backend=redis нужно задать REDIS_URL")
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("Для login_limiter_backend=redis установите пакет redis") from e
+        return RedisLoginRateLimiter(client=Redis.from_url(settings.redis_url), policy=policy)
+    return LoginRateLimiter()
+
+
+login_limiter = create_login_limiter()
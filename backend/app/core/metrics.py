@@ -0,0 +1,255 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Гистограмма с фиксированными границами корзин.
+
+    Наблюдение стоит одного двоичного поиска и трёх сложений; накопленные
+    значения `_bucket` считаются только при выводе метрик.
+
+    Attributes:
+        name (str): Имя метрики.
+        help (str): Описание метрики.
+        buckets (tuple[float, ...]): Верхние границы корзин по возрастанию.
+        labelnames (tuple[str, ...]): Имена меток.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            help: str,
+            labelnames: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labels) -> None:
+        """
+        Добавляет наблюдение.
+
+        Args:
+            value (float): Наблюдаемое значение (для времени — в секундах).
+            *labels: Значения меток в порядке `labelnames`.
+        """
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def samples(self):
+        for labels, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                yield (
+                    f"{self.name}_bucket",
+                    _format_labels(self.labelnames, labels, f'le="{_format_value(float(bound))}"'),
+                    cumulative,
+                )
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labels), total
+            yield f"{self.name}_count", _format_labels(self.labelnames, labels), count
+
+
+class CallbackGauge:
+    """
+    Метрика, значения которой читаются функцией в момент вывода.
+
+    Attributes:
+        name (str): Имя метрики.
+        help (str): Описание метрики.
+        func: Функция, возвращающая число или словарь {значения меток: число}.
+        labelnames (tuple[str, ...]): Имена меток.
+        kind (str): Тип метрики Prometheus: "gauge" или "counter".
+    """
+
+    def __init__(
+            self,
+            name: str,
+            help: str,
+            func: Callable,
+            labelnames: tuple[str, ...] = (),
+            kind: str = "gauge",
+    ):
+        self.name = name
+        self.help = help
+        self.func = func
+        self.labelnames = labelnames
+        self.kind = kind
+
+    def samples(self):
+        value = self.func()
+        if isinstance(value, dict):
+            for labels, item in value.items():
+                yield self.name, _format_labels(self.labelnames, labels), item
+        else:
+            yield self.name, "", value
+
+
+class MetricsRegistry:
+    """Набор метрик процесса с выводом в текстовом формате Prometheus."""
+
+    def __init__(self):
+        self._metrics: dict[str, Histogram | CallbackGauge] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Метрика {metric.name} уже зарегистрирована")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def histogram(
+            self,
+            name: str,
+            help: str,
+            labelnames: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Регистрирует гистограмму."""
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def callback(
+            self,
+            name: str,
+            help: str,
+            func: Callable,
+            labelnames: tuple[str, ...] = (),
+            kind: str = "gauge",
+    ) -> CallbackGauge:
+        """Регистрирует метрику, значение которой вычисляется при выводе."""
+        return self._register(CallbackGauge(name, help, func, labelnames, kind))
+
+    def render(self) -> str:
+        """
+        Формирует текст для `/metrics`.
+
+        Returns:
+            str: Метрики в текстовом формате Prometheus 0.0.4.
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_request_seconds = metrics.histogram(
+    "http_request_duration_seconds", "Время обработки HTTP-запроса", ("method", "route", "status")
+)
+http_request_db_queries = metrics.histogram(
+    "http_request_db_queries", "Количество SQL-запросов за HTTP-запрос", ("route",), COUNT_BUCKETS
+)
+http_request_db_seconds = metrics.histogram(
+    "http_request_db_seconds", "Суммарное время SQL-запросов за HTTP-запрос", ("route",)
+)
+db_query_seconds = metrics.histogram("db_query_duration_seconds", "Время выполнения одного SQL-запроса")
+db_pool_wait_seconds = metrics.histogram("db_pool_wait_seconds", "Время ожидания соединения из пула")
+jwt_decode_seconds = metrics.histogram("jwt_decode_seconds", "Время проверки JWT", ("cached",))
+password_hash_seconds = metrics.histogram(
+    "password_hash_seconds", "Время работы bcrypt в воркере", ("operation",)
+)
+
+
+@dataclass
+class RequestDbStats:
+    """Счётчики SQL-запросов текущего HTTP-запроса."""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+
+request_db_stats: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._metrics_started
+    db_query_seconds.observe(elapsed)
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware, замеряющее время запросов и SQL-запросы по маршрутам.
+
+    Маршрут берётся из шаблона пути (`/tasks/update/{task_id}`), а не из
+    фактического URL, чтобы число рядов метрик не росло с числом задач.
+    Для потоковых ответов время считается до окончания отправки тела.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDbStats()
+        token = request_db_stats.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_db_stats.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            http_request_seconds.observe(elapsed, scope["method"], path, status_code)
+            http_request_db_queries.observe(stats.queries, path)
+            http_request_db_seconds.observe(stats.seconds, path)
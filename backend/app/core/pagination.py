@@ -0,0 +1,39 @@
+import base64
+import binascii
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """
+    Кодирует позицию последней задачи страницы в непрозрачный курсор.
+
+    Args:
+        created_at (datetime): Время создания последней задачи страницы.
+        task_id (int): ID последней задачи страницы.
+
+    Returns:
+        str: Курсор в формате base64url.
+    """
+    raw = f"{created_at.isoformat()}|{task_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Декодирует курсор, полученный от `encode_cursor`.
+
+    Args:
+        cursor (str): Курсор в формате base64url.
+
+    Returns:
+        tuple[datetime, int]: Время создания и ID задачи, после которой начинается страница.
+
+    Raises:
+        ValueError: Если курсор повреждён.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, task_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Некорректный курсор") from e
@@ -0,0 +1,150 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from backend.app.config import settings
+from backend.app.core.metrics import password_hash_seconds
+from backend.app.core.password_utils import hash_password, validate_password
+
+
+class PasswordHasherOverloadedError(Exception):
+    """Очередь на хеширование паролей переполнена, запрос отклонён."""
+
+
+def _timed_call(func, *args):
+    """Выполняет функцию в воркере и возвращает результат вместе со временем выполнения."""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordHashingService:
+    """
+    Асинхронный сервис хеширования и проверки паролей.
+
+    bcrypt выполняется в отдельном пуле потоков или процессов, чтобы не
+    блокировать event loop. Число одновременно принятых задач ограничено
+    `max_workers + max_queue`; сверх этого запросы сразу отклоняются
+    с `PasswordHasherOverloadedError`.
+
+    Attributes:
+        executor_type (str): Тип пула: "thread" или "process".
+        max_workers (int): Количество воркеров пула.
+        max_queue (int): Максимальное число задач, ожидающих свободного воркера.
+    """
+
+    def __init__(self, executor_type: str, max_workers: int, max_queue: int):
+        """
+        Инициализация сервиса. Пул создаётся лениво при первом обращении.
+
+        Args:
+            executor_type (str): Тип пула: "thread" или "process".
+            max_workers (int): Количество воркеров пула.
+            max_queue (int): Максимальная длина очереди ожидания.
+        """
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._busy_seconds = 0.0
+        self._started_at = time.monotonic()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    async def _submit(self, func, *args):
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self._rejected += 1
+            raise PasswordHasherOverloadedError("Сервис хеширования паролей перегружен")
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(
+                self._get_executor(), _timed_call, func, *args
+            )
+        finally:
+            self._in_flight -= 1
+        self._completed += 1
+        self._busy_seconds += elapsed
+        password_hash_seconds.observe(elapsed, func.__name__)
+        return result
+
+    async def hash(self, password: str) -> bytes:
+        """
+        Хеширует пароль в пуле воркеров.
+
+        Args:
+            password (str): Пароль в открытом виде.
+
+        Returns:
+            bytes: bcrypt-хеш пароля.
+
+        Raises:
+            PasswordHasherOverloadedError: Если очередь пула переполнена.
+        """
+        return await self._submit(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: bytes) -> bool:
+        """
+        Проверяет пароль по хешу в пуле воркеров.
+
+        Args:
+            password (str): Пароль в открытом виде.
+            hashed_password (bytes): Сохранённый хеш.
+
+        Returns:
+            bool: True, если пароль совпадает с хешем.
+
+        Raises:
+            PasswordHasherOverloadedError: Если очередь пула переполнена.
+        """
+        return await self._submit(validate_password, password, hashed_password)
+
+    def stats(self) -> dict:
+        """
+        Возвращает метрики загрузки пула.
+
+        Returns:
+            dict: Размер пула, число активных и ожидающих задач, счётчики
+                выполненных и отклонённых задач, суммарное время работы
+                воркеров и средняя загрузка пула с момента запуска.
+        """
+        uptime = time.monotonic() - self._started_at
+        active = min(self._in_flight, self.max_workers)
+        return {
+            "executor": self.executor_type,
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "active": active,
+            "queued": self._in_flight - active,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "busy_seconds": round(self._busy_seconds, 6),
+            "utilization": round(self._busy_seconds / (uptime * self.max_workers), 6) if uptime else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Останавливает пул воркеров."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHashingService(
+    executor_type=settings.password_hash_executor,
+    max_workers=settings.password_hash_workers or min(4, os.cpu_count() or 1),
+    max_queue=settings.password_hash_max_queue,
+)
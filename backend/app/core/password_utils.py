@@ -1,20 +1,108 @@
 import bcrypt
 
+from backend.app.config import settings
+
+"""Хеширование паролей: bcrypt с настраиваемым числом раундов или argon2id.
+
+Схема и параметры новых хешей задаются настройками. Проверяются хеши
+обеих схем — схема определяется по префиксу хеша, поэтому смена
+настроек не ломает вход пользователей со старыми хешами, а
+`needs_rehash` сообщает, что хеш пора пересчитать."""
+
+ARGON2_PREFIX = b"$argon2"
+
+
+def _argon2_hasher(time_cost: int, memory_cost: int, parallelism: int):
+    try:
+        from argon2 import PasswordHasher
+    except ImportError as e:
+        raise RuntimeError("Для хешей argon2id установите пакет argon2-cffi") from e
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def _configured_argon2_hasher():
+    return _argon2_hasher(settings.argon2_time_cost, settings.argon2_memory_cost_kib, settings.argon2_parallelism)
+
+
+def bcrypt_hash(password: str, rounds: int) -> bytes:
+    """
+    Хеширует пароль bcrypt.
+
+    Args:
+        password (str): Пароль в открытом виде.
+        rounds (int): Логарифм числа раундов (каждая единица удваивает время).
+
+    Returns:
+        bytes: bcrypt-хеш пароля.
+    """
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds))
+
+
+def argon2_hash(password: str, time_cost: int, memory_cost: int, parallelism: int) -> bytes:
+    """
+    Хеширует пароль argon2id.
+
+    Args:
+        password (str): Пароль в открытом виде.
+        time_cost (int): Число проходов по памяти.
+        memory_cost (int): Объём памяти в КиБ.
+        parallelism (int): Число потоков вычисления.
+
+    Returns:
+        bytes: Хеш в формате PHC (`$argon2id$v=19$m=...`).
+
+    Raises:
+        RuntimeError: Если пакет argon2-cffi не установлен.
+    """
+    return _argon2_hasher(time_cost, memory_cost, parallelism).hash(password).encode()
+
 
 def hash_password(password: str) -> bytes:
     """
-    Хеширование пароля с солью.
+    Хеширование пароля с солью по схеме и параметрам из настроек.
     """
-    salt = bcrypt.gensalt()
-    pwd_bytes: bytes = password.encode()
-    return bcrypt.hashpw(pwd_bytes, salt)
+    if settings.password_hash_scheme == "argon2id":
+        return _configured_argon2_hasher().hash(password).encode()
+    return bcrypt_hash(password, settings.bcrypt_rounds)
 
 
 def validate_password(password: str, hashed_password: bytes) -> bool:
     """
-    Проверка соответствия пароля хешу.
+    Проверка соответствия пароля хешу bcrypt или argon2id.
     """
+    if hashed_password.startswith(ARGON2_PREFIX):
+        # Параметры для проверки берутся из самого хеша.
+        hasher = _configured_argon2_hasher()
+        from argon2.exceptions import InvalidHashError, VerifyMismatchError
+
+        try:
+            return hasher.verify(hashed_password.decode(), password)
+        except (VerifyMismatchError, InvalidHashError):
+            return False
     return bcrypt.checkpw(
         password=password.encode(),
         hashed_password=hashed_password,
     )
+
+
+def needs_rehash(hashed_password: bytes) -> bool:
+    """
+    Проверяет, отличаются ли схема или параметры хеша от заданных в настройках.
+
+    Args:
+        hashed_password (bytes): Сохранённый хеш.
+
+    Returns:
+        bool: True, если хеш нужно пересчитать при следующем входе.
+    """
+    if settings.password_hash_scheme == "argon2id":
+        if not hashed_password.startswith(ARGON2_PREFIX):
+            return True
+        return _configured_argon2_hasher().check_needs_rehash(hashed_password.decode())
+    if hashed_password.startswith(ARGON2_PREFIX):
+        return True
+    # Формат bcrypt: $2b$<раунды>$<соль и хеш>
+    try:
+        return int(hashed_password.split(b"$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
@@ -0,0 +1,148 @@
+import asyncio
+import hashlib
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from backend.app.config import settings
+from backend.app.core.cache import TTLCache
+from backend.app.logs.logger import logger
+
+"""Refresh-токены и список отозванных сессий.
+
+Refresh-токен — случайная строка; в БД хранится только её SHA-256, поэтому
+утечка таблицы не даёт действующих токенов, а проверка не требует bcrypt.
+Токены одной сессии входа объединены в семейство, идентификатор которого
+также передаётся в access-токене в claim `sid`."""
+
+
+def generate_refresh_token() -> str:
+    """Возвращает новый refresh-токен (256 бит случайных данных)."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Вычисляет хеш refresh-токена для хранения и поиска в БД.
+
+    Args:
+        token (str): Refresh-токен.
+
+    Returns:
+        str: SHA-256 токена в hex.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def new_session_id() -> str:
+    """Возвращает идентификатор новой сессии входа (семейства refresh-токенов)."""
+    return uuid.uuid4().hex
+
+
+def refresh_token_expires_at() -> datetime:
+    """Возвращает момент истечения refresh-токена, выданного сейчас."""
+    return datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
+
+
+class RevokedSessions:
+    """
+    Множество отозванных сессий, проверяемое на каждом запросе с access-токеном.
+
+    Access-токен не хранится в БД и остаётся валидным до `exp`, поэтому
+    после выхода или обнаружения повторного использования refresh-токена
+    идентификатор сессии (`sid`) запоминается здесь на время жизни
+    access-токена. Проверка — поиск в словаре, без обращения к БД, и
+    выполняется в том числе для токенов из кэша проверенных JWT.
+
+    Отзывы, сделанные другими воркерами, подгружаются из БД не реже чем
+    раз в `sync_interval` секунд.
+
+    Attributes:
+        ttl_seconds (float): Сколько секунд помнить отозванную сессию.
+        sync_interval (float): Интервал синхронизации с БД в секундах.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int, sync_interval: float):
+        """
+        Инициализация списка.
+
+        Args:
+            ttl_seconds (float): Сколько секунд помнить отозванную сессию.
+            maxsize (int): Максимальное число отозванных сессий в памяти.
+            sync_interval (float): Интервал синхронизации с БД в секундах.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.sync_interval = sync_interval
+        self._revoked = TTLCache(maxsize=maxsize)
+        self._sync_task: asyncio.Task | None = None
+        self._synced_at: float | None = None
+
+    def revoke(self, session_id: str, revoked_at: float | None = None) -> None:
+        """
+        Запоминает отозванную сессию.
+
+        Args:
+            session_id (str): Идентификатор сессии (семейства refresh-токенов).
+            revoked_at (float | None): Unix-время отзыва, по умолчанию — сейчас.
+        """
+        self._revoked.set(session_id, True, expires_at=(revoked_at or time.time()) + self.ttl_seconds)
+
+    def is_revoked(self, session_id: str | None) -> bool:
+        """
+        Проверяет, отозвана ли сессия.
+
+        Args:
+            session_id (str | None): Значение claim `sid` access-токена.
+
+        Returns:
+            bool: True, если сессия отозвана.
+        """
+        return session_id is not None and self._revoked.get(session_id) is not None
+
+    async def start(self, loader: Callable[[datetime], Awaitable[list[tuple[str, datetime]]]]) -> None:
+        """
+        Запускает фоновую синхронизацию с БД.
+
+        Args:
+            loader: Корутина-функция, возвращающая пары (сессия, время отзыва)
+                для сессий, отозванных после указанного момента.
+        """
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._run(loader))
+
+    async def stop(self) -> None:
+        """Останавливает фоновую синхронизацию."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+
+    async def _run(self, loader) -> None:
+        while True:
+            since = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+            try:
+                for session_id, revoked_at in await loader(since):
+                    self.revoke(session_id, revoked_at.timestamp())
+                self._synced_at = time.time()
+            except Exception as e:
+                logger.warning(f"Не удалось загрузить отозванные сессии: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    def stats(self) -> dict:
+        """Возвращает число отозванных сессий в памяти и время последней синхронизации."""
+        return {
+            "revoked": len(self._revoked),
+            "synced_seconds_ago": round(time.time() - self._synced_at, 3) if self._synced_at else None,
+        }
+
+
+revoked_sessions = RevokedSessions(
+    ttl_seconds=settings.access_token_expire_minutes * 60,
+    maxsize=settings.revoked_sessions_max_size,
+    sync_interval=settings.revoked_sessions_sync_seconds,
+)
@@ -0,0 +1,94 @@
+import csv
+from typing import AsyncIterable, AsyncIterator
+
+
+class LineTooLongError(ValueError):
+    """
+    Строка или запись CSV длиннее допустимого.
+
+    Attributes:
+        line_no (int): Номер строки, на которой превышен предел.
+        limit (int): Допустимый размер.
+    """
+
+    def __init__(self, line_no: int, limit: int):
+        super().__init__(f"Строка {line_no} длиннее {limit} байт")
+        self.line_no = line_no
+        self.limit = limit
+
+
+async def iter_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[str]:
+    """
+    Разбивает поток байтов на строки, не загружая его целиком в память.
+
+    В буфере хранится только незаконченная строка, и каждая часть потока
+    разбирается один раз. Поток без переводов строк не накапливается
+    в памяти: как только строка превышает `max_line_bytes`, разбор прерывается.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Части тела запроса, например `request.stream()`.
+        max_line_bytes (int): Максимальная длина одной строки в байтах.
+
+    Yields:
+        str: Очередная строка без завершающего перевода строки.
+
+    Raises:
+        UnicodeDecodeError: Если поток не в кодировке UTF-8.
+        LineTooLongError: Если строка длиннее `max_line_bytes`.
+    """
+    buffer = bytearray()
+    line_no = 0
+    async for chunk in chunks:
+        *lines, tail = chunk.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if buffer:
+                buffer += line
+                line, buffer = bytes(buffer), bytearray()
+            if len(line) > max_line_bytes:
+                raise LineTooLongError(line_no, max_line_bytes)
+            yield line.removesuffix(b"\r").decode("utf-8-sig")
+        buffer += tail
+        if len(buffer) > max_line_bytes:
+            raise LineTooLongError(line_no + 1, max_line_bytes)
+    if buffer:
+        yield bytes(buffer).removesuffix(b"\r").decode("utf-8-sig")
+
+
+async def iter_csv_records(lines: AsyncIterable[str], max_record_chars: int) -> AsyncIterator[tuple[int, list[str]]]:
+    """
+    Собирает из строк записи CSV, включая поля с переводами строк внутри кавычек.
+
+    Запись считается законченной, когда число кавычек в ней чётное.
+    Незакрытая кавычка не копит остаток файла в памяти: запись длиннее
+    `max_record_chars` прерывает разбор.
+
+    Args:
+        lines (AsyncIterable[str]): Строки файла.
+        max_record_chars (int): Максимальная длина одной записи в символах.
+
+    Yields:
+        tuple[int, list[str]]: Номер первой строки записи и значения её полей.
+
+    Raises:
+        LineTooLongError: Если запись длиннее `max_record_chars`.
+    """
+    record: list[str] = []
+    size = 0
+    start = 0
+    quotes = 0
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not record:
+            start = line_no
+        record.append(line)
+        size += len(line) + 1
+        if size > max_record_chars:
+            raise LineTooLongError(start, max_record_chars)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield start, next(csv.reader(["\n".join(record)]), [])
+            record, quotes, size = [], 0, 0
+    if record:
+        yield start, next(csv.reader(["\n".join(record)]), [])
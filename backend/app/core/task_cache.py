@@ -0,0 +1,291 @@
+import itertools
+import secrets
+import time
+from typing import Hashable, Iterable
+
+import orjson
+
+from backend.app.config import settings
+from backend.app.core.cache import TTLCache
+from backend.app.logs.logger import logger
+
+
+class TaskListCache:
+    """
+    Базовый кэш страниц списка задач, разбитый по пользователям.
+
+    Значение — страница списка, сериализуемая orjson. Ключ страницы
+    строится из параметров запроса (размер страницы, курсор, фильтры).
+    Сбрасываются сразу все страницы пользователя: у каждого пользователя
+    есть версия, которая меняется при сбросе. Версию нужно получить через
+    `version` до чтения из БД и передать в `set`: страница, прочитанная
+    до COMMIT, сохранится под старой версией и не будет отдана после него.
+
+    Базовая реализация ничего не хранит и используется при
+    `task_cache_backend="none"`.
+
+    Attributes:
+        hits (int): Количество попаданий в кэш.
+        misses (int): Количество промахов кэша.
+        invalidations (int): Количество сбросов кэша пользователей.
+    """
+
+    backend = "none"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def version(self, user_id: int) -> str | None:
+        """
+        Возвращает текущую версию списка задач пользователя.
+
+        Версия меняется при каждом сбросе и не повторяется, в том числе
+        после перезапуска, поэтому годится для построения ETag.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            str | None: Версия или None, если кэш отключён или недоступен.
+        """
+        return None
+
+    async def get(self, user_id: int, version: str | None, key: str) -> dict | None:
+        """
+        Возвращает закэшированную страницу.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            version (str | None): Версия, полученная через `version`.
+            key (str): Ключ страницы.
+
+        Returns:
+            dict | None: Страница списка задач или None при промахе.
+        """
+        if version is None:
+            return None
+        value = await self._get(user_id, version, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, user_id: int, version: str | None, key: str, value: dict) -> None:
+        """
+        Сохраняет страницу списка задач пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            version (str | None): Версия, полученная через `version` до чтения страницы из БД.
+            key (str): Ключ страницы.
+            value (dict): Страница списка задач.
+        """
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Сбрасывает все закэшированные страницы пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+        """
+        self.invalidations += 1
+        await self._invalidate(user_id)
+
+    async def on_commit(self, written_keys: Iterable[Hashable]) -> None:
+        """
+        Сбрасывает кэш пользователей, чьи задачи изменились в зафиксированной транзакции.
+
+        Регистрируется через `Database.add_commit_listener`.
+
+        Args:
+            written_keys (Iterable[Hashable]): Ключи записей из `session.info["written_keys"]`.
+        """
+        for key in written_keys:
+            if isinstance(key, tuple) and key[0] == "tasks":
+                await self.invalidate(key[1])
+
+    async def _get(self, user_id: int, version: str, key: str) -> dict | None:
+        return None
+
+    async def _invalidate(self, user_id: int) -> None:
+        pass
+
+    def stats(self) -> dict:
+        """Возвращает метрики попаданий в кэш."""
+        requests = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / requests, 6) if requests else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+class InMemoryTaskListCache(TaskListCache):
+    """
+    Кэш страниц списка задач в памяти процесса с ограничением по размеру (LRU).
+
+    Сброс пользователя выполняется за O(1): пользователю назначается новое
+    поколение, а старые записи больше не находятся и вытесняются LRU.
+    Поколения хранятся в таком же ограниченном кэше, что и страницы. Если
+    поколение пользователя вытеснено или истекло, ему выдаётся новое, ещё не
+    использованное, поэтому потеря поколения не возвращает старые страницы.
+    Версия начинается со случайной метки процесса и не повторяется после
+    перезапуска. Кэш локален для воркера:
+    записи, сделанные через другие воркеры, его не сбрасывают, и до
+    истечения `ttl_seconds` он может отдавать устаревшую страницу.
+    При нескольких воркерах используйте `task_cache_backend="redis"`.
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Инициализация кэша.
+
+        Args:
+            max_entries (int): Максимальное количество страниц в кэше.
+            ttl_seconds (float): Время жизни страницы в секундах.
+        """
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self._entries = TTLCache(maxsize=max_entries)
+        self._epoch = secrets.token_hex(4)
+        self._counter = itertools.count(1)
+        self._generations = TTLCache(maxsize=max_entries)
+
+    async def version(self, user_id: int) -> str | None:
+        generation = self._generations.get(user_id)
+        if generation is None:
+            generation = self._new_generation(user_id)
+        return f"{self._epoch}.{generation}"
+
+    async def _get(self, user_id: int, version: str, key: str) -> dict | None:
+        return self._entries.get((user_id, version, key))
+
+    async def set(self, user_id: int, version: str | None, key: str, value: dict) -> None:
+        if version is None:
+            return
+        self._entries.set(
+            (user_id, version, key),
+            value,
+            expires_at=time.time() + self.ttl_seconds,
+        )
+
+    async def _invalidate(self, user_id: int) -> None:
+        self._new_generation(user_id)
+
+    def _new_generation(self, user_id: int) -> int:
+        # Страницы живут не дольше ttl_seconds, поэтому и поколение дольше хранить незачем.
+        generation = next(self._counter)
+        self._generations.set(user_id, generation, expires_at=time.time() + self.ttl_seconds)
+        return generation
+
+    def stats(self) -> dict:
+        return {**super().stats(), "entries": len(self._entries), "users": len(self._generations)}
+
+
+class RedisTaskListCache(TaskListCache):
+    """
+    Кэш страниц списка задач в Redis, общий для всех воркеров.
+
+    Версия пользователя — случайный токен в ключе `tasks:{user_id}:version`,
+    сброс записывает новый токен и удаляет хеш страниц `tasks:{user_id}`.
+    Поле страницы в хеше включает версию, поэтому страница, прочитанная
+    из БД до сброса, не будет отдана после него. Подходит любой клиент
+    с асинхронными методами `get`, `set`, `hget`, `hset`, `expire` и
+    `delete` (например, `redis.asyncio.Redis` или `fakeredis`).
+    """
+
+    backend = "redis"
+
+    def __init__(self, client, ttl_seconds: float):
+        """
+        Инициализация кэша.
+
+        Args:
+            client: Асинхронный Redis-совместимый клиент.
+            ttl_seconds (float): Время жизни страниц пользователя в секундах.
+        """
+        super().__init__()
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _name(user_id: int) -> str:
+        return f"tasks:{user_id}"
+
+    async def version(self, user_id: int) -> str | None:
+        name = f"{self._name(user_id)}:version"
+        try:
+            raw = await self.client.get(name)
+            if raw is None:
+                # Версии нет (первое обращение или вытеснение): создаём новую, не повторяющую прежние.
+                await self.client.set(name, secrets.token_hex(8), nx=True)
+                raw = await self.client.get(name)
+        except Exception as e:
+            logger.warning(f"Ошибка чтения версии кэша задач из Redis: {e}")
+            return None
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    async def _get(self, user_id: int, version: str, key: str) -> dict | None:
+        try:
+            raw = await self.client.hget(self._name(user_id), f"{version}|{key}")
+        except Exception as e:
+            logger.warning(f"Ошибка чтения кэша задач из Redis: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, user_id: int, version: str | None, key: str, value: dict) -> None:
+        if version is None:
+            return
+        name = self._name(user_id)
+        try:
+            await self.client.hset(name, f"{version}|{key}", orjson.dumps(value))
+            await self.client.expire(name, max(int(self.ttl_seconds), 1))
+        except Exception as e:
+            logger.warning(f"Ошибка записи кэша задач в Redis: {e}")
+
+    async def _invalidate(self, user_id: int) -> None:
+        name = self._name(user_id)
+        try:
+            await self.client.set(f"{name}:version", secrets.token_hex(8))
+            await self.client.delete(name)
+        except Exception as e:
+            logger.warning(f"Ошибка сброса кэша задач в Redis: {e}")
+
+
+def create_task_list_cache() -> TaskListCache:
+    """
+    Создаёт кэш списка задач согласно `settings.task_cache_backend`.
+
+    Returns:
+        TaskListCache: Экземпляр кэша выбранного типа.
+
+    Raises:
+        RuntimeError: Если выбран Redis, но пакет `redis` не установлен или не задан `redis_url`.
+    """
+    if settings.task_cache_backend == "memory":
+        return InMemoryTaskListCache(
+            max_entries=settings.task_cache_max_entries,
+            ttl_seconds=settings.task_cache_ttl_seconds,
+        )
+    if settings.task_cache_backend == "redis":
+        if not settings.redis_url:
+            raise RuntimeError("Для task_cache_backend=redis нужно задать REDIS_URL")
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("Для task_cache_backend=redis установите пакет redis") from e
+        return RedisTaskListCache(
+            client=Redis.from_url(settings.redis_url),
+            ttl_seconds=settings.task_cache_ttl_seconds,
+        )
+    return TaskListCache()
+
+
+task_list_cache = create_task_list_cache()
@@ -0,0 +1,42 @@
+from typing import Hashable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from backend.app.config import settings
+from backend.app.core.cache import TTLCache
+from backend.app.database.models import UserModels
+
+"""Кэш пользователей для режима аутентификации `auth_mode="database"`.
+
+Хранит UserPrincipal по id пользователя не дольше `user_cache_ttl_seconds`.
+Запись сбрасывается после COMMIT транзакции, изменившей или удалившей
+пользователя: сброс до COMMIT позволил бы параллельному запросу снова
+закэшировать старые данные. Изменения через ORM отмечаются автоматически;
+массовые UPDATE/DELETE в репозитории должны сами добавлять ключ `("user", id)`
+в `session.info["written_keys"]`."""
+
+user_cache = TTLCache(maxsize=settings.user_cache_size if settings.user_cache_ttl_seconds > 0 else 0)
+
+
+@event.listens_for(UserModels, "after_update")
+@event.listens_for(UserModels, "after_delete")
+def _mark_user_written(mapper, connection, target: UserModels) -> None:
+    """Отмечает изменённого пользователя для сброса кэша после COMMIT."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("written_keys", set()).add(("user", target.id))
+
+
+async def invalidate_on_commit(written_keys: Iterable[Hashable]) -> None:
+    """
+    Сбрасывает кэш пользователей, изменённых в зафиксированной транзакции.
+
+    Регистрируется через `Database.add_commit_listener`.
+
+    Args:
+        written_keys (Iterable[Hashable]): Ключи записей из `session.info["written_keys"]`.
+    """
+    for key in written_keys:
+        if isinstance(key, tuple) and key[0] == "user":
+            user_cache.delete(key[1])
@@ -1,16 +1,81 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from backend.app.config import settings
-from backend.app.database.models import Base
+from backend.app.database import migrations
+from backend.app.database.pool import InstrumentedQueuePool
+from backend.app.database.routing import ReplicaRouter, RoutingAsyncSession, RoutingSession
 from backend.app.logs.logger import logger
 
+db_logger = logger.getChild("database")
+
 
 class Database:
     """Класс для управления подключением и сессиями базы данных."""
-    def __init__(self, url: str, echo: bool):
-        self.engine = create_async_engine(
-            url=url,
-            echo=echo
+    def __init__(
+            self,
+            url: str,
+            echo: bool,
+            pool_size: int = 5,
+            max_overflow: int = 10,
+            pool_timeout: float = 30,
+            pool_recycle: int = -1,
+            pool_pre_ping: bool = False,
+            statement_cache_size: int = 100,
+            statement_timeout_ms: int | None = None,
+            replica_urls: list[str] = (),
+            replica_sticky_seconds: float = 5,
+            replica_retry_seconds: float = 30,
+    ):
+        """
+        Создаёт движок и фабрику сессий.
+
+        Args:
+            url (str): URL подключения к PostgreSQL (драйвер asyncpg).
+            echo (bool): Логировать SQL-запросы.
+            pool_size (int): Число постоянно открытых соединений в пуле.
+            max_overflow (int): Сколько соединений можно открыть сверх `pool_size`.
+            pool_timeout (float): Сколько секунд ждать свободного соединения.
+            pool_recycle (int): Через сколько секунд пересоздавать соединение (-1 — никогда).
+            pool_pre_ping (bool): Проверять соединение перед выдачей из пула.
+            statement_cache_size (int): Размер кэша подготовленных выражений asyncpg
+                на одно соединение (0 — кэш отключён).
+            statement_timeout_ms (int | None): Серверный `statement_timeout` в миллисекундах.
+            replica_urls (list[str]): URL реплик для чтения (по умолчанию чтение идёт в основную БД).
+            replica_sticky_seconds (float): Сколько секунд после записи пользователя его
+                чтения идут в основную БД (read-your-writes).
+            replica_retry_seconds (float): На сколько секунд реплика исключается из ротации после ошибки.
+        """
+        connect_args = {"prepared_statement_cache_size": statement_cache_size}
+        if statement_timeout_ms:
+            connect_args["server_settings"] = {"statement_timeout": str(statement_timeout_ms)}
+
+        engine_kwargs = dict(
+            echo=echo,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
+        )
+        self.engine = create_async_engine(url=url, **engine_kwargs)
+        self.replica_engines = [
+            create_async_engine(url=replica_url, **engine_kwargs)
+            for replica_url in replica_urls
+        ]
+        self.router = ReplicaRouter(
+            primary=self.engine.execution_options(isolation_level="AUTOCOMMIT"),
+            replicas=[
+                engine.execution_options(isolation_level="AUTOCOMMIT")
+                for engine in self.replica_engines
+            ],
+            sticky_seconds=replica_sticky_seconds,
+            retry_seconds=replica_retry_seconds,
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
@@ -18,24 +83,164 @@ class Database:
             autocommit=False,
             expire_on_commit=False,
         )
+        self._commit_listeners = []
+        self.read_session_factory = async_sessionmaker(
+            class_=RoutingAsyncSession,
+            sync_session_class=RoutingSession,
+            info={"router": self.router},
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+        )
 
     async def get_session(self) -> AsyncSession:
-        """Возвращает асинхронную сессию базы данных."""
+        """
+        Возвращает сессию, работающую как единица работы (unit of work) на весь запрос.
+
+        Соединение берётся из пула и транзакция открывается только при первом
+        запросе к БД. Репозитории не фиксируют изменения сами: если обработчик
+        завершился успешно и в сессии есть транзакция или несохранённые
+        объекты, всё фиксируется одним COMMIT, при ошибке — откатывается.
+        Ключи, записанные репозиториями в `session.info["written_keys"]`,
+        после COMMIT на время закрепляются за основной БД (read-your-writes)
+        и передаются слушателям из `add_commit_listener`.
+
+        Подключается через `Depends(database.get_session, scope="function")`,
+        чтобы COMMIT выполнялся до отправки ответа клиенту, а соединение
+        возвращалось в пул сразу после обработчика.
+        """
         try:
             async with self.session_factory() as session:
-                logger.debug("Создана новая асинхронная сессия базы данных.")
-                yield session
+                db_logger.debug("Создана новая асинхронная сессия базы данных.")
+                try:
+                    yield session
+                except Exception:
+                    await session.rollback()
+                    raise
+                if session.in_transaction() or session.new or session.dirty or session.deleted:
+                    await session.commit()
+                written_keys = session.info.pop("written_keys", set())
+                for key in written_keys:
+                    self.router.mark_written(key)
+                if written_keys:
+                    await self._notify_commit(written_keys)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.exception(f"Ошибка при создании сессии: {e}")
             raise
 
-    async def create_table(self):
-        """Создает таблицы в базе данных."""
+    def add_commit_listener(self, listener) -> None:
+        """
+        Регистрирует асинхронную функцию, вызываемую после успешного COMMIT.
+
+        Args:
+            listener: Корутина-функция, принимающая множество записанных ключей.
+        """
+        self._commit_listeners.append(listener)
+
+    async def _notify_commit(self, written_keys: set) -> None:
+        for listener in self._commit_listeners:
+            try:
+                await listener(written_keys)
+            except Exception as e:
+                logger.exception(f"Ошибка обработчика после COMMIT: {e}")
+
+    async def get_read_session(self) -> AsyncSession:
+        """
+        Возвращает сессию для эндпоинтов, которые только читают данные.
+
+        Сессия работает в режиме AUTOCOMMIT: каждый запрос выполняется без
+        явной транзакции, BEGIN/COMMIT не отправляются, а соединение
+        берётся из пула только при первом запросе. Если заданы реплики,
+        запрос уходит на одну из них (см. `ReplicaRouter`).
+        """
+        async with self.read_session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def snapshot_session(self, sticky_key: Hashable | None = None) -> AsyncIterator[AsyncSession]:
+        """
+        Открывает сессию чтения в одной транзакции REPEATABLE READ.
+
+        Нужна для долгих чтений через серверный курсор (`session.stream`):
+        курсоры asyncpg работают только внутри транзакции, а снимок
+        REPEATABLE READ гарантирует согласованный результат, даже если
+        данные меняются во время чтения. Как и `get_read_session`, может
+        читать с реплики. Соединение удерживается до выхода из контекста.
+
+        Args:
+            sticky_key (Hashable | None): Ключ read-your-writes для выбора движка.
+
+        Yields:
+            AsyncSession: Сессия с открытой транзакцией только для чтения.
+        """
+        async with self.read_session_factory() as session:
+            # Движок снимка не меняется до конца транзакции (см. RoutingSession).
+            session.info["snapshot"] = True
+            await session.connection(
+                bind_arguments={"sticky_key": sticky_key},
+                execution_options={"isolation_level": "REPEATABLE READ"},
+            )
+            try:
+                yield session
+            finally:
+                await session.rollback()
+
+    def pool_stats(self) -> dict:
+        """Возвращает текущую статистику пула соединений."""
+        return self.engine.pool.stats()
+
+    def replica_stats(self) -> dict:
+        """
+        Возвращает статистику маршрутизации чтений и пулов реплик.
+
+        Реплики обозначаются номером в `pg_replica_urls`: адрес, имя
+        пользователя и имя БД в статистику не попадают.
+        """
+        return {
+            **self.router.stats(),
+            "pools": [
+                {"replica": index, "healthy": healthy, **engine.pool.stats()}
+                for index, (engine, healthy) in enumerate(zip(self.replica_engines, self.router.replica_health()))
+            ],
+        }
+
+    async def check_schema(self) -> int:
+        """
+        Проверяет, что к основной БД применены все миграции.
+
+        Returns:
+            int: Номер версии схемы.
+
+        Raises:
+            SchemaOutdatedError: Применены не все миграции.
+        """
+        async with self.engine.connect() as conn:
+            return await migrations.check(conn)
+
+    async def migrate(self) -> list[int]:
+        """
+        Применяет недостающие миграции к основной БД.
+
+        Returns:
+            list[int]: Номера применённых миграций.
+        """
         async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            return await migrations.upgrade(conn)
 
 
 database = Database(
     url=settings.pg_url,
     echo=settings.echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    statement_cache_size=settings.db_statement_cache_size,
+    statement_timeout_ms=settings.db_statement_timeout_ms,
+    replica_urls=settings.pg_replica_urls,
+    replica_sticky_seconds=settings.db_replica_sticky_seconds,
+    replica_retry_seconds=settings.db_replica_retry_seconds,
 )
@@ -0,0 +1,108 @@
+"""Версионированные миграции схемы БД.
+
+Каждая миграция — модуль `mNNNN_<имя>.py` с номером `revision`,
+описанием `description` и функцией `upgrade(conn)`, которая выполняется
+на синхронном `Connection` внутри транзакции. Применённые номера
+хранятся в таблице `schema_migrations`.
+
+Миграции применяются отдельной командой (`python -m backend.app.manage migrate`),
+а приложение при старте только сверяет номер версии схемы одним запросом.
+"""
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from backend.app.database.migrations import m0001_initial, m0002_tasks_list_index, m0003_refresh_tokens
+
+MIGRATIONS = (m0001_initial, m0002_tasks_list_index, m0003_refresh_tokens)
+LATEST_REVISION = MIGRATIONS[-1].revision
+
+# Произвольный ключ pg_advisory_xact_lock, чтобы одновременные запуски миграций шли по очереди.
+MIGRATIONS_LOCK_KEY = 7_340_211
+
+metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    metadata,
+    Column("revision", Integer, primary_key=True, autoincrement=False),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+class SchemaOutdatedError(RuntimeError):
+    """Схема БД старее, чем ожидает код приложения."""
+
+
+async def current_revision(conn: AsyncConnection) -> int:
+    """
+    Возвращает номер последней применённой миграции.
+
+    Args:
+        conn (AsyncConnection): Соединение с БД.
+
+    Returns:
+        int: Номер миграции или 0, если миграции ещё не применялись.
+    """
+    exists = await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(schema_migrations.name))
+    if not exists:
+        return 0
+    result = await conn.execute(select(func.max(schema_migrations.c.revision)))
+    return result.scalar() or 0
+
+
+async def upgrade(conn: AsyncConnection) -> list[int]:
+    """
+    Применяет недостающие миграции по порядку.
+
+    Вызывается внутри транзакции (`engine.begin()`): при ошибке любая
+    из миграций откатывается вместе с записью о ней. В PostgreSQL
+    одновременные запуски упорядочиваются advisory-блокировкой.
+
+    Args:
+        conn (AsyncConnection): Соединение с открытой транзакцией.
+
+    Returns:
+        list[int]: Номера применённых миграций.
+    """
+    if conn.dialect.name == "postgresql":
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATIONS_LOCK_KEY})
+    await conn.run_sync(metadata.create_all, checkfirst=True)
+    current = await current_revision(conn)
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.revision <= current:
+            continue
+        await conn.run_sync(migration.upgrade)
+        await conn.execute(
+            insert(schema_migrations).values(revision=migration.revision, description=migration.description)
+        )
+        applied.append(migration.revision)
+    return applied
+
+
+async def check(conn: AsyncConnection) -> int:
+    """
+    Проверяет, что все миграции, известные коду, применены.
+
+    Схема новее кода допускается: так бывает при поэтапном выкатывании,
+    когда миграции уже применены, а часть воркеров ещё на старой версии.
+
+    Args:
+        conn (AsyncConnection): Соединение с БД.
+
+    Returns:
+        int: Номер версии схемы.
+
+    Raises:
+        SchemaOutdatedError: Применены не все миграции.
+    """
+    current = await current_revision(conn)
+    if current < LATEST_REVISION:
+        raise SchemaOutdatedError(
+            f"Версия схемы БД {current}, требуется {LATEST_REVISION}: "
+            f"выполните `python -m backend.app.manage migrate`"
+        )
+    return current
@@ -0,0 +1,49 @@
+"""Исходная схема: таблицы users и tasks.
+
+Таблицы описаны здесь отдельно от ORM-моделей, чтобы миграция не
+менялась вместе с моделями. `checkfirst` пропускает таблицы, уже
+созданные прежним `create_all` при старте приложения.
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Connection,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    func,
+)
+
+revision = 1
+description = "Таблицы users и tasks"
+
+metadata = MetaData()
+
+Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("username", String, nullable=False, unique=True),
+    Column("password", LargeBinary, nullable=False),
+    Column("email", String, nullable=False, unique=True),
+)
+
+Table(
+    "tasks",
+    metadata,
+    Column("task_id", Integer, primary_key=True),
+    Column("title", String(255), nullable=False),
+    Column("description", String(255), nullable=True),
+    Column("is_done", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    metadata.create_all(conn, checkfirst=True)
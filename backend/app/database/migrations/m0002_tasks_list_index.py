@@ -0,0 +1,18 @@
+"""Индекс для постраничного списка задач.
+
+Индекс мог быть уже создан `create_all` до появления миграций,
+поэтому перед изменением схема проверяется.
+"""
+
+from sqlalchemy import Connection, inspect, text
+
+revision = 2
+description = "Индекс tasks (user_id, created_at, task_id)"
+
+
+def upgrade(conn: Connection) -> None:
+    inspector = inspect(conn)
+    if "ix_tasks_user_id_created_at_task_id" not in {index["name"] for index in inspector.get_indexes("tasks")}:
+        conn.execute(text(
+            "CREATE INDEX ix_tasks_user_id_created_at_task_id ON tasks (user_id, created_at, task_id)"
+        ))
@@ -0,0 +1,29 @@
+"""Таблица refresh-токенов."""
+
+from sqlalchemy import Column, Connection, DateTime, ForeignKey, Index, Integer, MetaData, String, Table, func
+
+revision = 3
+description = "Таблица refresh_tokens"
+
+metadata = MetaData()
+
+Table("users", metadata, Column("id", Integer, primary_key=True))
+
+Table(
+    "refresh_tokens",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("token_hash", String(64), nullable=False, unique=True),
+    Column("family_id", String(32), nullable=False),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Column("used_at", DateTime(timezone=True), nullable=True),
+    Column("revoked_at", DateTime(timezone=True), nullable=True),
+    Index("ix_refresh_tokens_family_id", "family_id"),
+    Index("ix_refresh_tokens_revoked_at", "revoked_at"),
+)
+
+
+def upgrade(conn: Connection) -> None:
+    metadata.tables["refresh_tokens"].create(conn, checkfirst=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, func, ForeignKey
+from sqlalchemy import String, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -33,6 +33,9 @@ class TaskModels(Base):
     """
 
     __tablename__ = 'tasks'
+    __table_args__ = (
+        Index("ix_tasks_user_id_created_at_task_id", "user_id", "created_at", "task_id"),
+    )
 
     task_id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -76,3 +79,38 @@ class UserModels(Base):
         "TaskModels",
         back_populates="user",
     )
+
+
+class RefreshTokenModels(Base):
+    """
+    ORM-модель refresh-токена.
+
+    Сам токен не хранится — только его SHA-256. Токены одной сессии входа
+    образуют семейство (`family_id`): при обновлении старый токен
+    помечается использованным и выдаётся новый того же семейства.
+    Повторное предъявление использованного токена отзывает всё семейство.
+
+    Attributes:
+        id (int): Уникальный идентификатор записи.
+        token_hash (str): SHA-256 токена в hex.
+        family_id (str): Идентификатор сессии входа, общий для цепочки токенов.
+        user_id (int): Идентификатор пользователя-владельца токена.
+        created_at (datetime): Дата и время выдачи токена.
+        expires_at (datetime): Дата и время истечения токена.
+        used_at (datetime | None): Когда токен был обменян на новый.
+        revoked_at (datetime | None): Когда семейство токена было отозвано.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True)
+    family_id: Mapped[str] = mapped_column(String(32), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
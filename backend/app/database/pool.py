@@ -0,0 +1,63 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from backend.app.core.metrics import db_pool_wait_seconds
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, который дополнительно считает время ожидания соединения.
+
+    Время измеряется от запроса соединения у пула до его получения,
+    включая создание нового соединения в пределах `max_overflow`.
+
+    Attributes:
+        checkouts (int): Количество выданных соединений.
+        timeouts (int): Количество запросов, не дождавшихся соединения за `pool_timeout`.
+        wait_seconds_total (float): Суммарное время ожидания соединений.
+        wait_seconds_max (float): Максимальное время ожидания одного соединения.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        db_pool_wait_seconds.observe(waited)
+        return record
+
+    def stats(self) -> dict:
+        """
+        Возвращает текущее состояние пула и статистику ожидания соединений.
+
+        Returns:
+            dict: Размер пула, число выданных, свободных и overflow-соединений,
+                а также счётчики и время ожидания соединений.
+        """
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
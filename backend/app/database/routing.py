@@ -0,0 +1,179 @@
+import itertools
+import time
+from typing import Hashable
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.app.core.cache import TTLCache
+from backend.app.logs.logger import logger
+
+
+class ReplicaRouter:
+    """
+    Выбирает движок для запросов на чтение: реплику или основную БД.
+
+    Реплики перебираются по кругу (round-robin). После записи пользователя
+    его ключ на `sticky_seconds` секунд «прилипает» к основной БД, чтобы
+    он сразу видел свои изменения, несмотря на задержку репликации.
+    Реплика, на которой произошла ошибка, исключается из ротации на
+    `retry_seconds` секунд.
+
+    Attributes:
+        primary (AsyncEngine): Движок основной БД.
+        replicas (list[AsyncEngine]): Движки реплик.
+        sticky_seconds (float): Окно read-your-writes после записи.
+        retry_seconds (float): Время исключения реплики из ротации после ошибки.
+    """
+
+    def __init__(
+            self,
+            primary: AsyncEngine,
+            replicas: list[AsyncEngine],
+            sticky_seconds: float,
+            retry_seconds: float,
+    ):
+        """
+        Инициализация маршрутизатора.
+
+        Args:
+            primary (AsyncEngine): Движок основной БД.
+            replicas (list[AsyncEngine]): Движки реплик.
+            sticky_seconds (float): Окно read-your-writes после записи.
+            retry_seconds (float): Время исключения реплики из ротации после ошибки.
+        """
+        self.primary = primary
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self.retry_seconds = retry_seconds
+        self._cycle = itertools.cycle(replicas)
+        self._recent_writes = TTLCache(maxsize=100_000 if replicas else 0)
+        self._unhealthy_until: dict[AsyncEngine, float] = {}
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.fallbacks = 0
+
+    def mark_written(self, key: Hashable) -> None:
+        """
+        Отмечает, что по ключу только что была запись.
+
+        Args:
+            key (Hashable): Ключ пользователя или сущности.
+        """
+        self._recent_writes.set(key, True, expires_at=time.time() + self.sticky_seconds)
+
+    def is_recently_written(self, key: Hashable) -> bool:
+        """
+        Проверяет, была ли по ключу запись в пределах окна read-your-writes.
+
+        Args:
+            key (Hashable): Ключ пользователя или сущности.
+
+        Returns:
+            bool: True, если чтение по ключу должно идти в основную БД.
+        """
+        return self._recent_writes.get(key) is not None
+
+    def choose(self, sticky_key: Hashable | None = None) -> AsyncEngine:
+        """
+        Выбирает движок для очередного чтения.
+
+        Args:
+            sticky_key (Hashable | None): Ключ для проверки недавних записей.
+
+        Returns:
+            AsyncEngine: Здоровая реплика или основная БД.
+        """
+        if self.replicas and (sticky_key is None or not self.is_recently_written(sticky_key)):
+            now = time.monotonic()
+            for _ in range(len(self.replicas)):
+                replica = next(self._cycle)
+                if self._unhealthy_until.get(replica, 0) <= now:
+                    self.replica_reads += 1
+                    return replica
+        self.primary_reads += 1
+        return self.primary
+
+    def mark_unhealthy(self, replica: AsyncEngine, error: Exception) -> None:
+        """
+        Исключает реплику из ротации на `retry_seconds` секунд.
+
+        Args:
+            replica (AsyncEngine): Реплика, на которой произошла ошибка.
+            error (Exception): Исключение, вызвавшее переключение.
+        """
+        self.fallbacks += 1
+        self._unhealthy_until[replica] = time.monotonic() + self.retry_seconds
+        logger.warning(f"Реплика {replica.url.host} недоступна, чтение переключено на основную БД: {error}")
+
+    def replica_health(self) -> list[bool]:
+        """
+        Возвращает доступность реплик в порядке `replicas`.
+
+        Returns:
+            list[bool]: False для реплик, исключённых из ротации после ошибки.
+        """
+        now = time.monotonic()
+        return [self._unhealthy_until.get(replica, 0) <= now for replica in self.replicas]
+
+    def stats(self) -> dict:
+        """Возвращает счётчики маршрутизации чтений."""
+        return {
+            "replicas": len(self.replicas),
+            "healthy_replicas": sum(self.replica_health()),
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "fallbacks": self.fallbacks,
+        }
+
+
+class RoutingSession(Session):
+    """
+    Синхронная часть сессии чтения, выбирающая движок через ReplicaRouter.
+
+    Маршрутизатор передаётся через `info={"router": ...}` фабрики сессий.
+    Ключ read-your-writes передаётся из репозитория через
+    `session.execute(query, bind_arguments={"sticky_key": ...})`.
+    Выбранный движок закрепляется за сессией до её закрытия. Исключение —
+    запрос с ключом, по которому недавно была запись: если сессия
+    закреплена за репликой (например, предыдущим запросом другого
+    репозитория без ключа), она переводится на основную БД. Сессия работает
+    в режиме AUTOCOMMIT, поэтому переключение не разрывает транзакцию.
+    Сессии `Database.snapshot_session` не переключаются: их запросы
+    должны идти в одной транзакции REPEATABLE READ.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, sticky_key=None, **kw):
+        router: ReplicaRouter = self.info["router"]
+        engine = self.info.get("engine")
+        if engine is None:
+            engine = router.choose(sticky_key)
+        elif (
+                engine is not router.primary
+                and sticky_key is not None
+                and not self.info.get("snapshot")
+                and router.is_recently_written(sticky_key)
+        ):
+            engine = router.choose(sticky_key)
+        self.info["engine"] = engine
+        return engine.sync_engine
+
+
+class RoutingAsyncSession(AsyncSession):
+    """
+    Асинхронная сессия чтения с переключением на основную БД при ошибке реплики.
+    """
+
+    async def execute(self, statement, params=None, **kw):
+        try:
+            return await super().execute(statement, params, **kw)
+        except (DBAPIError, OSError) as e:
+            router: ReplicaRouter = self.info["router"]
+            engine = self.info.get("engine")
+            if engine is None or engine is router.primary:
+                raise
+            router.mark_unhealthy(engine, e)
+            await self.close()
+            self.info["engine"] = router.primary
+            return await super().execute(statement, params, **kw)
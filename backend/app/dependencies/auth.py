@@ -1,13 +1,20 @@
+import time
+
+import jwt
 from fastapi import Depends, Form, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from starlette import status
 
+from backend.app.config import settings
 from backend.app.core.jwt_utils import decode_jwt
-from backend.app.core.password_utils import validate_password
-from backend.app.dependencies.repositories import get_user_repo
+from backend.app.core.password_hasher import PasswordHasherOverloadedError, password_hasher
+from backend.app.core.password_utils import needs_rehash
+from backend.app.core.refresh_tokens import revoked_sessions
+from backend.app.core.user_cache import user_cache
+from backend.app.dependencies.repositories import get_user_read_repo
+from backend.app.logs.logger import logger
 from backend.app.repositories.users import UserRepository
-from jwt.exceptions import InvalidTokenError
-from backend.app.database.models import UserModels
+from backend.app.schemas.user_schemas import UserPrincipal
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login/")
@@ -20,7 +27,9 @@ async def get_current_token_payload(
     Извлекает и валидирует payload JWT-токена из заголовка Authorization.
 
     Получает access-токен через OAuth2PasswordBearer, декодирует его
-    и возвращает payload.
+    и возвращает payload. Токены отозванных сессий (выход, повторное
+    использование refresh-токена) отклоняются, в том числе когда payload
+    взят из кэша проверенных токенов.
 
     Args:
         token (str): JWT-токен.
@@ -37,54 +46,98 @@ async def get_current_token_payload(
 
     try:
         payload = decode_jwt(token=token)
-    except InvalidTokenError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Не валидный токен"
         )
+    if revoked_sessions.is_revoked(payload.get("sid")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Сессия завершена"
+        )
     return payload
 
 
-async def get_current_auth_users(
-    repo: UserRepository = Depends(get_user_repo),
+async def get_token_principal(
     payload: dict = Depends(get_current_token_payload),
-) -> UserModels:
+) -> UserPrincipal:
     """
-    Получает текущего аутентифицированного пользователя по JWT-токену.
+    Собирает текущего пользователя из claims JWT-токена без обращения к БД.
 
-    Использует payload токена для поиска пользователя в базе данных через репозиторий.
-    Dependency `repo` предоставляет экземпляр UserRepository с доступной сессией базы данных.
+    Идентификатор берётся из claim `sub`, имя пользователя — из `username`.
+    Подпись токена уже проверена в `get_current_token_payload`.
 
     Args:
-        repo (UserRepository): Репозиторий пользователей для работы с базой данных.
         payload (dict): Декодированный payload JWT-токена.
 
     Returns:
-        UserModels: Объект пользователя из базы данных, соответствующий токену.
+        UserPrincipal: Идентификатор и имя текущего пользователя.
 
     Raises:
-        HTTPException: Статус 404, если пользователь с указанным username не найден в базе данных.
+        HTTPException: 401 — если в токене нет корректных `sub` и `username`.
     """
-    username = payload.get("username")
-    user = await repo.find_by_username(username)
-    if user:
-        return user
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пользователь не найден")
+    try:
+        return UserPrincipal(id=int(payload["sub"]), username=payload["username"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Не валидный токен"
+        )
+
+
+async def get_current_auth_users(
+    repo: UserRepository = Depends(get_user_read_repo),
+    principal: UserPrincipal = Depends(get_token_principal),
+) -> UserPrincipal:
+    """
+    Получает текущего аутентифицированного пользователя по JWT-токену с проверкой в БД.
+
+    Используется в режиме `auth_mode="database"`. Пользователь ищется по id
+    из claim `sub`; при включённом кэше (`user_cache_ttl_seconds > 0`)
+    результат переиспользуется, пока запись не истекла или не была сброшена.
+
+    Args:
+        repo (UserRepository): Репозиторий пользователей для работы с базой данных.
+        principal (UserPrincipal): Пользователь, собранный из claims токена.
+
+    Returns:
+        UserPrincipal: Пользователь из базы данных, соответствующий токену.
+
+    Raises:
+        HTTPException: Статус 404, если пользователь с указанным id не найден в базе данных.
+    """
+    cached = user_cache.get(principal.id)
+    if cached is not None:
+        return cached
+
+    user = await repo.find_by_id(principal.id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пользователь не найден")
+
+    current_user = UserPrincipal(id=user.id, username=user.username)
+    user_cache.set(user.id, current_user, expires_at=time.time() + settings.user_cache_ttl_seconds)
+    return current_user
+
+
+get_current_principal = (
+    get_current_auth_users if settings.auth_mode == "database" else get_token_principal
+)
 
 
 async def get_current_is_user(
-    current_user: UserModels = Depends(get_current_auth_users)
-) -> UserModels:
+    current_user: UserPrincipal = Depends(get_current_principal)
+) -> UserPrincipal:
     """
     Проверяет, что текущий пользователь авторизован и имеет доступ.
 
     Используется как зависимость для защищённых эндпоинтов.
 
     Args:
-        current_user (UserModels): Текущий аутентифицированный пользователь.
+        current_user (UserPrincipal): Текущий аутентифицированный пользователь.
 
     Returns:
-        UserModels: Подтверждённый пользователь.
+        UserPrincipal: Подтверждённый пользователь.
 
     Raises:
         HTTPException: 403 — если у пользователя недостаточно прав.
@@ -99,6 +152,7 @@ async def validate_auth_user(
     repo: UserRepository,
     username: str = Form(),
     password: str = Form(),
+    write_repo: UserRepository | None = None,
 ):
     """
     Валидирует пользователя при аутентификации через форму.
@@ -107,10 +161,17 @@ async def validate_auth_user(
     и корректность переданного пароля путём сравнения с хэшированным паролем.
     Для работы с базой используется репозиторий пользователей `repo`.
 
+    Если пароль верен, а схема или стоимость его хеша отличаются от заданных
+    в настройках, хеш пересчитывается из известного теперь пароля и
+    сохраняется через `write_repo`. Так пользователи переходят на новые
+    параметры хеширования постепенно, при обычном входе.
+
     Args:
         repo (UserRepository): Репозиторий пользователей для работы с базой данных.
         username (str): Имя пользователя, введённое в форме.
         password (str): Пароль пользователя, введённый в форме.
+        write_repo (UserRepository | None): Репозиторий на сессии записи для пересчёта
+            хеша; если не задан, хеш не пересчитывается.
 
     Returns:
         UserModels: Объект пользователя из базы данных при успешной аутентификации.
@@ -127,13 +188,36 @@ async def validate_auth_user(
     if not user:
         raise unauth_exc
 
-    if validate_password(
+    if not await password_hasher.verify(
         password=password,
         hashed_password=user.password,
     ):
-        return user
-    else:
         raise unauth_exc
 
+    if write_repo is not None and settings.password_rehash_on_login and needs_rehash(user.password):
+        await rehash_password(write_repo, user, password)
+    return user
+
+
+async def rehash_password(write_repo: UserRepository, user, password: str) -> None:
+    """
+    Пересчитывает хеш пароля пользователя с текущими параметрами.
+
+    Пересчёт необязателен для входа: если пул хеширования перегружен,
+    он откладывается до следующего входа.
+
+    Args:
+        write_repo (UserRepository): Репозиторий на сессии записи.
+        user (UserModels): Пользователь, пароль которого только что проверен.
+        password (str): Пароль в открытом виде.
+    """
+    try:
+        new_password = await password_hasher.hash(password)
+    except PasswordHasherOverloadedError:
+        logger.warning(f"Пересчёт хеша пароля пользователя {user.id} отложен: пул хеширования перегружен")
+        return
+    if await write_repo.update_password(user.id, user.password, new_password):
+        logger.info(f"Хеш пароля пользователя {user.id} пересчитан с текущими параметрами")
+
 
 
@@ -2,12 +2,13 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.database.database import database
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
 from backend.app.repositories.tasks import TaskRepository
 from backend.app.repositories.users import UserRepository
 
 
 def get_user_repo(
-        session: AsyncSession = Depends(database.get_session),
+        session: AsyncSession = Depends(database.get_session, scope="function"),
 ) -> UserRepository:
     """
     Создаёт и возвращает экземпляр UserRepository с переданной сессией БД.
@@ -16,7 +17,7 @@ def get_user_repo(
     где нужен доступ к репозиторию пользователей.
 
     Args:
-        session (AsyncSession): Асинхронная сессия SQLAlchemy, предоставляемая через Depends.
+        session (AsyncSession): Сессия-единица работы запроса, предоставляемая через Depends.
 
     Returns:
         UserRepository: Экземпляр репозитория пользователей, привязанный к сессии.
@@ -25,7 +26,7 @@ def get_user_repo(
 
 
 def get_task_repo(
-        session: AsyncSession = Depends(database.get_session),
+        session: AsyncSession = Depends(database.get_session, scope="function"),
 ) -> TaskRepository:
     """
     Создаёт и возвращает экземпляр TaskRepository с переданной сессией БД.
@@ -34,10 +35,57 @@ def get_task_repo(
     где нужен доступ к репозиторию задач.
 
     Args:
-        session (AsyncSession): Асинхронная сессия SQLAlchemy, предоставляемая через Depends.
+        session (AsyncSession): Сессия-единица работы запроса, предоставляемая через Depends.
 
     Returns:
         TaskRepository: Экземпляр репозитория задач, привязанный к сессии.
     """
     return TaskRepository(session)
 
+
+def get_refresh_token_repo(
+        session: AsyncSession = Depends(database.get_session, scope="function"),
+) -> RefreshTokenRepository:
+    """
+    Создаёт и возвращает экземпляр RefreshTokenRepository с переданной сессией БД.
+
+    Фабрика сессий передаётся для отзыва сессии входа, который должен
+    сохраниться, даже если запрос завершится ошибкой.
+
+    Args:
+        session (AsyncSession): Сессия-единица работы запроса, предоставляемая через Depends.
+
+    Returns:
+        RefreshTokenRepository: Экземпляр репозитория refresh-токенов, привязанный к сессии.
+    """
+    return RefreshTokenRepository(session, database.session_factory)
+
+
+def get_user_read_repo(
+        session: AsyncSession = Depends(database.get_read_session, scope="function"),
+) -> UserRepository:
+    """
+    Создаёт UserRepository для операций, которые только читают данные.
+
+    Args:
+        session (AsyncSession): Сессия в режиме AUTOCOMMIT, предоставляемая через Depends.
+
+    Returns:
+        UserRepository: Экземпляр репозитория пользователей, привязанный к сессии чтения.
+    """
+    return UserRepository(session)
+
+
+def get_task_read_repo(
+        session: AsyncSession = Depends(database.get_read_session, scope="function"),
+) -> TaskRepository:
+    """
+    Создаёт TaskRepository для операций, которые только читают данные.
+
+    Args:
+        session (AsyncSession): Сессия в режиме AUTOCOMMIT, предоставляемая через Depends.
+
+    Returns:
+        TaskRepository: Экземпляр репозитория задач, привязанный к сессии чтения.
+    """
+    return TaskRepository(session)
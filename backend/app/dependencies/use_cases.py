@@ -1,43 +1,105 @@
 from fastapi import Depends
 
-from backend.app.dependencies.repositories import get_user_repo, get_task_repo
+from backend.app.config import settings
+from backend.app.core.events import task_events
+from backend.app.core.login_limiter import login_limiter
+from backend.app.core.refresh_tokens import revoked_sessions
+from backend.app.core.task_cache import task_list_cache
+from backend.app.database.database import database
+from backend.app.dependencies.repositories import (
+    get_user_repo,
+    get_task_repo,
+    get_user_read_repo,
+    get_task_read_repo,
+    get_refresh_token_repo,
+)
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
 from backend.app.repositories.tasks import TaskRepository
 from backend.app.repositories.users import UserRepository
 from backend.app.use_case.auth_user import AuthUserUseCase
+from backend.app.use_case.batch_change_tasks_state import BatchChangeTasksStateUseCase
+from backend.app.use_case.batch_create_tasks import BatchCreateTasksUseCase
+from backend.app.use_case.batch_delete_tasks import BatchDeleteTasksUseCase
 from backend.app.use_case.create_task import CreateTaskUseCase
 from backend.app.use_case.create_user import CreateUserUseCase
 from backend.app.use_case.get_list_tasks import GetListTasksUseCase
 from backend.app.use_case.change_task_state import ChangeTaskStateUseCase
 from backend.app.use_case.delete_task import DeleteTaskUseCase
+from backend.app.use_case.export_tasks import ExportTasksUseCase
+from backend.app.use_case.import_tasks import ImportTasksUseCase
+from backend.app.use_case.logout_user import LogoutUserUseCase
+from backend.app.use_case.refresh_tokens import RefreshTokensUseCase
 
 
-def get_create_user_use_case(repo: UserRepository = Depends(get_user_repo)) -> CreateUserUseCase:
+def get_create_user_use_case(
+        repo: UserRepository = Depends(get_user_repo),
+        read_repo: UserRepository = Depends(get_user_read_repo),
+) -> CreateUserUseCase:
     """
     Создаёт и возвращает экземпляр use-case для регистрации пользователя.
 
     Args:
         repo (UserRepository): Репозиторий пользователей, предоставленный через Depends.
+        read_repo (UserRepository): Репозиторий пользователей на сессии чтения
+            для проверки занятости username и email.
 
     Returns:
         CreateUserUseCase: Use-case для создания нового пользователя.
     """
-    return CreateUserUseCase(repo)
+    return CreateUserUseCase(repo, read_repo)
 
 
-def get_auth_user_use_case(repo: UserRepository = Depends(get_user_repo)) -> AuthUserUseCase:
+def get_auth_user_use_case(
+        repo: UserRepository = Depends(get_user_read_repo),
+        tokens: RefreshTokenRepository = Depends(get_refresh_token_repo),
+        write_repo: UserRepository = Depends(get_user_repo),
+) -> AuthUserUseCase:
     """
     Создаёт и возвращает экземпляр use-case для аутентификации пользователя.
 
     Args:
         repo (UserRepository): Репозиторий пользователей, предоставленный через Depends.
+        tokens (RefreshTokenRepository): Репозиторий refresh-токенов, предоставленный через Depends.
+        write_repo (UserRepository): Репозиторий пользователей на сессии записи
+            для пересчёта устаревших хешей паролей.
 
     Returns:
         AuthUserUseCase: Use-case для аутентификации пользователя.
     """
-    return AuthUserUseCase(repo)
+    return AuthUserUseCase(repo, login_limiter, tokens, write_repo)
 
 
-def get_list_tasks_use_case(repo: TaskRepository = Depends(get_task_repo)):
+def get_refresh_tokens_use_case(
+        repo: RefreshTokenRepository = Depends(get_refresh_token_repo),
+) -> RefreshTokensUseCase:
+    """
+    Создаёт и возвращает экземпляр use-case для обновления токенов.
+
+    Args:
+        repo (RefreshTokenRepository): Репозиторий refresh-токенов, предоставленный через Depends.
+
+    Returns:
+        RefreshTokensUseCase: Use-case для обмена refresh-токена на новую пару токенов.
+    """
+    return RefreshTokensUseCase(repo, revoked_sessions, settings.refresh_token_reuse_grace_seconds)
+
+
+def get_logout_user_use_case(
+        repo: RefreshTokenRepository = Depends(get_refresh_token_repo),
+) -> LogoutUserUseCase:
+    """
+    Создаёт и возвращает экземпляр use-case для выхода пользователя.
+
+    Args:
+        repo (RefreshTokenRepository): Репозиторий refresh-токенов, предоставленный через Depends.
+
+    Returns:
+        LogoutUserUseCase: Use-case для завершения сессии входа.
+    """
+    return LogoutUserUseCase(repo, revoked_sessions)
+
+
+def get_list_tasks_use_case(repo: TaskRepository = Depends(get_task_read_repo)):
     """
     Создаёт и возвращает экземпляр use-case для получения списка задач.
 
@@ -47,7 +109,20 @@ def get_list_tasks_use_case(repo: TaskRepository = Depends(get_task_repo)):
     Returns:
         GetListTasksUseCase: Use-case для получения списка задач пользователя.
     """
-    return GetListTasksUseCase(repo)
+    return GetListTasksUseCase(repo, task_list_cache)
+
+
+def get_export_tasks_use_case() -> ExportTasksUseCase:
+    """
+    Создаёт и возвращает экземпляр use-case для выгрузки задач.
+
+    Use-case сам открывает сессию на время отправки ответа, поэтому
+    репозиторий через Depends не передаётся.
+
+    Returns:
+        ExportTasksUseCase: Use-case для потоковой выгрузки задач пользователя.
+    """
+    return ExportTasksUseCase(database.snapshot_session, settings.tasks_export_batch_size)
 
 
 def get_create_task_use_case(repo: TaskRepository = Depends(get_task_repo)):
@@ -60,7 +135,7 @@ def get_create_task_use_case(repo: TaskRepository = Depends(get_task_repo)):
     Returns:
         CreateTaskUseCase: Use-case для создания новой задачи.
     """
-    return CreateTaskUseCase(repo)
+    return CreateTaskUseCase(repo, task_events)
 
 
 def get_change_task_state_use_case(repo: TaskRepository = Depends(get_task_repo)):
@@ -73,7 +148,7 @@ def get_change_task_state_use_case(repo: TaskRepository = Depends(get_task_repo)
     Returns:
         ChangeTaskStateUseCase: Use-case для изменения состояния задачи.
     """
-    return ChangeTaskStateUseCase(repo)
+    return ChangeTaskStateUseCase(repo, task_events)
 
 
 def get_delete_task_use_case(repo: TaskRepository = Depends(get_task_repo)):
@@ -86,4 +161,62 @@ def get_delete_task_use_case(repo: TaskRepository = Depends(get_task_repo)):
     Returns:
         DeleteTaskUseCase: Use-case для удаления задачи.
     """
-    return DeleteTaskUseCase(repo)
+    return DeleteTaskUseCase(repo, task_events)
+
+
+def get_batch_create_tasks_use_case(repo: TaskRepository = Depends(get_task_repo)):
+    """
+    Создаёт и возвращает экземпляр use-case для пакетного создания задач.
+
+    Args:
+        repo (TaskRepository): Репозиторий задач, предоставленный через Depends.
+
+    Returns:
+        BatchCreateTasksUseCase: Use-case для пакетного создания задач.
+    """
+    return BatchCreateTasksUseCase(repo, task_events)
+
+
+def get_batch_change_tasks_state_use_case(repo: TaskRepository = Depends(get_task_repo)):
+    """
+    Создаёт и возвращает экземпляр use-case для пакетного изменения статуса задач.
+
+    Args:
+        repo (TaskRepository): Репозиторий задач, предоставленный через Depends.
+
+    Returns:
+        BatchChangeTasksStateUseCase: Use-case для пакетного изменения состояния задач.
+    """
+    return BatchChangeTasksStateUseCase(repo, task_events)
+
+
+def get_batch_delete_tasks_use_case(repo: TaskRepository = Depends(get_task_repo)):
+    """
+    Создаёт и возвращает экземпляр use-case для пакетного удаления задач.
+
+    Args:
+        repo (TaskRepository): Репозиторий задач, предоставленный через Depends.
+
+    Returns:
+        BatchDeleteTasksUseCase: Use-case для пакетного удаления задач.
+    """
+    return BatchDeleteTasksUseCase(repo, task_events)
+
+
+def get_import_tasks_use_case(repo: TaskRepository = Depends(get_task_repo)):
+    """
+    Создаёт и возвращает экземпляр use-case для импорта задач.
+
+    Args:
+        repo (TaskRepository): Репозиторий задач, предоставленный через Depends.
+
+    Returns:
+        ImportTasksUseCase: Use-case для потокового импорта задач.
+    """
+    return ImportTasksUseCase(
+        repo,
+        task_events,
+        batch_size=settings.tasks_import_batch_size,
+        max_errors=settings.tasks_import_max_errors,
+        max_line_bytes=settings.tasks_import_max_line_bytes,
+    )
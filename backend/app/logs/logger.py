@@ -1,35 +1,183 @@
+import atexit
+import json
 import logging
+import queue
+import random
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+from backend.app.config import settings
+
 """Модуль логгирования приложения.
 
-Создает логгер `app_logger`, который:
-- выводит сообщения уровня INFO и выше в консоль,
-- записывает сообщения уровня DEBUG и выше в файл logs/app.log."""
+Создает логгер `app_logger`, записи которого не пишутся в файл и консоль
+в потоке event loop: `QueueHandler` только кладёт запись в очередь, а
+`QueueListener` в фоновом потоке форматирует её и отправляет в обработчики:
+- консоль — уровень `log_level` и выше,
+- файл logs/app.log с ротацией по размеру — уровень `log_file_level` и выше
+  (если включён `log_file_enabled`; при нескольких воркерах файл не пишется,
+  чтобы процессы не ротировали один и тот же файл).
+
+Записи выводятся в JSON (по одной на строку) или текстом, см. `log_format`.
+К каждой записи добавляется идентификатор HTTP-запроса (`request_id`).
+DEBUG-записи частых событий можно прореживать по имени логгера
+(`log_debug_sample_rates`), например `app_logger.database`."""
 
 LOG_DIR = Path(__file__).parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
 LOG_FILE = LOG_DIR / "app.log"
 
-logger = logging.getLogger("app_logger")
-logger.setLevel(logging.DEBUG)
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """Добавляет к записи идентификатор текущего HTTP-запроса."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """
+    Пропускает только долю DEBUG-записей, заданную для логгера.
+
+    Записи уровня INFO и выше не прореживаются.
+
+    Attributes:
+        default_rate (float): Доля DEBUG-записей для логгеров без своей настройки.
+        rates (dict[str, float]): Доля DEBUG-записей по имени логгера.
+    """
+
+    def __init__(self, default_rate: float, rates: dict[str, float]):
+        super().__init__()
+        self.default_rate = default_rate
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self.rates.get(record.name, self.default_rate)
+        return rate >= 1 or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Форматирует запись в одну строку JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "module": record.module,
+            "line": record.lineno,
+        }
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
 
-formatter = logging.Formatter(
-    "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
+
+class AppQueueHandler(QueueHandler):
+    """
+    QueueHandler, который передаёт в очередь уже подготовленную запись.
+
+    Сообщение и текст исключения вычисляются в вызывающем потоке, а форматирование
+    (JSON или текст) выполняется обработчиками в потоке QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared = logging.makeLogRecord(record.__dict__)
+        prepared.msg = message
+        prepared.args = None
+        prepared.exc_info = None
+        prepared.exc_text = exc_text
+        return prepared
+
+
+if settings.log_format == "json":
+    formatter = JsonFormatter()
+else:
+    formatter = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s [%(request_id)s]: %(message)s"
+    )
 
 console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
+console_handler.setLevel(settings.log_level)
 console_handler.setFormatter(formatter)
 
-file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(formatter)
+handlers: list[logging.Handler] = [console_handler]
+
+if settings.log_file_enabled:
+    file_handler = RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=settings.log_max_bytes,
+        backupCount=settings.log_backup_count,
+        encoding="utf-8",
+    )
+    file_handler.setLevel(settings.log_file_level)
+    file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
+
+log_queue: queue.Queue = queue.Queue(-1)
+queue_handler = AppQueueHandler(log_queue)
+queue_handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rate, settings.log_debug_sample_rates))
+queue_handler.addFilter(RequestContextFilter())
+
+listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+logger = logging.getLogger("app_logger")
+logger.setLevel(min(handler.level for handler in handlers))
 
 if not logger.hasHandlers():
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+class RequestIdMiddleware:
+    """
+    ASGI-middleware, связывающее записи лога с HTTP-запросом.
+
+    Берёт идентификатор из заголовка `X-Request-ID` или создаёт новый,
+    сохраняет его в `request_id_var` на время запроса и возвращает
+    в заголовке ответа `X-Request-ID`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
 
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-request-id", request_id.encode("latin-1")),
+                ]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
@@ -1,14 +1,36 @@
+import math
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 from backend.app.config import settings
+from backend.app.core.events import task_events
+from backend.app.core.internal_server import internal_server
+from backend.app.core.key_manager import key_manager
+from backend.app.core.login_limiter import LoginRateLimitedError
+from backend.app.core.metrics import MetricsMiddleware
+from backend.app.core.password_hasher import password_hasher, PasswordHasherOverloadedError
+from backend.app.core.refresh_tokens import revoked_sessions
+from backend.app.core.task_cache import task_list_cache
+from backend.app.core.user_cache import invalidate_on_commit as invalidate_users_on_commit
 from backend.app.database.database import database
-from backend.app.logs.logger import logger
-from fastapi import FastAPI
+from backend.app.database.migrations import SchemaOutdatedError
+from backend.app.logs.logger import logger, RequestIdMiddleware
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 from backend.app.api.auth import router as router_auth
+# Модули регистрируют служебные эндпоинты в internal_server.
+from backend.app.api import metrics, system  # noqa: F401
 from backend.app.api.tasks import router as router_tasks
 from fastapi.middleware.cors import CORSMiddleware
 
 
+async def load_revoked_sessions(since: datetime) -> list[tuple[str, datetime]]:
+    """Читает из основной БД сессии, отозванные после `since`."""
+    async with database.session_factory() as session:
+        return await RefreshTokenRepository(session).revoked_since(since)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -16,28 +38,86 @@ async def lifespan(app: FastAPI):
 
     Используется для:
     - Логирования запуска и завершения сервера
-    - Создания таблиц в базе данных при старте
-    - Генерация ключей при их отсутствии
+    - Проверки версии схемы БД (миграции применяются командой
+      `python -m backend.app.manage migrate`)
+    - Генерации ключей при их отсутствии и их предварительной загрузки в память
+    - Запуска и остановки шины событий задач
+    - Синхронизации списка отозванных сессий с БД
+    - Запуска служебного сервера воркера (`/system/stats/`, `/metrics`)
 
     Args:
         app (FastAPI): Экземпляр FastAPI приложения.
     """
     try:
         logger.info("Запуск сервера")
-        settings.generate_keys_if_not_exist()
-        await database.create_table()
-        logger.info("Таблицы созданы")
+        key_manager.generate_if_missing(settings.algorithm)
+        key_manager.load()
+        revision = await database.check_schema()
+        logger.info(f"Версия схемы БД: {revision}")
+        await task_events.start()
+        await revoked_sessions.start(load_revoked_sessions)
+        await internal_server.start()
         yield
+        await internal_server.stop()
+        await revoked_sessions.stop()
+        await task_events.stop()
+        password_hasher.shutdown()
         logger.info("Выключение сервера")
     except ConnectionRefusedError as e:
         logger.warning(f"Не удалось подключиться к БД: {e}")
+    except SchemaOutdatedError as e:
+        logger.error(str(e))
+        raise
+
 
+database.add_commit_listener(task_list_cache.on_commit)
+database.add_commit_listener(invalidate_users_on_commit)
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(router_auth)
 app.include_router(router_tasks)
 
+
+@app.exception_handler(PasswordHasherOverloadedError)
+async def password_hasher_overloaded_handler(request: Request, exc: PasswordHasherOverloadedError):
+    """
+    Быстро отклоняет запрос, если пул хеширования паролей перегружен.
+
+    Args:
+        request (Request): Входящий запрос.
+        exc (PasswordHasherOverloadedError): Исключение переполнения очереди.
+
+    Returns:
+        JSONResponse: Ответ 503 с заголовком Retry-After.
+    """
+    logger.warning("Пул хеширования паролей перегружен, запрос отклонён")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Сервис временно перегружен, повторите попытку позже"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(LoginRateLimitedError)
+async def login_rate_limited_handler(request: Request, exc: LoginRateLimitedError):
+    """
+    Отклоняет попытку входа, превысившую лимит, без проверки пароля.
+
+    Args:
+        request (Request): Входящий запрос.
+        exc (LoginRateLimitedError): Исключение ограничителя входа.
+
+    Returns:
+        JSONResponse: Ответ 429 с заголовком Retry-After.
+    """
+    logger.warning("Слишком много попыток входа, запрос отклонён")
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Слишком много попыток входа, повторите попытку позже"},
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))},
+    )
+
 origins = [
     "http://127.0.0.1:5173",
     "http://localhost:5173",
@@ -49,4 +129,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestIdMiddleware)
@@ -0,0 +1,160 @@
+"""Разовые служебные команды, которые выполняются отдельно от запуска приложения.
+
+Команды:
+    migrate        — применить недостающие миграции схемы БД;
+    status         — показать версию схемы БД и последнюю известную миграцию;
+    generate-keys  — сгенерировать ключи JWT, если их нет;
+    rotate-keys    — заменить ключ подписи JWT, сохранив старый для проверки;
+    prune-tokens   — удалить истёкшие и давно отозванные refresh-токены;
+    calibrate-password-hash — подобрать стоимость хеша пароля под бюджет задержки.
+
+Запуск из корня репозитория:
+    python -m backend.app.manage migrate
+    python -m backend.app.manage status
+    python -m backend.app.manage generate-keys
+    python -m backend.app.manage rotate-keys --algorithm EdDSA
+    python -m backend.app.manage prune-tokens
+    python -m backend.app.manage calibrate-password-hash --budget-ms 250
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.app.config import settings
+from backend.app.core.key_manager import ALGORITHMS, key_manager
+from backend.app.core.password_utils import argon2_hash, bcrypt_hash
+from backend.app.database import migrations
+from backend.app.database.database import database
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
+
+
+async def migrate() -> None:
+    try:
+        applied = await database.migrate()
+    finally:
+        await database.engine.dispose()
+    if applied:
+        print(f"Применены миграции: {', '.join(map(str, applied))}")
+    else:
+        print(f"Схема БД актуальна (версия {migrations.LATEST_REVISION})")
+
+
+async def status() -> None:
+    try:
+        async with database.engine.connect() as conn:
+            current = await migrations.current_revision(conn)
+    finally:
+        await database.engine.dispose()
+    print(f"Версия схемы БД: {current}, последняя миграция: {migrations.LATEST_REVISION}")
+    for migration in migrations.MIGRATIONS:
+        mark = "x" if migration.revision <= current else " "
+        print(f"  [{mark}] {migration.revision:04d} {migration.description}")
+
+
+async def prune_tokens() -> None:
+    # Отозванные токены хранятся, пока могут быть живы access-токены их сессий.
+    revoked_before = datetime.now(timezone.utc) - timedelta(minutes=settings.access_token_expire_minutes)
+    try:
+        async with database.session_factory() as session:
+            deleted = await RefreshTokenRepository(session).delete_expired(revoked_before)
+            await session.commit()
+    finally:
+        await database.engine.dispose()
+    print(f"Удалено refresh-токенов: {deleted}")
+
+
+def generate_keys(algorithm: str) -> None:
+    if not key_manager.generate_if_missing(algorithm):
+        print(f"Ключи уже существуют:\n  {settings.private_key_path}\n  {settings.public_key_path}")
+
+
+def rotate_keys(algorithm: str) -> None:
+    # Выведенный ключ нужен, пока живы подписанные им access-токены; запас — на интервал перечитывания ключей.
+    retention_seconds = settings.access_token_expire_minutes * 60 + settings.jwt_key_reload_interval
+    kid = key_manager.rotate(algorithm, retention_seconds)
+    print(f"Новый ключ {algorithm} (kid={kid}), воркеры перейдут на него в течение "
+          f"{settings.jwt_key_reload_interval} с")
+
+
+def calibrate_password_hash(scheme: str, budget_ms: float, samples: int) -> None:
+    # Стоимость растёт, пока медианное время одного хеша укладывается в бюджет.
+    if scheme == "argon2id":
+        name, costs, minimum = "ARGON2_TIME_COST", range(1, 21), 1
+        memory, parallelism = settings.argon2_memory_cost_kib, settings.argon2_parallelism
+
+        def hash_with(cost):
+            argon2_hash("calibration-password", cost, memory, parallelism)
+
+        print(f"argon2id, память {memory} КиБ, потоков {parallelism}")
+    else:
+        name, costs, minimum = "BCRYPT_ROUNDS", range(10, 21), 10
+
+        def hash_with(cost):
+            bcrypt_hash("calibration-password", cost)
+
+    chosen = None
+    for cost in costs:
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            hash_with(cost)
+            timings.append((time.perf_counter() - started) * 1000)
+        median_ms = statistics.median(timings)
+        print(f"  {name}={cost}: {median_ms:.1f} мс, {1000 / median_ms:.1f} хешей/с на поток")
+        if median_ms > budget_ms:
+            break
+        chosen = cost
+
+    if chosen is None:
+        print(f"Даже минимальная стоимость {minimum} не укладывается в {budget_ms} мс, используйте её: {name}={minimum}")
+    else:
+        print(f"Рекомендуемое значение для бюджета {budget_ms} мс: {name}={chosen}")
+    print("Хеши с прежними параметрами пересчитываются при входе пользователей (PASSWORD_REHASH_ON_LOGIN).")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Служебные команды TaskApp")
+    parser.add_argument(
+        "command",
+        choices=("migrate", "status", "generate-keys", "rotate-keys", "prune-tokens", "calibrate-password-hash"),
+    )
+    parser.add_argument(
+        "--algorithm",
+        choices=ALGORITHMS,
+        default=settings.algorithm,
+        help="Алгоритм новых ключей JWT (generate-keys, rotate-keys)",
+    )
+    parser.add_argument(
+        "--scheme",
+        choices=("bcrypt", "argon2id"),
+        default=settings.password_hash_scheme,
+        help="Схема хеширования паролей (calibrate-password-hash)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=250,
+        help="Допустимое время одного хеша в миллисекундах (calibrate-password-hash)",
+    )
+    parser.add_argument("--samples", type=int, default=5, help="Замеров на каждое значение стоимости")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        asyncio.run(migrate())
+    elif args.command == "status":
+        asyncio.run(status())
+    elif args.command == "prune-tokens":
+        asyncio.run(prune_tokens())
+    elif args.command == "calibrate-password-hash":
+        calibrate_password_hash(args.scheme, args.budget_ms, args.samples)
+    elif args.command == "rotate-keys":
+        rotate_keys(args.algorithm)
+    else:
+        generate_keys(args.algorithm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.app.database.models import RefreshTokenModels, UserModels
+
+
+class RefreshTokenRepository:
+    """
+    Репозиторий refresh-токенов (RefreshTokenModels).
+
+    Как и остальные репозитории, изменения не фиксирует: COMMIT выполняет
+    `Database.get_session` в конце запроса. Исключение — `revoke_unused_now`,
+    который работает в собственной транзакции.
+
+    Attributes:
+        model: Ссылка на ORM-модель RefreshTokenModels.
+        session (AsyncSession): Асинхронная сессия для работы с базой данных.
+        session_factory (async_sessionmaker | None): Фабрика сессий для записей,
+            которые должны сохраниться независимо от транзакции запроса.
+    """
+
+    model = RefreshTokenModels
+
+    def __init__(self, session: AsyncSession, session_factory: async_sessionmaker | None = None):
+        """
+        Инициализация репозитория.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy для работы с БД.
+            session_factory (async_sessionmaker | None): Фабрика сессий для `revoke_unused_now`.
+        """
+        self.session = session
+        self.session_factory = session_factory
+
+    async def add(self, user_id: int, family_id: str, token_hash: str, expires_at: datetime) -> None:
+        """
+        Сохраняет новый refresh-токен. INSERT выполняется при COMMIT.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            family_id (str): Идентификатор сессии входа.
+            token_hash (str): SHA-256 токена.
+            expires_at (datetime): Момент истечения токена.
+        """
+        self.session.add(self.model(
+            user_id=user_id,
+            family_id=family_id,
+            token_hash=token_hash,
+            expires_at=expires_at,
+        ))
+
+    async def find_for_rotation(self, token_hash: str) -> tuple[RefreshTokenModels, str] | None:
+        """
+        Находит неистёкший токен и блокирует его строку до конца транзакции.
+
+        Блокировка (`SELECT ... FOR UPDATE`) не даёт двум одновременным
+        запросам обменять один и тот же токен.
+
+        Args:
+            token_hash (str): SHA-256 токена.
+
+        Returns:
+            tuple[RefreshTokenModels, str] | None: Токен и имя его владельца
+                или None, если токен не найден или истёк.
+        """
+        query = (
+            select(self.model, UserModels.username)
+            .join(UserModels, UserModels.id == self.model.user_id)
+            .where(
+                self.model.token_hash == token_hash,
+                self.model.expires_at > datetime.now(timezone.utc),
+            )
+            .with_for_update(of=self.model)
+        )
+        res = await self.session.execute(query)
+        row = res.one_or_none()
+        return (row[0], row[1]) if row else None
+
+    async def find_family_id(self, token_hash: str) -> str | None:
+        """
+        Возвращает идентификатор сессии токена.
+
+        Args:
+            token_hash (str): SHA-256 токена.
+
+        Returns:
+            str | None: Идентификатор сессии или None, если токен не найден.
+        """
+        res = await self.session.execute(select(self.model.family_id).where(self.model.token_hash == token_hash))
+        return res.scalar_one_or_none()
+
+    async def revoke_family(self, family_id: str) -> int:
+        """
+        Отзывает все токены сессии.
+
+        Args:
+            family_id (str): Идентификатор сессии.
+
+        Returns:
+            int: Количество отозванных токенов.
+        """
+        res = await self.session.execute(
+            update(self.model)
+            .where(self.model.family_id == family_id, self.model.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+        )
+        return res.rowcount
+
+    async def revoke_unused_now(self, family_id: str) -> int:
+        """
+        Отзывает ещё не обменянные токены сессии в отдельной транзакции.
+
+        Отзыв фиксируется сразу и сохраняется, даже если транзакция запроса
+        откатится. Использованные токены не затрагиваются: строку предъявленного
+        токена держит блокировка `find_for_rotation` в транзакции запроса,
+        а обменять использованный токен всё равно нельзя.
+
+        Args:
+            family_id (str): Идентификатор сессии.
+
+        Returns:
+            int: Количество отозванных токенов.
+        """
+        async with self.session_factory() as session, session.begin():
+            res = await session.execute(
+                update(self.model)
+                .where(
+                    self.model.family_id == family_id,
+                    self.model.revoked_at.is_(None),
+                    self.model.used_at.is_(None),
+                )
+                .values(revoked_at=func.now())
+            )
+        return res.rowcount
+
+    async def revoked_since(self, since: datetime) -> list[tuple[str, datetime]]:
+        """
+        Возвращает сессии, отозванные после указанного момента.
+
+        Args:
+            since (datetime): Начало интервала.
+
+        Returns:
+            list[tuple[str, datetime]]: Пары (идентификатор сессии, время отзыва).
+        """
+        res = await self.session.execute(
+            select(self.model.family_id, func.max(self.model.revoked_at))
+            .where(self.model.revoked_at > since)
+            .group_by(self.model.family_id)
+        )
+        return [(family_id, revoked_at) for family_id, revoked_at in res.all()]
+
+    async def delete_expired(self, revoked_before: datetime) -> int:
+        """
+        Удаляет истёкшие токены и токены, отозванные раньше указанного момента.
+
+        Args:
+            revoked_before (datetime): Отозванные раньше этого момента токены удаляются.
+
+        Returns:
+            int: Количество удалённых токенов.
+        """
+        res = await self.session.execute(
+            delete(self.model).where(or_(
+                self.model.expires_at <= datetime.now(timezone.utc),
+                self.model.revoked_at < revoked_before,
+            ))
+        )
+        return res.rowcount
@@ -1,10 +1,11 @@
-from typing import Sequence
+from datetime import datetime
+from typing import AsyncIterator, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Row, select, update, delete, insert, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.database.models import TaskModels, UserModels
-from backend.app.schemas.task_schemas import TaskSchema
+from backend.app.database.models import TaskModels
+from backend.app.schemas.task_schemas import TaskSchema, TaskFilterSchema
 
 
 class TaskRepository:
@@ -12,6 +13,8 @@ class TaskRepository:
     Репозиторий для работы с задачами (TaskModels).
 
     Инкапсулирует все операции с базой данных по CRUD задач.
+    Изменения не фиксируются в репозитории: COMMIT выполняет
+    `Database.get_session` один раз в конце запроса.
 
     Attributes:
     model: Ссылка на ORM-модель TaskModels.
@@ -29,76 +32,290 @@ class TaskRepository:
         """
         self.session = session
 
-    async def get_tasks(self, current_user: UserModels) -> Sequence[TaskModels]:
+    def _mark_written(self, user_id: int) -> None:
         """
-        Получает список всех задач текущего пользователя.
+        Отмечает изменение задач пользователя.
+
+        Запоминает ключ, по которому после COMMIT сбрасывается кэш списка
+        задач (вместе с его версией и ETag) и включается read-your-writes.
+        Дополнительных запросов к БД не выполняет.
+
+        Args:
+            user_id (int): Идентификатор пользователя, чьи задачи изменились.
+        """
+        self.session.info.setdefault("written_keys", set()).add(("tasks", user_id))
+
+    async def get_tasks(
+            self,
+            user_id: int,
+            filters: TaskFilterSchema,
+            limit: int,
+            after: tuple[datetime, int] | None = None,
+    ) -> Sequence[Row]:
+        """
+        Получает страницу задач текущего пользователя.
+
+        Задачи упорядочены от новых к старым по (created_at, task_id).
+        Страница выбирается по ключу (keyset), а не через OFFSET, поэтому
+        время запроса не растёт с количеством задач пользователя и
+        опирается на индекс (user_id, created_at, task_id).
+        Выбираются только столбцы, без создания ORM-объектов и их
+        регистрации в identity map сессии.
 
         Args:
-            current_user (UserModels): Текущий пользователь, для которого ищем задачи.
+            user_id (int): Идентификатор пользователя, для которого ищем задачи.
+            filters (TaskFilterSchema): Фильтры по статусу и времени создания.
+            limit (int): Максимальное количество задач на странице.
+            after (tuple[datetime, int] | None): Позиция (created_at, task_id) последней
+                задачи предыдущей страницы.
 
         Returns:
-            Sequence[TaskModels]: Список задач пользователя.
+            Sequence[Row]: Строки (task_id, title, description, is_done, created_at, user_id).
         """
-        query = select(self.model).where(self.model.user_id == current_user.id)
-        res = await self.session.execute(query)
-        tasks = res.scalars().all()
-        return tasks
+        query = self._list_query(user_id, filters)
+        if after is not None:
+            query = query.where(tuple_(self.model.created_at, self.model.task_id) < tuple_(*after))
+        res = await self.session.execute(
+            query.limit(limit), bind_arguments={"sticky_key": ("tasks", user_id)}
+        )
+        return res.all()
 
-    async def get_task_by_id(self, task_id: int) -> TaskModels | None:
+    async def stream_tasks(
+            self,
+            user_id: int,
+            filters: TaskFilterSchema,
+            batch_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
         """
-        Получает задачу по её ID.
+        Читает все задачи пользователя через серверный курсор пачками.
+
+        В памяти одновременно находится не больше `batch_size` строк,
+        поэтому выгрузка не зависит от количества задач. Сессия должна
+        быть открыта в транзакции (см. `Database.snapshot_session`).
 
         Args:
-            task_id (int): Идентификатор задачи.
+            user_id (int): Идентификатор пользователя.
+            filters (TaskFilterSchema): Фильтры по статусу и времени создания.
+            batch_size (int): Количество строк в одной пачке.
 
-        Returns:
-            TaskModels | None: Задача с указанным ID или None, если не найдена.
+        Yields:
+            Sequence[Row]: Очередная пачка строк в порядке от новых задач к старым.
         """
-        query = select(self.model).where(self.model.task_id == task_id)
-        res = await self.session.execute(query)
-        return res.scalar_one_or_none()
+        res = await self.session.stream(
+            self._list_query(user_id, filters).execution_options(yield_per=batch_size),
+            bind_arguments={"sticky_key": ("tasks", user_id)},
+        )
+        async for rows in res.partitions():
+            yield rows
 
-    async def create_one_task(self, credentials: TaskSchema, current_user: UserModels):
+    def _list_query(self, user_id: int, filters: TaskFilterSchema):
+        """Строит запрос столбцов задач пользователя с фильтрами, от новых к старым."""
+        query = select(
+            self.model.task_id,
+            self.model.title,
+            self.model.description,
+            self.model.is_done,
+            self.model.created_at,
+            self.model.user_id,
+        ).where(self.model.user_id == user_id)
+        if filters.is_done is not None:
+            query = query.where(self.model.is_done == filters.is_done)
+        if filters.created_from is not None:
+            query = query.where(self.model.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(self.model.created_at < filters.created_to)
+        return query.order_by(
+            self.model.created_at.desc(),
+            self.model.task_id.desc(),
+        )
+
+    async def create_one_task(self, credentials: TaskSchema, user_id: int) -> int:
         """
         Создаёт новую задачу для текущего пользователя.
 
         Args:
             credentials: Объект с данными новой задачи (title, description).
-            current_user (UserModels): Пользователь, которому принадлежит задача.
+            user_id (int): Идентификатор пользователя, которому принадлежит задача.
 
+        Returns:
+            int: ID созданной задачи.
         """
         query = self.model(
             title=credentials.title,
             description=credentials.description,
-            user_id=current_user.id
+            user_id=user_id
         )
         self.session.add(query)
-        await self.session.commit()
+        await self.session.flush()
+        self._mark_written(user_id)
+        return query.task_id
+
+    async def create_tasks(self, items: Sequence[TaskSchema], user_id: int) -> list[int]:
+        """
+        Создаёт несколько задач пользователя одним многострочным INSERT.
+
+        Args:
+            items (Sequence[TaskSchema]): Данные новых задач (title, description).
+            user_id (int): Идентификатор пользователя, которому принадлежат задачи.
+
+        Returns:
+            list[int]: ID созданных задач в порядке `items`.
+        """
+        query = insert(self.model).returning(self.model.task_id, sort_by_parameter_order=True)
+        res = await self.session.execute(
+            query,
+            [
+                {
+                    "title": item.title,
+                    "description": item.description,
+                    "is_done": False,
+                    "user_id": user_id,
+                }
+                for item in items
+            ],
+        )
+        task_ids = list(res.scalars().all())
+        self._mark_written(user_id)
+        return task_ids
 
-    async def change_task(self, task_id: int, value: bool):
+    async def copy_tasks(self, items: Sequence[TaskSchema], user_id: int) -> None:
         """
-        Изменяет состояние выполнения задачи.
+        Загружает пачку задач пользователя через COPY.
+
+        С драйвером asyncpg строки передаются `copy_records_to_table` в
+        бинарном формате COPY — это быстрее многострочного INSERT и не
+        требует RETURNING. С другими драйверами используется многострочный
+        INSERT. Запись выполняется в текущей транзакции сессии.
+
+        Args:
+            items (Sequence[TaskSchema]): Данные новых задач (title, description).
+            user_id (int): Идентификатор пользователя, которому принадлежат задачи.
+        """
+        self._mark_written(user_id)
+        connection = await self.session.connection()
+        if connection.dialect.driver == "asyncpg":
+            # asyncpg-адаптер открывает транзакцию при первом запросе, а не при
+            # выдаче соединения; без него COPY через «сырое» соединение прошёл бы вне неё.
+            await self.session.execute(text("SELECT 1"))
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                self.model.__tablename__,
+                columns=["title", "description", "is_done", "user_id"],
+                records=[(item.title, item.description, False, user_id) for item in items],
+            )
+        else:
+            await self.session.execute(
+                insert(self.model),
+                [
+                    {
+                        "title": item.title,
+                        "description": item.description,
+                        "is_done": False,
+                        "user_id": user_id,
+                    }
+                    for item in items
+                ],
+            )
+
+    async def toggle_task(self, task_id: int, user_id: int) -> bool | None:
+        """
+        Атомарно переключает состояние выполнения задачи пользователя.
+
+        Выполняется одним запросом `UPDATE ... SET is_done = NOT is_done ... RETURNING`,
+        поэтому одновременные переключения не теряются, а задачи других
+        пользователей не затрагиваются.
 
         Args:
             task_id (int): Идентификатор задачи.
-            value (bool): Новое состояние (True — выполнено, False — не выполнено).
+            user_id (int): Идентификатор владельца задачи.
+
+        Returns:
+            bool | None: Новое состояние задачи или None, если задача не найдена
+                или принадлежит другому пользователю.
+        """
+        query = (
+            update(self.model)
+            .where(
+                self.model.task_id == task_id,
+                self.model.user_id == user_id,
+            )
+            .values(is_done=~self.model.is_done)
+            .returning(self.model.is_done)
+        )
+        res = await self.session.execute(query)
+        is_done = res.scalar_one_or_none()
+        if is_done is not None:
+            self._mark_written(user_id)
+        return is_done
+
+    async def toggle_tasks(self, task_ids: Sequence[int], user_id: int) -> dict[int, bool]:
+        """
+        Атомарно переключает состояние нескольких задач пользователя одним UPDATE.
+
+        Args:
+            task_ids (Sequence[int]): Идентификаторы задач.
+            user_id (int): Идентификатор владельца задач.
 
+        Returns:
+            dict[int, bool]: Новое состояние для каждой найденной задачи пользователя.
         """
         query = (
             update(self.model)
-            .where(self.model.task_id == task_id)
-            .values(is_done=value)
+            .where(
+                self.model.task_id.in_(set(task_ids)),
+                self.model.user_id == user_id,
+            )
+            .values(is_done=~self.model.is_done)
+            .returning(self.model.task_id, self.model.is_done)
+        )
+        res = await self.session.execute(query)
+        states = {task_id: is_done for task_id, is_done in res.all()}
+        if states:
+            self._mark_written(user_id)
+        return states
+
+    async def delete_tasks(self, task_ids: Sequence[int], user_id: int) -> set[int]:
+        """
+        Удаляет несколько задач пользователя одним DELETE.
+
+        Args:
+            task_ids (Sequence[int]): Идентификаторы задач.
+            user_id (int): Идентификатор владельца задач.
+
+        Returns:
+            set[int]: ID фактически удалённых задач.
+        """
+        query = (
+            delete(self.model)
+            .where(
+                self.model.task_id.in_(set(task_ids)),
+                self.model.user_id == user_id,
+            )
+            .returning(self.model.task_id)
         )
-        await self.session.execute(query)
-        await self.session.commit()
+        res = await self.session.execute(query)
+        deleted = set(res.scalars().all())
+        if deleted:
+            self._mark_written(user_id)
+        return deleted
 
-    async def delete_task_by_id(self, task_id: int):
+    async def delete_task_by_id(self, task_id: int, user_id: int) -> bool:
         """
-        Удаляет задачу по её ID.
+        Удаляет задачу по её ID, если она принадлежит пользователю.
 
         Args:
             task_id (int): Идентификатор задачи.
+            user_id (int): Идентификатор владельца задачи.
 
+        Returns:
+            bool: True, если задача была удалена.
         """
-        await self.session.execute(delete(self.model).where(self.model.task_id == task_id))
-        await self.session.commit()
+        res = await self.session.execute(
+            delete(self.model).where(
+                self.model.task_id == task_id,
+                self.model.user_id == user_id,
+            )
+        )
+        if res.rowcount:
+            self._mark_written(user_id)
+        return bool(res.rowcount)
@@ -1,4 +1,5 @@
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.database.models import UserModels
@@ -9,6 +10,8 @@ class UserRepository:
     Репозиторий для работы с пользователями (UserModels).
 
     Инкапсулирует все операции CRUD по пользователям.
+    Изменения не фиксируются в репозитории: COMMIT выполняет
+    `Database.get_session` один раз в конце запроса.
 
     Attributes:
         model: Ссылка на ORM-модель UserModels.
@@ -26,22 +29,44 @@ class UserRepository:
         """
         self.session = session
 
-    async def find_by_username_or_email(self, username: str, email: str) -> UserModels | None:
+    async def find_conflicts(self, username: str, email: str) -> set[str]:
         """
-        Находит пользователя по username или email.
+        Определяет, какие из уникальных полей уже заняты.
+
+        Читаются только столбцы `username` и `email` (не более двух строк,
+        по уникальным индексам), без загрузки ORM-объектов.
 
         Args:
             username (str): Имя пользователя.
             email (str): Email пользователя.
 
         Returns:
-            UserModels | None: Экземпляр пользователя, если найден, иначе None.
+            set[str]: Занятые поля: "username", "email" или пустое множество.
         """
-        query = select(self.model).where(
-            (self.model.username == username) |
-            (self.model.email == email)
+        query = select(self.model.username, self.model.email).where(
+            or_(self.model.username == username, self.model.email == email)
         )
         res = await self.session.execute(query)
+        conflicts = set()
+        for row in res.all():
+            if row.username == username:
+                conflicts.add("username")
+            if row.email == email:
+                conflicts.add("email")
+        return conflicts
+
+    async def find_by_id(self, user_id: int) -> UserModels | None:
+        """
+        Находит пользователя по id.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            UserModels | None: Экземпляр пользователя, если найден, иначе None.
+        """
+        query = select(self.model).where(self.model.id == user_id)
+        res = await self.session.execute(query)
         return res.scalar_one_or_none()
 
     async def find_by_username(self, username: str) -> UserModels | None:
@@ -55,19 +80,60 @@ class UserRepository:
             UserModels | None: Экземпляр пользователя, если найден, иначе None.
         """
         query = select(self.model).where(self.model.username == username)
-        res = await self.session.execute(query)
+        res = await self.session.execute(query, bind_arguments={"sticky_key": ("username", username)})
         return res.scalar_one_or_none()
 
-    async def add_user(self, **kwargs) -> None:
+    async def create_user(self, username: str, email: str, password: bytes) -> int | None:
         """
-        Создаёт нового пользователя и сохраняет его в базе данных.
+        Создаёт пользователя одним запросом `INSERT ... ON CONFLICT DO NOTHING RETURNING id`.
+
+        Если username или email уже заняты (в том числе одновременной
+        регистрацией), строка не вставляется и IntegrityError не возникает:
+        PostgreSQL дожидается завершения конкурирующей транзакции и
+        пропускает вставку.
 
         Args:
-            **kwargs: Поля пользователя, например username, email, password.
+            username (str): Имя пользователя.
+            email (str): Email пользователя.
+            password (bytes): Хеш пароля.
+
+        Returns:
+            int | None: ID нового пользователя или None, если username или email заняты.
+        """
+        query = (
+            postgresql.insert(self.model)
+            .values(username=username, email=email, password=password)
+            .on_conflict_do_nothing()
+            .returning(self.model.id)
+        )
+        res = await self.session.execute(query)
+        user_id = res.scalar_one_or_none()
+        if user_id is not None:
+            self.session.info.setdefault("written_keys", set()).add(("username", username))
+        return user_id
+
+    async def update_password(self, user_id: int, current_password: bytes, new_password: bytes) -> bool:
+        """
+        Заменяет хеш пароля пользователя.
+
+        Хеш заменяется, только если в БД всё ещё `current_password`:
+        так пересчёт хеша при входе не перезапишет пароль, изменённый
+        одновременно другим запросом. Массовый UPDATE не вызывает событий
+        ORM, поэтому пользователь отмечается для сброса кэша после COMMIT здесь.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            current_password (bytes): Хеш, с которым пользователь был прочитан.
+            new_password (bytes): Новый хеш пароля.
 
         Returns:
-            None
+            bool: True, если хеш был заменён.
         """
-        user = self.model(**kwargs)
-        self.session.add(user)
-        await self.session.commit()
+        res = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == user_id, self.model.password == current_password)
+            .values(password=new_password)
+        )
+        if res.rowcount:
+            self.session.info.setdefault("written_keys", set()).add(("user", user_id))
+        return res.rowcount > 0
@@ -1,5 +1,8 @@
+from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.app.config import settings
 
 
 class TaskSchema(BaseModel):
@@ -12,4 +15,87 @@ class TaskSchema(BaseModel):
     """
 
     title: str = Field(..., min_length=1, max_length=255, description="Заголовок задачи (обязательное)")
-    description: Optional[str] = Field(None, max_length=1024, description="Описание задачи (необязательное)")
+    description: Optional[str] = Field(None, max_length=255, description="Описание задачи (необязательное)")
+
+
+class TaskFilterSchema(BaseModel):
+    """
+    Фильтры для выборки задач пользователя.
+
+    Attributes:
+        is_done (Optional[bool]): Только выполненные (True) или невыполненные (False) задачи.
+        created_from (Optional[datetime]): Задачи, созданные не раньше указанного момента.
+        created_to (Optional[datetime]): Задачи, созданные раньше указанного момента.
+    """
+
+    is_done: Optional[bool] = Field(None, description="Фильтр по статусу выполнения")
+    created_from: Optional[datetime] = Field(None, description="Начало интервала создания (включительно)")
+    created_to: Optional[datetime] = Field(None, description="Конец интервала создания (не включительно)")
+
+
+class TaskBatchCreateSchema(BaseModel):
+    """
+    Схема пакетного создания задач.
+
+    Attributes:
+        items (list[TaskSchema]): Данные создаваемых задач.
+    """
+
+    items: list[TaskSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.tasks_batch_max_items,
+        description="Создаваемые задачи",
+    )
+
+
+class TaskIdsSchema(BaseModel):
+    """
+    Схема пакетной операции над задачами по их ID.
+
+    Attributes:
+        task_ids (list[int]): Идентификаторы задач.
+    """
+
+    task_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.tasks_batch_max_items,
+        description="Идентификаторы задач",
+    )
+
+
+class TaskResponseSchema(BaseModel):
+    """
+    Задача в ответах API.
+
+    Attributes:
+        task_id (int): Идентификатор задачи.
+        title (str): Заголовок задачи.
+        description (Optional[str]): Описание задачи.
+        is_done (bool): Выполнена ли задача.
+        created_at (datetime): Время создания задачи.
+        user_id (int): Идентификатор владельца задачи.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    task_id: int
+    title: str
+    description: Optional[str]
+    is_done: bool
+    created_at: datetime
+    user_id: int
+
+
+class TaskPageSchema(BaseModel):
+    """
+    Страница списка задач.
+
+    Attributes:
+        items (list[TaskResponseSchema]): Задачи страницы.
+        next_cursor (Optional[str]): Курсор следующей страницы или None для последней.
+    """
+
+    items: list[TaskResponseSchema]
+    next_cursor: Optional[str] = None
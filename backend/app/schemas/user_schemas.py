@@ -1,4 +1,4 @@
-from pydantic import EmailStr, BaseModel, Field
+from pydantic import EmailStr, BaseModel, Field, ConfigDict
 
 
 class UserRegistrationSchema(BaseModel):
@@ -24,6 +24,35 @@ class TokenInfo(BaseModel):
     Attributes:
         access_token (str): JWT-токен доступа.
         token_type (str): Тип токена.
+        refresh_token (str | None): Токен для получения новой пары токенов без пароля.
     """
     access_token: str
     token_type: str
+    refresh_token: str | None = None
+
+
+class RefreshTokenSchema(BaseModel):
+    """
+    Схема запроса обновления токенов и выхода.
+
+    Attributes:
+        refresh_token (str): Refresh-токен, выданный при входе или предыдущем обновлении.
+    """
+    refresh_token: str = Field(..., min_length=1, max_length=256)
+
+
+class UserPrincipal(BaseModel):
+    """
+    Облегчённое представление аутентифицированного пользователя.
+
+    Собирается из claims JWT-токена (или из кэша пользователей) и не
+    требует загрузки ORM-объекта UserModels на каждый запрос.
+
+    Attributes:
+        id (int): Идентификатор пользователя.
+        username (str): Имя пользователя.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    username: str
@@ -0,0 +1,175 @@
+"""Точка входа для запуска приложения.
+
+Рабочий режим запускает несколько процессов uvicorn (по умолчанию — по
+числу CPU) с uvloop и httptools, если они установлены. Бюджет соединений
+с БД `db_max_connections` делится между воркерами, чтобы суммарное число
+соединений всех процессов не превышало лимит сервера PostgreSQL.
+
+Кэш, ограничитель входа и события задач по умолчанию хранятся в памяти
+процесса. Перед запуском нескольких воркеров такие настройки
+выводятся в лог предупреждением, а с `server_require_shared_state`
+запуск прерывается. Запись лога в файл у воркеров выключается: все
+процессы пишут в консоль. Метрики и статистика каждого воркера отдаются
+на его служебном порту из диапазона `internal_port`.
+
+Режим разработки (`--dev`) запускает один процесс с автоперезагрузкой
+при изменении кода.
+
+Запуск из корня репозитория:
+    python -m backend.app.server
+    python -m backend.app.server --workers 4 --port 8000
+    python -m backend.app.server --dev
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+import uvicorn
+
+from backend.app.config import settings
+from backend.app.core.key_manager import key_manager
+from backend.app.logs.logger import logger
+
+
+def pool_budget(workers: int) -> dict[str, int]:
+    """
+    Делит бюджет соединений с БД между воркерами.
+
+    Args:
+        workers (int): Количество процессов.
+
+    Returns:
+        dict[str, int]: Размер пула и overflow на один воркер. Если
+            `db_max_connections` не задан, возвращаются значения из настроек.
+    """
+    if not settings.db_max_connections:
+        return {"pool_size": settings.db_pool_size, "max_overflow": settings.db_max_overflow}
+    # Соединение LISTEN для событий задач занимает ещё одно соединение на воркер.
+    reserved = 1 if settings.task_events_backend == "postgres" else 0
+    per_worker = max(settings.db_max_connections // workers - reserved, 1)
+    pool_size = min(settings.db_pool_size, per_worker)
+    return {"pool_size": pool_size, "max_overflow": per_worker - pool_size}
+
+
+def per_worker_state() -> list[str]:
+    """
+    Перечисляет настройки, при которых состояние не разделяется между воркерами.
+
+    Returns:
+        list[str]: Описания проблем для лога; пустой список, если
+            кэш, лимит входа и события задач общие для всех воркеров.
+    """
+    problems = []
+    if settings.task_events_backend == "local":
+        problems.append(
+            'task_events_backend="local": /tasks/stream/ получает только события своего воркера, '
+            'используйте "postgres"'
+        )
+    if settings.task_cache_backend == "memory":
+        problems.append(
+            'task_cache_backend="memory": запись через один воркер не сбрасывает кэш остальных, '
+            'список задач может быть устаревшим до task_cache_ttl_seconds, используйте "redis"'
+        )
+    if settings.login_limiter_backend == "memory":
+        problems.append(
+            'login_limiter_backend="memory": лимит попыток входа считается отдельно в каждом воркере '
+            'и фактически умножается на их число, используйте "redis"'
+        )
+    if settings.auth_mode == "database" and settings.user_cache_ttl_seconds > 0:
+        problems.append(
+            "user_cache_ttl_seconds > 0: смена пароля сбрасывает кэш пользователей только в своём воркере, "
+            "остальные принимают старые сессии до истечения TTL"
+        )
+    return problems
+
+
+def run(workers: int, host: str, port: int) -> None:
+    """
+    Запускает приложение в рабочем режиме.
+
+    Настройки пула, числа потоков bcrypt и записи лога передаются воркерам
+    через переменные окружения, которые наследуют дочерние процессы.
+
+    Args:
+        workers (int): Количество процессов.
+        host (str): Адрес для прослушивания.
+        port (int): Порт для прослушивания.
+    """
+    # Ключи создаются один раз до запуска воркеров, иначе каждый сгенерировал бы свои.
+    key_manager.generate_if_missing(settings.algorithm)
+    budget = pool_budget(workers)
+    os.environ["DB_POOL_SIZE"] = str(budget["pool_size"])
+    os.environ["DB_MAX_OVERFLOW"] = str(budget["max_overflow"])
+    if settings.password_hash_workers is None:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(max((os.cpu_count() or 1) // workers, 1))
+
+    if workers > 1:
+        problems = per_worker_state()
+        for problem in problems:
+            logger.warning(f"Несколько воркеров ({workers}) при {problem}")
+        if problems and settings.server_require_shared_state:
+            logger.critical("Запуск прерван: server_require_shared_state требует общего состояния воркеров")
+            sys.exit(1)
+        # RotatingFileHandler не рассчитан на запись из нескольких процессов.
+        os.environ["LOG_FILE_ENABLED"] = "false"
+    # По числу воркеров выделяется диапазон служебных портов.
+    os.environ["SERVER_WORKERS"] = str(workers)
+
+    logger.info(
+        f"Запуск {workers} воркеров на {host}:{port}, "
+        f"пул БД на воркер: {budget['pool_size']} + {budget['max_overflow']} overflow"
+    )
+    if settings.internal_port is not None:
+        logger.info(
+            f"Метрики воркеров: {settings.internal_host}:{settings.internal_port}-"
+            f"{settings.internal_port + workers - 1}/metrics"
+        )
+    uvicorn.run(
+        "backend.app.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        timeout_keep_alive=settings.server_keep_alive_timeout,
+        access_log=settings.server_access_log,
+        proxy_headers=True,
+    )
+
+
+def run_dev(host: str, port: int) -> None:
+    """
+    Запускает один процесс с автоперезагрузкой для разработки.
+
+    Args:
+        host (str): Адрес для прослушивания.
+        port (int): Порт для прослушивания.
+    """
+    uvicorn.run(
+        "backend.app.main:app",
+        host=host,
+        port=port,
+        reload=True,
+        reload_dirs=[os.path.dirname(os.path.dirname(__file__))],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Запуск TaskApp")
+    parser.add_argument("--workers", type=int, default=settings.server_workers, help="Количество процессов")
+    parser.add_argument("--host", default=settings.server_host, help="Адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=settings.server_port, help="Порт для прослушивания")
+    parser.add_argument("--dev", action="store_true", help="Режим разработки: один процесс и --reload")
+    args = parser.parse_args()
+
+    if args.dev:
+        run_dev(args.host, args.port)
+    else:
+        run(args.workers or os.cpu_count() or 1, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
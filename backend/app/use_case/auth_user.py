@@ -1,32 +1,75 @@
 from fastapi import HTTPException
 from backend.app.core.jwt_utils import encode_jwt
+from backend.app.core.login_limiter import LoginRateLimiter
+from backend.app.core.refresh_tokens import (
+    generate_refresh_token,
+    hash_refresh_token,
+    new_session_id,
+    refresh_token_expires_at,
+)
 from backend.app.dependencies.auth import validate_auth_user
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
 from backend.app.repositories.users import UserRepository
 from backend.app.schemas.user_schemas import TokenInfo
 
 
 class AuthUserUseCase:
-    def __init__(self, repo: UserRepository):
+    def __init__(
+            self,
+            repo: UserRepository,
+            limiter: LoginRateLimiter,
+            tokens: RefreshTokenRepository,
+            write_repo: UserRepository,
+    ):
         self.repo = repo
+        self.limiter = limiter
+        self.tokens = tokens
+        self.write_repo = write_repo
 
-    async def execute(self, username, password) -> TokenInfo:
+    async def execute(self, username, password, client_ip: str | None = None) -> TokenInfo:
         """
         Генерирует JWT токен для пользователя после успешной авторизации.
         Проверка пользователя и пароля проводится в Depends(validate_auth_user).
+
+        Вместе с access-токеном выдаётся refresh-токен новой сессии входа,
+        по которому `/auth/refresh/` продлевает доступ без проверки пароля.
+
+        До обращения к БД и bcrypt попытка проходит через ограничитель
+        входа по IP-адресу и имени пользователя; неудачные попытки
+        учитываются для экспоненциальной блокировки.
+
+        Устаревший хеш пароля пересчитывается и сохраняется через
+        `write_repo` в той же транзакции, что и новый refresh-токен.
+
+        Raises:
+            LoginRateLimitedError: Если попытки входа исчерпаны или ключ заблокирован.
         """
-        user = await validate_auth_user(self.repo, username, password)
+        await self.limiter.check(client_ip, username)
+        try:
+            user = await validate_auth_user(self.repo, username, password, self.write_repo)
+        except HTTPException as e:
+            if e.status_code == 401:
+                await self.limiter.record_failure(client_ip, username)
+            raise
+        await self.limiter.record_success(client_ip, username)
 
         if not user.username or not user.email:
             raise HTTPException(status_code=400, detail="Невалидные данные пользователя")
 
+        session_id = new_session_id()
+        refresh_token = generate_refresh_token()
+        await self.tokens.add(user.id, session_id, hash_refresh_token(refresh_token), refresh_token_expires_at())
+
         jwt_payload = {
             "sub": str(user.id),
             "username": user.username,
+            "sid": session_id,
         }
         token = encode_jwt(jwt_payload)
 
         return TokenInfo(
             access_token=token,
             token_type="Bearer",
+            refresh_token=refresh_token,
         )
 
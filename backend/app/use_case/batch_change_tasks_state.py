@@ -0,0 +1,61 @@
+from backend.app.core.events import TaskEventBus
+from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.task_schemas import TaskIdsSchema
+from backend.app.schemas.user_schemas import UserPrincipal
+
+
+class BatchChangeTasksStateUseCase:
+    """
+    Юзкейc для пакетного переключения состояния задач пользователя.
+
+    Attributes:
+        repo: Репозиторий задач, реализующий метод toggle_tasks.
+        events (TaskEventBus): Шина событий об изменении задач.
+    """
+
+    def __init__(self, repo: TaskRepository, events: TaskEventBus):
+        """
+        Инициализация use-case с указанием репозитория и шины событий.
+
+        Args:
+            repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
+        """
+        self.repo = repo
+        self.events = events
+
+    async def execute(self, data: TaskIdsSchema, current_user: UserPrincipal) -> dict:
+        """
+        Переключает состояние всех переданных задач в одной транзакции.
+
+        Повторяющиеся ID переключаются один раз.
+
+        Args:
+            data (TaskIdsSchema): Идентификаторы задач.
+            current_user (UserPrincipal): Пользователь, которому принадлежат задачи.
+
+        Returns:
+            dict: Результат по каждому ID в порядке запроса, например:
+                {'items': [{'task_id': 1, 'status': 'ok', 'is_done': True},
+                           {'task_id': 2, 'status': 'not_found', 'is_done': None}]}.
+        """
+        states = await self.repo.toggle_tasks(data.task_ids, current_user.id)
+        if states:
+            await self.events.publish(
+                self.repo.session,
+                current_user.id,
+                {
+                    "type": "updated",
+                    "tasks": [{"task_id": task_id, "is_done": is_done} for task_id, is_done in states.items()],
+                },
+            )
+        return {
+            'items': [
+                {
+                    'task_id': task_id,
+                    'status': 'ok' if task_id in states else 'not_found',
+                    'is_done': states.get(task_id),
+                }
+                for task_id in data.task_ids
+            ]
+        }
@@ -0,0 +1,48 @@
+from backend.app.core.events import TaskEventBus
+from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.task_schemas import TaskBatchCreateSchema
+from backend.app.schemas.user_schemas import UserPrincipal
+
+
+class BatchCreateTasksUseCase:
+    """
+    Юзкейc для пакетного создания задач пользователя.
+
+    Attributes:
+        repo: Репозиторий задач, реализующий метод create_tasks.
+        events (TaskEventBus): Шина событий об изменении задач.
+    """
+
+    def __init__(self, repo: TaskRepository, events: TaskEventBus):
+        """
+        Инициализация use-case с указанием репозитория и шины событий.
+
+        Args:
+            repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
+        """
+        self.repo = repo
+        self.events = events
+
+    async def execute(self, data: TaskBatchCreateSchema, current_user: UserPrincipal) -> dict:
+        """
+        Создаёт все переданные задачи в одной транзакции.
+
+        Args:
+            data (TaskBatchCreateSchema): Данные создаваемых задач.
+            current_user (UserPrincipal): Пользователь, которому принадлежат задачи.
+
+        Returns:
+            dict: Результат по каждому элементу в порядке запроса:
+                {'items': [{'index': 0, 'task_id': 10}, ...]}.
+        """
+        task_ids = await self.repo.create_tasks(data.items, current_user.id)
+        await self.events.publish(
+            self.repo.session, current_user.id, {"type": "created", "task_ids": task_ids}
+        )
+        return {
+            'items': [
+                {'index': index, 'task_id': task_id}
+                for index, task_id in enumerate(task_ids)
+            ]
+        }
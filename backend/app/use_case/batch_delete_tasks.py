@@ -0,0 +1,50 @@
+from backend.app.core.events import TaskEventBus
+from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.task_schemas import TaskIdsSchema
+from backend.app.schemas.user_schemas import UserPrincipal
+
+
+class BatchDeleteTasksUseCase:
+    """
+    Юзкейc для пакетного удаления задач пользователя.
+
+    Attributes:
+        repo: Репозиторий задач, реализующий метод delete_tasks.
+        events (TaskEventBus): Шина событий об изменении задач.
+    """
+
+    def __init__(self, repo: TaskRepository, events: TaskEventBus):
+        """
+        Инициализация use-case с указанием репозитория и шины событий.
+
+        Args:
+            repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
+        """
+        self.repo = repo
+        self.events = events
+
+    async def execute(self, data: TaskIdsSchema, current_user: UserPrincipal) -> dict:
+        """
+        Удаляет все переданные задачи в одной транзакции.
+
+        Args:
+            data (TaskIdsSchema): Идентификаторы задач.
+            current_user (UserPrincipal): Пользователь, которому принадлежат задачи.
+
+        Returns:
+            dict: Результат по каждому ID в порядке запроса, например:
+                {'items': [{'task_id': 1, 'status': 'deleted'},
+                           {'task_id': 2, 'status': 'not_found'}]}.
+        """
+        deleted = await self.repo.delete_tasks(data.task_ids, current_user.id)
+        if deleted:
+            await self.events.publish(
+                self.repo.session, current_user.id, {"type": "deleted", "task_ids": sorted(deleted)}
+            )
+        return {
+            'items': [
+                {'task_id': task_id, 'status': 'deleted' if task_id in deleted else 'not_found'}
+                for task_id in data.task_ids
+            ]
+        }
@@ -1,4 +1,8 @@
+from fastapi import HTTPException, status
+
+from backend.app.core.events import TaskEventBus
 from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.user_schemas import UserPrincipal
 
 
 class ChangeTaskStateUseCase:
@@ -6,36 +10,44 @@ class ChangeTaskStateUseCase:
     Юзкейc для изменения состояния задачи (выполнена / не выполнена).
 
     Attributes:
-        repo: Репозиторий задач, реализующий методы get_task_by_id и change_task.
+        repo: Репозиторий задач, реализующий метод toggle_task.
+        events (TaskEventBus): Шина событий об изменении задач.
     """
 
-    def __init__(self, repo: TaskRepository):
+    def __init__(self, repo: TaskRepository, events: TaskEventBus):
         """
-        Инициализация use-case с указанием репозитория.
+        Инициализация use-case с указанием репозитория и шины событий.
 
         Args:
             repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
         """
         self.repo = repo
+        self.events = events
 
-    async def execute(self, task_id: int) -> dict | None:
+    async def execute(self, task_id: int, current_user: UserPrincipal) -> dict:
         """
         Переключает состояние задачи с выполненной на невыполненную или наоборот.
 
         Args:
             task_id (int): ID задачи для изменения состояния.
+            current_user (UserPrincipal): Пользователь, которому принадлежит задача.
 
         Returns:
-            dict | None: Словарь с сообщением о новом состоянии задачи, либо None,
-                         если задача с указанным ID не найдена.
-        """
-        task = await self.repo.get_task_by_id(task_id)
-        if task is None:
-            return None
+            dict: Словарь с сообщением о новом состоянии задачи.
 
-        if task.is_done:
-            await self.repo.change_task(task_id, value=False)
-            return {'msg': "Задача отмечена как 'не выполнена'"}
-
-        await self.repo.change_task(task_id, value=True)
-        return {'msg': "Задача отмечена как 'выполнена'"}
+        Raises:
+            HTTPException: 404 — если задача не найдена или принадлежит другому пользователю.
+        """
+        is_done = await self.repo.toggle_task(task_id, current_user.id)
+        if is_done is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задача не найдена")
+        await self.events.publish(
+            self.repo.session,
+            current_user.id,
+            {"type": "updated", "tasks": [{"task_id": task_id, "is_done": is_done}]},
+        )
+
+        if is_done:
+            return {'msg': "Задача отмечена как 'выполнена'"}
+        return {'msg': "Задача отмечена как 'не выполнена'"}
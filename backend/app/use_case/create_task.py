@@ -1,6 +1,7 @@
-from backend.app.database.models import UserModels
+from backend.app.core.events import TaskEventBus
 from backend.app.repositories.tasks import TaskRepository
 from backend.app.schemas.task_schemas import TaskSchema
+from backend.app.schemas.user_schemas import UserPrincipal
 
 
 class CreateTaskUseCase:
@@ -9,27 +10,33 @@ class CreateTaskUseCase:
 
     Attributes:
         repo: Репозиторий задач, реализующий метод create_one_task.
+        events (TaskEventBus): Шина событий об изменении задач.
     """
 
-    def __init__(self, repo: TaskRepository):
+    def __init__(self, repo: TaskRepository, events: TaskEventBus):
         """
-        Инициализация use-case с указанием репозитория.
+        Инициализация use-case с указанием репозитория и шины событий.
 
         Args:
             repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
         """
         self.repo = repo
+        self.events = events
 
-    async def execute(self, credentials: TaskSchema, current_user: UserModels) -> dict:
+    async def execute(self, credentials: TaskSchema, current_user: UserPrincipal) -> dict:
         """
         Создаёт новую задачу для указанного пользователя.
 
         Args:
             credentials (TaskSchema): Данные задачи (title, description).
-            current_user (UserModels): Пользователь, которому принадлежит задача.
+            current_user (UserPrincipal): Пользователь, которому принадлежит задача.
 
         Returns:
             dict: Словарь с сообщением о результате выполнения.
         """
-        await self.repo.create_one_task(credentials, current_user)
+        task_id = await self.repo.create_one_task(credentials, current_user.id)
+        await self.events.publish(
+            self.repo.session, current_user.id, {"type": "created", "task_ids": [task_id]}
+        )
         return {'msg': "Задача успешно создана"}
@@ -1,31 +1,46 @@
 from fastapi import HTTPException, status
 
-from backend.app.core.password_utils import hash_password
+from backend.app.core.password_hasher import password_hasher
 from backend.app.repositories.users import UserRepository
 from backend.app.schemas.user_schemas import UserRegistrationSchema
 
+CONFLICT_DETAILS = {
+    frozenset({"username"}): "Пользователь с таким username уже зарегистрирован",
+    frozenset({"email"}): "Пользователь с таким email уже зарегистрирован",
+}
+
 
 class CreateUserUseCase:
     """
     Юзкейc для регистрации нового пользователя.
 
     Attributes:
-        repo (UserRepository): Репозиторий пользователей для работы с БД.
+        repo (UserRepository): Репозиторий пользователей для записи в БД.
+        read_repo (UserRepository): Репозиторий пользователей для предварительной проверки.
     """
 
-    def __init__(self, repo: UserRepository):
+    def __init__(self, repo: UserRepository, read_repo: UserRepository):
         """
-        Инициализация use-case с указанием репозитория.
+        Инициализация use-case с указанием репозиториев.
 
         Args:
-            repo (UserRepository): Репозиторий пользователей.
+            repo (UserRepository): Репозиторий пользователей на сессии записи.
+            read_repo (UserRepository): Репозиторий пользователей на сессии чтения.
         """
         self.repo = repo
+        self.read_repo = read_repo
 
     async def execute(self, data: UserRegistrationSchema) -> dict:
         """
         Создаёт нового пользователя, если username и email ещё не заняты.
 
+        Сначала занятость username и email проверяется через сессию чтения,
+        чтобы не тратить bcrypt на заведомо повторную регистрацию и не
+        держать транзакцию записи открытой, пока хешируется пароль. Сама
+        запись — один `INSERT ... ON CONFLICT DO NOTHING RETURNING`, поэтому
+        одновременные регистрации с одинаковыми данными не приводят к
+        IntegrityError: проигравший запрос получает 409.
+
         Args:
             data (UserRegistrationSchema): Данные нового пользователя
                                            (username, email, password).
@@ -34,18 +49,23 @@ class CreateUserUseCase:
             dict: Словарь с сообщением об успешной регистрации.
 
         Raises:
-            HTTPException: Если пользователь с таким username или email уже существует.
+            HTTPException: 409 — если пользователь с таким username или email уже существует.
         """
+        conflicts = await self.read_repo.find_conflicts(data.username, data.email)
+        if conflicts:
+            raise self._conflict(conflicts)
 
-        existing_user = await self.repo.find_by_username_or_email(data.username, data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Пользователь уже зарегистрирован"
-            )
+        password = await password_hasher.hash(data.password)
 
-        user_data = data.model_dump()
-        user_data["password"] = hash_password(data.password)
-
-        await self.repo.add_user(**user_data)
+        user_id = await self.repo.create_user(data.username, data.email, password)
+        if user_id is None:
+            # Данные заняли между проверкой и вставкой: уточняем поле по основной БД.
+            raise self._conflict(await self.repo.find_conflicts(data.username, data.email))
         return {"msg": "Пользователь успешно зарегистрирован"}
+
+    @staticmethod
+    def _conflict(conflicts: set[str]) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=CONFLICT_DETAILS.get(frozenset(conflicts), "Пользователь уже зарегистрирован"),
+        )
@@ -1,4 +1,6 @@
+from backend.app.core.events import TaskEventBus
 from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.user_schemas import UserPrincipal
 
 
 class DeleteTaskUseCase:
@@ -7,26 +9,33 @@ class DeleteTaskUseCase:
 
     Attributes:
         repo: Репозиторий задач, реализующий метод delete_task_by_id.
+        events (TaskEventBus): Шина событий об изменении задач.
     """
 
-    def __init__(self, repo: TaskRepository):
+    def __init__(self, repo: TaskRepository, events: TaskEventBus):
         """
-        Инициализация use-case с указанием репозитория.
+        Инициализация use-case с указанием репозитория и шины событий.
 
         Args:
             repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
         """
         self.repo = repo
+        self.events = events
 
-    async def execute(self, task_id: int) -> dict:
+    async def execute(self, task_id: int, current_user: UserPrincipal) -> dict:
         """
-        Удаляет задачу с указанным ID.
+        Удаляет задачу с указанным ID, если она принадлежит пользователю.
 
         Args:
             task_id (int): ID задачи для удаления.
+            current_user (UserPrincipal): Пользователь, которому принадлежит задача.
 
         Returns:
             dict: Словарь с сообщением о результате удаления.
         """
-        await self.repo.delete_task_by_id(task_id)
+        if await self.repo.delete_task_by_id(task_id, current_user.id):
+            await self.events.publish(
+                self.repo.session, current_user.id, {"type": "deleted", "task_ids": [task_id]}
+            )
         return {'msg': "Задача успешно удалена"}
@@ -0,0 +1,79 @@
+import csv
+import io
+from typing import AsyncIterator, Callable, Sequence
+
+import orjson
+from sqlalchemy import Row
+
+from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.task_schemas import TaskFilterSchema
+from backend.app.schemas.user_schemas import UserPrincipal
+
+EXPORT_COLUMNS = ("task_id", "title", "description", "is_done", "created_at", "user_id")
+
+
+class ExportTasksUseCase:
+    """
+    Юзкейc для потоковой выгрузки всех задач пользователя в NDJSON или CSV.
+
+    Attributes:
+        session_scope: Фабрика контекста сессии с транзакцией,
+            например `Database.snapshot_session`.
+        batch_size (int): Количество строк в одной пачке выгрузки.
+    """
+
+    def __init__(self, session_scope: Callable, batch_size: int):
+        """
+        Инициализация use-case.
+
+        Args:
+            session_scope: Фабрика контекста сессии с транзакцией.
+            batch_size (int): Количество строк в одной пачке выгрузки.
+        """
+        self.session_scope = session_scope
+        self.batch_size = batch_size
+
+    async def execute(
+            self,
+            current_user: UserPrincipal,
+            filters: TaskFilterSchema,
+            fmt: str,
+    ) -> AsyncIterator[bytes]:
+        """
+        Выгружает задачи текущего пользователя частями.
+
+        Сессия открывается внутри генератора и живёт, пока клиент читает
+        ответ, поэтому use-case не использует сессию запроса: она
+        закрывается до начала отправки тела.
+
+        Args:
+            current_user (UserPrincipal): Пользователь, чьи задачи выгружаются.
+            filters (TaskFilterSchema): Фильтры по статусу и времени создания.
+            fmt (str): Формат выгрузки: "ndjson" или "csv".
+
+        Yields:
+            bytes: Очередная часть файла выгрузки.
+        """
+        encode = self._encode_csv if fmt == "csv" else self._encode_ndjson
+        if fmt == "csv":
+            yield self._encode_csv([EXPORT_COLUMNS])
+
+        async with self.session_scope(("tasks", current_user.id)) as session:
+            repo = TaskRepository(session)
+            async for rows in repo.stream_tasks(current_user.id, filters, self.batch_size):
+                yield encode(rows)
+
+    @staticmethod
+    def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+        return b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
+
+    @staticmethod
+    def _encode_csv(rows: Sequence[Row | tuple]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in row
+            )
+        return buffer.getvalue().encode()
@@ -1,6 +1,12 @@
-from typing import Sequence
-from backend.app.database.models import TaskModels, UserModels
+import orjson
+from fastapi import HTTPException, status
+
+from backend.app.core.etag import etag_matches, make_etag
+from backend.app.core.pagination import decode_cursor, encode_cursor
+from backend.app.core.task_cache import TaskListCache
 from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.task_schemas import TaskFilterSchema
+from backend.app.schemas.user_schemas import UserPrincipal
 
 
 class GetListTasksUseCase:
@@ -9,25 +15,90 @@ class GetListTasksUseCase:
 
     Attributes:
         repo (TaskRepository): Репозиторий задач для работы с БД.
+        cache (TaskListCache): Кэш страниц списка задач.
     """
 
-    def __init__(self, repo: TaskRepository):
+    def __init__(self, repo: TaskRepository, cache: TaskListCache):
         """
-        Инициализация use-case с указанием репозитория.
+        Инициализация use-case с указанием репозитория и кэша.
 
         Args:
             repo (TaskRepository): Репозиторий задач.
+            cache (TaskListCache): Кэш страниц списка задач.
         """
         self.repo = repo
+        self.cache = cache
 
-    async def execute(self, current_user: UserModels) -> Sequence[TaskModels]:
+    async def execute(
+            self,
+            current_user: UserPrincipal,
+            filters: TaskFilterSchema,
+            limit: int,
+            cursor: str | None = None,
+            if_none_match: str | None = None,
+    ) -> tuple[str, dict | None]:
         """
-        Получает все задачи, принадлежащие текущему пользователю.
+        Получает страницу задач, принадлежащих текущему пользователю.
+
+        Версия списка задач пользователя берётся из кэша (она меняется при
+        каждом COMMIT с изменением его задач), из неё и параметров запроса
+        строится ETag. Если он совпадает с `If-None-Match`, ни кэш страниц,
+        ни БД не читаются. Иначе страница ищется в кэше, а при промахе
+        читается из БД и сохраняется в кэш под версией, полученной до чтения.
+
+        Если кэш отключён или недоступен, страница читается из БД, а ETag
+        строится по её содержимому: 304 по-прежнему экономит трафик.
 
         Args:
-            current_user (UserModels): Пользователь, для которого возвращаем задачи.
+            current_user (UserPrincipal): Пользователь, для которого возвращаем задачи.
+            filters (TaskFilterSchema): Фильтры по статусу и времени создания.
+            limit (int): Размер страницы.
+            cursor (str | None): Курсор следующей страницы из предыдущего ответа.
+            if_none_match (str | None): Значение заголовка `If-None-Match`.
 
         Returns:
-            Sequence[TaskModels]: Список объектов задач.
+            tuple[str, dict | None]: ETag страницы и сама страница или None,
+                если у клиента актуальная версия. Страница — словарь
+                в формате TaskPageSchema с ключами:
+                - items: список задач страницы (словари полей задачи);
+                - next_cursor: курсор следующей страницы или None, если это последняя страница.
+
+        Raises:
+            HTTPException: 400 — если курсор некорректен.
         """
-        return await self.repo.get_tasks(current_user)
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор",
+                )
+
+        params = f"{limit}|{cursor}|{filters.is_done}|{filters.created_from}|{filters.created_to}"
+        # Версия берётся до чтения из БД: см. TaskListCache.
+        version = await self.cache.version(current_user.id)
+        if version is not None:
+            etag = make_etag(current_user.id, version, params)
+            if etag_matches(if_none_match, etag):
+                return etag, None
+            page = await self.cache.get(current_user.id, version, params)
+            if page is not None:
+                return etag, page
+
+        rows = await self.repo.get_tasks(current_user.id, filters, limit + 1, after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.created_at, last.task_id)
+
+        page = {"items": [row._asdict() for row in rows], "next_cursor": next_cursor}
+        if version is None:
+            etag = make_etag(current_user.id, orjson.dumps(page).decode())
+            if etag_matches(if_none_match, etag):
+                return etag, None
+        else:
+            await self.cache.set(current_user.id, version, params, page)
+        return etag, page
@@ -0,0 +1,167 @@
+import time
+from typing import AsyncIterable, AsyncIterator
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from backend.app.core.events import TaskEventBus
+from backend.app.core.streaming import LineTooLongError, iter_csv_records, iter_lines
+from backend.app.repositories.tasks import TaskRepository
+from backend.app.schemas.task_schemas import TaskSchema
+from backend.app.schemas.user_schemas import UserPrincipal
+
+
+class ImportTasksUseCase:
+    """
+    Юзкейc для потокового импорта задач пользователя из NDJSON или CSV.
+
+    Attributes:
+        repo: Репозиторий задач, реализующий метод copy_tasks.
+        events (TaskEventBus): Шина событий об изменении задач.
+        batch_size (int): Количество задач в одной пачке COPY.
+        max_errors (int): Сколько ошибок по строкам включать в отчёт.
+        max_line_bytes (int): Максимальная длина строки (записи CSV) файла.
+    """
+
+    def __init__(
+            self,
+            repo: TaskRepository,
+            events: TaskEventBus,
+            batch_size: int,
+            max_errors: int,
+            max_line_bytes: int,
+    ):
+        """
+        Инициализация use-case.
+
+        Args:
+            repo: Экземпляр TaskRepository для работы с задачами.
+            events (TaskEventBus): Шина событий об изменении задач.
+            batch_size (int): Количество задач в одной пачке COPY.
+            max_errors (int): Сколько ошибок по строкам включать в отчёт.
+            max_line_bytes (int): Максимальная длина строки (записи CSV) файла.
+        """
+        self.repo = repo
+        self.events = events
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.max_line_bytes = max_line_bytes
+
+    async def execute(
+            self,
+            current_user: UserPrincipal,
+            chunks: AsyncIterable[bytes],
+            fmt: str,
+    ) -> dict:
+        """
+        Читает файл по частям, проверяет каждую строку по TaskSchema и пишет задачи пачками.
+
+        Файл не загружается в память целиком: одновременно хранится не больше
+        одной пачки задач. Некорректные строки пропускаются и попадают в отчёт.
+        Все пачки записываются в одной транзакции, поэтому при обрыве загрузки
+        не импортируется ничего.
+
+        Args:
+            current_user (UserPrincipal): Пользователь, которому принадлежат задачи.
+            chunks (AsyncIterable[bytes]): Тело запроса, например `request.stream()`.
+            fmt (str): Формат файла: "ndjson" (объект с полями title и description
+                на строку) или "csv" (первая строка — заголовок с колонками title, description).
+
+        Returns:
+            dict: Отчёт об импорте, например:
+                {'imported': 998, 'failed': 2,
+                 'errors': [{'line': 5, 'error': 'title: Field required'}],
+                 'seconds': 0.41, 'rows_per_second': 2434.1}.
+
+        Raises:
+            HTTPException: 400 — если файл не в UTF-8 или в CSV нет колонки title;
+                413 — если строка или запись CSV длиннее `max_line_bytes`.
+        """
+        started = time.perf_counter()
+        imported = failed = 0
+        errors = []
+        batch: list[TaskSchema] = []
+
+        rows = self._iter_csv(chunks) if fmt == "csv" else self._iter_ndjson(chunks)
+        try:
+            async for line_no, data, error in rows:
+                if error is None:
+                    try:
+                        item = TaskSchema.model_validate(data)
+                    except ValidationError as e:
+                        error = "; ".join(
+                            f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+                            for err in e.errors()
+                        )
+                if error is not None:
+                    failed += 1
+                    if len(errors) < self.max_errors:
+                        errors.append({'line': line_no, 'error': error})
+                    continue
+
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    await self.repo.copy_tasks(batch, current_user.id)
+                    imported += len(batch)
+                    batch = []
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Файл должен быть в кодировке UTF-8",
+            )
+        except LineTooLongError as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"Строка {e.line_no} длиннее {e.limit} байт",
+            )
+
+        if batch:
+            await self.repo.copy_tasks(batch, current_user.id)
+            imported += len(batch)
+        if imported:
+            await self.events.publish(
+                self.repo.session, current_user.id, {"type": "imported", "count": imported}
+            )
+
+        seconds = time.perf_counter() - started
+        return {
+            'imported': imported,
+            'failed': failed,
+            'errors': errors,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(imported / seconds, 1) if seconds else 0.0,
+        }
+
+    async def _iter_ndjson(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, object, str | None]]:
+        line_no = 0
+        async for line in iter_lines(chunks, self.max_line_bytes):
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                yield line_no, orjson.loads(line), None
+            except orjson.JSONDecodeError as e:
+                yield line_no, None, f"некорректный JSON: {e}"
+
+    async def _iter_csv(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, object, str | None]]:
+        header = None
+        lines = iter_lines(chunks, self.max_line_bytes)
+        async for line_no, values in iter_csv_records(lines, self.max_line_bytes):
+            if not values or values == [""]:
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                if "title" not in header:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="В заголовке CSV нет колонки title",
+                    )
+                continue
+            if len(values) != len(header):
+                yield line_no, None, f"ожидалось колонок: {len(header)}, получено: {len(values)}"
+                continue
+            row = dict(zip(header, values))
+            if row.get("description") == "":
+                row["description"] = None
+            yield line_no, row, None
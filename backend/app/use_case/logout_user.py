@@ -0,0 +1,41 @@
+from backend.app.core.refresh_tokens import RevokedSessions, hash_refresh_token
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
+
+
+class LogoutUserUseCase:
+    """
+    Юзкейс выхода: завершение сессии входа по refresh-токену.
+
+    Attributes:
+        repo (RefreshTokenRepository): Репозиторий refresh-токенов.
+        revoked (RevokedSessions): Список отозванных сессий.
+    """
+
+    def __init__(self, repo: RefreshTokenRepository, revoked: RevokedSessions):
+        """
+        Инициализация use-case.
+
+        Args:
+            repo (RefreshTokenRepository): Репозиторий refresh-токенов.
+            revoked (RevokedSessions): Список отозванных сессий.
+        """
+        self.repo = repo
+        self.revoked = revoked
+
+    async def execute(self, refresh_token: str) -> dict:
+        """
+        Отзывает все refresh-токены сессии и её access-токены.
+
+        Повторный выход или выход с неизвестным токеном не считается ошибкой.
+
+        Args:
+            refresh_token (str): Refresh-токен клиента.
+
+        Returns:
+            dict: Сообщение о выходе.
+        """
+        family_id = await self.repo.find_family_id(hash_refresh_token(refresh_token))
+        if family_id is not None:
+            await self.repo.revoke_family(family_id)
+            self.revoked.revoke(family_id)
+        return {"msg": "Выход выполнен"}
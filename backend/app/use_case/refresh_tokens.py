@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException, status
+
+from backend.app.core.jwt_utils import encode_jwt
+from backend.app.core.refresh_tokens import (
+    RevokedSessions,
+    generate_refresh_token,
+    hash_refresh_token,
+    refresh_token_expires_at,
+)
+from backend.app.logs.logger import logger
+from backend.app.repositories.refresh_tokens import RefreshTokenRepository
+from backend.app.schemas.user_schemas import TokenInfo
+
+
+class RefreshTokensUseCase:
+    """
+    Юзкейс обмена refresh-токена на новую пару токенов (ротация).
+
+    Attributes:
+        repo (RefreshTokenRepository): Репозиторий refresh-токенов.
+        revoked (RevokedSessions): Список отозванных сессий.
+        reuse_grace (timedelta): Сколько после обмена повторное предъявление токена
+            не считается кражей.
+    """
+
+    def __init__(self, repo: RefreshTokenRepository, revoked: RevokedSessions, reuse_grace_seconds: float):
+        """
+        Инициализация use-case.
+
+        Args:
+            repo (RefreshTokenRepository): Репозиторий refresh-токенов.
+            revoked (RevokedSessions): Список отозванных сессий.
+            reuse_grace_seconds (float): Сколько секунд после обмена повторное
+                предъявление токена отклоняется без отзыва сессии.
+        """
+        self.repo = repo
+        self.revoked = revoked
+        self.reuse_grace = timedelta(seconds=reuse_grace_seconds)
+
+    async def execute(self, refresh_token: str) -> TokenInfo:
+        """
+        Выдаёт новый access-токен и новый refresh-токен той же сессии.
+
+        Предъявленный токен помечается использованным. Если он уже был
+        использован, запрос отклоняется. Повтор в течение `reuse_grace` после
+        обмена — обычно одновременное обновление из другой вкладки — сессию
+        не завершает. Более поздний повтор считается кражей токена: сессия
+        отзывается в отдельной транзакции (откат запроса её не отменяет)
+        и в списке отозванных сессий.
+
+        Args:
+            refresh_token (str): Refresh-токен клиента.
+
+        Returns:
+            TokenInfo: Новые access- и refresh-токены.
+
+        Raises:
+            HTTPException: 401 — если токен не найден, истёк, отозван или уже использован.
+        """
+        unauth_exc = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Не валидный refresh-токен",
+        )
+        found = await self.repo.find_for_rotation(hash_refresh_token(refresh_token))
+        if found is None:
+            raise unauth_exc
+        token, username = found
+
+        if token.revoked_at is not None:
+            raise unauth_exc
+        now = datetime.now(timezone.utc)
+        if token.used_at is not None:
+            if now - token.used_at <= self.reuse_grace:
+                raise unauth_exc
+            await self.repo.revoke_unused_now(token.family_id)
+            self.revoked.revoke(token.family_id)
+            logger.warning(f"Повторное использование refresh-токена, сессия пользователя {token.user_id} отозвана")
+            raise unauth_exc
+
+        token.used_at = now
+        new_refresh_token = generate_refresh_token()
+        await self.repo.add(
+            token.user_id, token.family_id, hash_refresh_token(new_refresh_token), refresh_token_expires_at()
+        )
+        access_token = encode_jwt({
+            "sub": str(token.user_id),
+            "username": username,
+            "sid": token.family_id,
+        })
+        return TokenInfo(
+            access_token=access_token,
+            token_type="Bearer",
+            refresh_token=new_refresh_token,
+        )
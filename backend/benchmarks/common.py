@@ -0,0 +1,94 @@
+"""Общие функции бенчмарков: статистика задержек и запись результатов."""
+
+import json
+import math
+import platform
+import subprocess
+import time
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    Возвращает перцентиль методом ближайшего ранга.
+
+    Args:
+        sorted_values (list[float]): Отсортированные значения.
+        q (float): Перцентиль от 0 до 100.
+
+    Returns:
+        float: Значение перцентиля или 0.0 для пустого списка.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[min(max(rank - 1, 0), len(sorted_values) - 1)]
+
+
+def summarize(latencies_ms: list[float], seconds: float | None = None) -> dict:
+    """
+    Сводит задержки в миллисекундах к p50/p95/p99, среднему и максимуму.
+
+    Args:
+        latencies_ms (list[float]): Задержки отдельных вызовов.
+        seconds (float | None): Длительность замера для расчёта пропускной способности.
+
+    Returns:
+        dict: Статистика задержек (и `rps`, если задана длительность).
+    """
+    values = sorted(latencies_ms)
+    result = {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50), 4),
+        "p95_ms": round(percentile(values, 95), 4),
+        "p99_ms": round(percentile(values, 99), 4),
+        "mean_ms": round(sum(values) / len(values), 4) if values else 0.0,
+        "max_ms": round(values[-1], 4) if values else 0.0,
+    }
+    if seconds:
+        result["rps"] = round(len(values) / seconds, 2)
+    return result
+
+
+def metadata(**params) -> dict:
+    """Возвращает сведения о запуске: коммит, время, окружение и параметры."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": params,
+    }
+
+
+def write_results(results: dict, output: str | None, name: str) -> Path:
+    """
+    Сохраняет результаты в JSON и печатает их.
+
+    Args:
+        results (dict): Результаты замера.
+        output (str | None): Путь к файлу; по умолчанию `results/<name>-<commit>-<время>.json`.
+        name (str): Название бенчмарка.
+
+    Returns:
+        Path: Путь к сохранённому файлу.
+    """
+    if output:
+        path = Path(output)
+    else:
+        commit = results.get("meta", {}).get("commit") or "nogit"
+        path = RESULTS_DIR / f"{name}-{commit}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    print(f"Результаты сохранены в {path}")
+    return path
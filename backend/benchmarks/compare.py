@@ -0,0 +1,63 @@
+"""Сравнение двух файлов результатов бенчмарков (load.py или micro.py).
+
+Печатает p50/p95/p99 и пропускную способность базового и текущего
+запуска с изменением в процентах. Код выхода 1, если p95 какого-либо
+замера вырос больше чем на `--threshold` процентов.
+
+Запуск из корня репозитория:
+    python -m backend.benchmarks.compare baseline.json current.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps", "ops_per_second")
+
+
+def load_entries(path: str) -> tuple[dict, dict]:
+    """Возвращает метаданные и замеры из файла результатов."""
+    data = json.loads(Path(path).read_text())
+    entries = data.get("endpoints") or data.get("benchmarks") or {}
+    if "total" in data:
+        entries = {**entries, "total": data["total"]}
+    return data.get("meta", {}), entries
+
+
+def change(old: float, new: float) -> str:
+    """Форматирует изменение значения в процентах."""
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="Файл результатов базового запуска")
+    parser.add_argument("current", help="Файл результатов текущего запуска")
+    parser.add_argument("--threshold", type=float, default=10, help="Допустимый рост p95, %%")
+    args = parser.parse_args()
+
+    base_meta, base = load_entries(args.baseline)
+    cur_meta, cur = load_entries(args.current)
+    print(f"baseline: {base_meta.get('commit')}  current: {cur_meta.get('commit')}")
+
+    regressions = []
+    for name in sorted(set(base) & set(cur)):
+        print(f"\n{name}")
+        for metric in METRICS:
+            if metric in base[name] and metric in cur[name]:
+                old, new = base[name][metric], cur[name][metric]
+                print(f"  {metric:<15} {old:>12} -> {new:<12} {change(old, new)}")
+        old_p95, new_p95 = base[name].get("p95_ms"), cur[name].get("p95_ms")
+        if old_p95 and new_p95 and (new_p95 - old_p95) / old_p95 * 100 > args.threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\nРост p95 больше {args.threshold}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Микробенчмарк алгоритмов подписи JWT: RS256, ES256 и EdDSA.
+
+Для каждого алгоритма в памяти генерируется ключ, затем замеряются
+подпись и проверка подписи токена с тем же payload, что выдаёт
+`/auth/login/`, и размер получившегося токена. Файлы ключей приложения
+не используются и не изменяются.
+
+Запуск из корня репозитория:
+    python -m backend.benchmarks.jwt_algorithms --repeat 2000
+"""
+
+import argparse
+import time
+
+import jwt
+
+from backend.app.core.key_manager import ALGORITHMS, generate_private_key, key_id
+from backend.benchmarks.common import metadata, write_results
+from backend.benchmarks.micro import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000, help="Повторов для каждого замера")
+    parser.add_argument("--output", help="Файл результатов (по умолчанию benchmarks/results/)")
+    args = parser.parse_args()
+
+    now = int(time.time())
+    payload = {"sub": "1", "username": "bench", "sid": "0" * 32, "iat": now, "exp": now + 900}
+
+    benchmarks = {}
+    for algorithm in ALGORITHMS:
+        private_key = generate_private_key(algorithm)
+        public_key = private_key.public_key()
+        headers = {"kid": key_id(public_key)}
+        token = jwt.encode(payload, private_key, algorithm=algorithm, headers=headers)
+        benchmarks[algorithm] = {
+            "token_bytes": len(token),
+            "sign": measure(lambda: jwt.encode(payload, private_key, algorithm=algorithm, headers=headers), args.repeat),
+            "verify": measure(lambda: jwt.decode(token, public_key, algorithms=[algorithm]), args.repeat),
+        }
+
+    results = {
+        "meta": metadata(repeat=args.repeat),
+        "benchmarks": benchmarks,
+    }
+    write_results(results, args.output, "jwt-algorithms")
+
+
+if __name__ == "__main__":
+    main()
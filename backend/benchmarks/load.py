@@ -0,0 +1,185 @@
+"""Нагрузочный тест API: смесь входа, чтения и изменения задач с заданной конкурентностью.
+
+Перед запуском заполните БД (`python -m backend.benchmarks.seed`) и
+запустите приложение. Каждый виртуальный клиент входит под одним из
+пользователей seed.py и выполняет операции в пропорциях `--mix`.
+Для каждого эндпоинта сохраняются p50/p95/p99, среднее, максимум,
+число ошибок и пропускная способность; результаты разных коммитов
+сравниваются через `compare.py`.
+
+Запуск из корня репозитория:
+    python -m backend.benchmarks.load --concurrency 50 --duration 30 \\
+        --mix login=1,list=10,create=3,toggle=3,delete=1
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+from backend.benchmarks.common import metadata, summarize, write_results
+
+OPERATIONS = ("login", "list", "create", "toggle", "delete")
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Разбирает строку вида `login=1,list=10` в веса операций."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Неизвестная операция: {name}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+class VirtualClient:
+    """
+    Виртуальный пользователь нагрузочного теста.
+
+    Attributes:
+        client (httpx.AsyncClient): Общий HTTP-клиент.
+        username (str): Имя пользователя из seed.py.
+        password (str): Пароль пользователя.
+        conditional (bool): Отправлять If-None-Match при чтении списка.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, username: str, password: str, conditional: bool):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.conditional = conditional
+        self.headers: dict[str, str] = {}
+        self.task_ids: list[int] = []
+        self.etag: str | None = None
+
+    async def login(self) -> httpx.Response:
+        r = await self.client.post(
+            "/auth/login/", data={"username": self.username, "password": self.password}
+        )
+        if r.status_code == 200:
+            self.headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+        return r
+
+    async def list(self) -> httpx.Response:
+        headers = dict(self.headers)
+        if self.conditional and self.etag:
+            headers["If-None-Match"] = self.etag
+        r = await self.client.get("/tasks/get/", headers=headers)
+        if r.status_code == 200:
+            self.etag = r.headers.get("etag")
+            self.task_ids = [item["task_id"] for item in r.json()["items"]]
+        return r
+
+    async def create(self) -> httpx.Response:
+        return await self.client.post(
+            "/tasks/create/",
+            json={"title": "Нагрузочная задача", "description": "bench"},
+            headers=self.headers,
+        )
+
+    async def toggle(self) -> httpx.Response:
+        if not self.task_ids:
+            return await self.list()
+        return await self.client.put(f"/tasks/update/{random.choice(self.task_ids)}", headers=self.headers)
+
+    async def delete(self) -> httpx.Response:
+        if not self.task_ids:
+            return await self.list()
+        task_id = self.task_ids.pop(random.randrange(len(self.task_ids)))
+        return await self.client.delete(f"/tasks/delete/{task_id}", headers=self.headers)
+
+
+async def run(args) -> dict:
+    """
+    Запускает нагрузку и собирает статистику по эндпоинтам.
+
+    Args:
+        args: Аргументы командной строки.
+
+    Returns:
+        dict: Метаданные запуска и статистика по эндпоинтам.
+    """
+    names = list(args.mix)
+    weights = [args.mix[name] for name in names]
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        clients = [
+            VirtualClient(client, f"{args.prefix}{n % args.users}", args.password, args.conditional)
+            for n in range(args.concurrency)
+        ]
+        await asyncio.gather(*(c.login() for c in clients))
+        await asyncio.gather(*(c.list() for c in clients))
+
+        measuring_from = time.perf_counter() + args.warmup
+        deadline = measuring_from + args.duration
+
+        async def worker(virtual: VirtualClient) -> None:
+            while (now := time.perf_counter()) < deadline:
+                name = random.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    r = await getattr(virtual, name)()
+                    status = r.status_code
+                except httpx.HTTPError:
+                    status = 0
+                if now < measuring_from:
+                    continue
+                latencies[name].append((time.perf_counter() - started) * 1000)
+                statuses[name][status] += 1
+                if status == 0 or status >= 400:
+                    errors[name] += 1
+
+        await asyncio.gather(*(worker(c) for c in clients))
+
+    endpoints = {
+        name: {**summarize(values, args.duration), "errors": errors[name], "statuses": dict(statuses[name])}
+        for name, values in sorted(latencies.items())
+    }
+    total = summarize([value for values in latencies.values() for value in values], args.duration)
+    total["errors"] = sum(errors.values())
+    return {
+        "meta": metadata(
+            base_url=args.base_url,
+            users=args.users,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            warmup=args.warmup,
+            mix=args.mix,
+            conditional=args.conditional,
+        ),
+        "endpoints": endpoints,
+        "total": total,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Адрес приложения")
+    parser.add_argument("--users", type=int, default=100, help="Сколько пользователей seed.py задействовать")
+    parser.add_argument("--prefix", default="bench_user_", help="Префикс имён пользователей")
+    parser.add_argument("--password", default="bench-password", help="Пароль пользователей")
+    parser.add_argument("--concurrency", type=int, default=20, help="Количество одновременных клиентов")
+    parser.add_argument("--duration", type=float, default=30, help="Длительность замера в секундах")
+    parser.add_argument("--warmup", type=float, default=3, help="Прогрев без учёта в статистике, секунд")
+    parser.add_argument("--timeout", type=float, default=30, help="Таймаут запроса в секундах")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix("login=1,list=10,create=3,toggle=3,delete=1"),
+        help="Веса операций: login, list, create, toggle, delete",
+    )
+    parser.add_argument("--conditional", action="store_true", help="Отправлять If-None-Match при чтении списка")
+    parser.add_argument("--output", help="Файл результатов (по умолчанию benchmarks/results/)")
+    args = parser.parse_args()
+    write_results(asyncio.run(run(args)), args.output, "load")
+
+
+if __name__ == "__main__":
+    main()
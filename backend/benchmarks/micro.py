@@ -0,0 +1,88 @@
+"""Микробенчмарки горячих путей аутентификации: JWT и bcrypt.
+
+Замеряются `encode_jwt`, `decode_jwt` с проверкой подписи (кэш
+проверенных токенов очищается перед каждым вызовом) и с попаданием
+в кэш, а также `hash_password` и `validate_password`. Ключи JWT
+генерируются во временном каталоге; ключи приложения из `certs/`
+не используются и не изменяются.
+
+Запуск из корня репозитория:
+    python -m backend.benchmarks.micro --jwt-repeat 2000 --bcrypt-repeat 20
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from backend.app.config import settings
+from backend.app.core.jwt_utils import decode_jwt, encode_jwt, verified_tokens
+from backend.app.core.key_manager import key_manager
+from backend.app.core.password_utils import hash_password, validate_password
+from backend.benchmarks.common import metadata, summarize, write_results
+
+
+def measure(func, repeat: int, before=None) -> dict:
+    """
+    Замеряет время вызовов функции.
+
+    Args:
+        func: Замеряемая функция без аргументов.
+        repeat (int): Количество вызовов.
+        before: Функция, вызываемая перед каждым замером и не входящая в него.
+
+    Returns:
+        dict: Статистика задержек в миллисекундах и число вызовов в секунду.
+    """
+    func()
+    latencies = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - started) * 1000)
+    result = summarize(latencies)
+    result["ops_per_second"] = round(1000 / result["mean_ms"], 1) if result["mean_ms"] else 0.0
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jwt-repeat", type=int, default=2000, help="Повторов для JWT")
+    parser.add_argument("--bcrypt-repeat", type=int, default=20, help="Повторов для bcrypt")
+    parser.add_argument("--output", help="Файл результатов (по умолчанию benchmarks/results/)")
+    args = parser.parse_args()
+
+    keys_dir = Path(tempfile.mkdtemp(prefix="taskapp-bench-keys-"))
+    key_manager.private_key_path = keys_dir / "jwt-private.pem"
+    key_manager.public_key_path = keys_dir / "jwt-public.pem"
+    key_manager.previous_keys_dir = keys_dir / "previous"
+    key_manager.generate_if_missing(settings.algorithm)
+    key_manager.load()
+    payload = {"sub": "1", "username": "bench"}
+    token = encode_jwt(payload)
+    password = "bench-password"
+    hashed = hash_password(password)
+
+    results = {
+        "meta": metadata(
+            algorithm=key_manager.signing_key.algorithm,
+            password_hash_scheme=settings.password_hash_scheme,
+            bcrypt_rounds=settings.bcrypt_rounds,
+            jwt_repeat=args.jwt_repeat,
+            bcrypt_repeat=args.bcrypt_repeat,
+        ),
+        "benchmarks": {
+            "encode_jwt": measure(lambda: encode_jwt(payload), args.jwt_repeat),
+            "decode_jwt_verify": measure(lambda: decode_jwt(token), args.jwt_repeat, before=verified_tokens.clear),
+            "decode_jwt_cached": measure(lambda: decode_jwt(token), args.jwt_repeat),
+            "hash_password": measure(lambda: hash_password(password), args.bcrypt_repeat),
+            "validate_password": measure(lambda: validate_password(password, hashed), args.bcrypt_repeat),
+        },
+    }
+    write_results(results, args.output, "micro")
+
+
+if __name__ == "__main__":
+    main()
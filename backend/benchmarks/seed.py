@@ -0,0 +1,102 @@
+"""Заполнение локальной БД пользователями и задачами для нагрузочного теста.
+
+Пользователи создаются с именами `<prefix><n>` и общим паролем, чтобы
+`load.py` мог войти под любым из них. Подключение берётся из настроек
+приложения (PG_URL в .env).
+
+Запуск из корня репозитория:
+    python -m backend.benchmarks.seed --users 100 --tasks-per-user 1000 --reset
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.config import settings
+from backend.app.core.password_utils import hash_password
+from backend.app.database import migrations
+from backend.app.database.models import TaskModels, UserModels
+
+CHUNK_SIZE = 5000
+
+
+async def seed(users: int, tasks_per_user: int, prefix: str, password: str, reset: bool) -> dict:
+    """
+    Создаёт пользователей и их задачи многострочными INSERT.
+
+    Args:
+        users (int): Количество пользователей.
+        tasks_per_user (int): Количество задач у каждого пользователя.
+        prefix (str): Префикс имён пользователей.
+        password (str): Пароль всех пользователей.
+        reset (bool): Удалить ранее созданных пользователей с этим префиксом.
+
+    Returns:
+        dict: Количество созданных пользователей и задач и время заполнения.
+    """
+    started = time.perf_counter()
+    engine = create_async_engine(settings.pg_url)
+    hashed = hash_password(password)
+    now = datetime.now(timezone.utc)
+    try:
+        async with engine.begin() as conn:
+            await migrations.upgrade(conn)
+            if reset:
+                ids = select(UserModels.id).where(UserModels.username.like(f"{prefix}%"))
+                await conn.execute(delete(TaskModels).where(TaskModels.user_id.in_(ids)))
+                await conn.execute(delete(UserModels).where(UserModels.username.like(f"{prefix}%")))
+
+            res = await conn.execute(
+                insert(UserModels).returning(UserModels.id),
+                [
+                    {
+                        "username": f"{prefix}{n}",
+                        "email": f"{prefix}{n}@example.com",
+                        "password": hashed,
+                    }
+                    for n in range(users)
+                ],
+            )
+            user_ids = list(res.scalars().all())
+
+            rows = []
+            created = 0
+            for user_id in user_ids:
+                for n in range(tasks_per_user):
+                    rows.append({
+                        "title": f"Задача {n}",
+                        "description": f"Описание задачи {n}" if n % 2 else None,
+                        "is_done": random.random() < 0.3,
+                        "created_at": now - timedelta(minutes=tasks_per_user - n),
+                        "user_id": user_id,
+                    })
+                    if len(rows) >= CHUNK_SIZE:
+                        await conn.execute(insert(TaskModels), rows)
+                        created += len(rows)
+                        rows = []
+            if rows:
+                await conn.execute(insert(TaskModels), rows)
+                created += len(rows)
+    finally:
+        await engine.dispose()
+    return {"users": len(user_ids), "tasks": created, "seconds": round(time.perf_counter() - started, 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100, help="Количество пользователей")
+    parser.add_argument("--tasks-per-user", type=int, default=1000, help="Задач у каждого пользователя")
+    parser.add_argument("--prefix", default="bench_user_", help="Префикс имён пользователей")
+    parser.add_argument("--password", default="bench-password", help="Пароль всех пользователей")
+    parser.add_argument("--reset", action="store_true", help="Удалить ранее созданных пользователей")
+    args = parser.parse_args()
+    print(asyncio.run(seed(args.users, args.tasks_per_user, args.prefix, args.password, args.reset)))
+
+
+if __name__ == "__main__":
+    main()
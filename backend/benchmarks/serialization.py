@@ -0,0 +1,105 @@
+"""Микробенчмарк сериализации страницы списка задач.
+
+Сравнивает прежний путь (ORM-объекты TaskModels → jsonable_encoder → JSONResponse)
+с текущим (строки из выбранных столбцов → dict → ORJSONResponse).
+БД — SQLite в памяти, поэтому Postgres для запуска не нужен.
+
+Запуск из корня репозитория:
+    python -m backend.benchmarks.serialization --rows 200 --repeat 200
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from backend.app.database.models import Base, TaskModels, UserModels
+
+
+def seed(session: Session, rows: int) -> None:
+    """Создаёт пользователя и `rows` его задач."""
+    session.execute(insert(UserModels).values(id=1, username="bench", password=b"x", email="bench@example.com"))
+    started = datetime(2025, 1, 1)
+    session.execute(
+        insert(TaskModels),
+        [
+            {
+                "title": f"Задача {i}",
+                "description": "Описание задачи для бенчмарка" if i % 2 else None,
+                "is_done": bool(i % 3),
+                "created_at": started + timedelta(seconds=i),
+                "user_id": 1,
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def orm_path(session: Session, rows: int) -> bytes:
+    """Прежний путь: ORM-объекты и jsonable_encoder."""
+    tasks = session.execute(
+        select(TaskModels).where(TaskModels.user_id == 1).order_by(TaskModels.created_at.desc()).limit(rows)
+    ).scalars().all()
+    body = JSONResponse(jsonable_encoder({"items": tasks, "next_cursor": None})).body
+    session.expunge_all()
+    return body
+
+
+def row_path(session: Session, rows: int) -> bytes:
+    """Текущий путь: строки выбранных столбцов и orjson."""
+    result = session.execute(
+        select(
+            TaskModels.task_id,
+            TaskModels.title,
+            TaskModels.description,
+            TaskModels.is_done,
+            TaskModels.created_at,
+            TaskModels.user_id,
+        ).where(TaskModels.user_id == 1).order_by(TaskModels.created_at.desc()).limit(rows)
+    ).all()
+    return ORJSONResponse({"items": [row._asdict() for row in result], "next_cursor": None}).body
+
+
+def measure(func, session: Session, rows: int, repeat: int) -> dict:
+    """Возвращает среднее и минимальное время одного вызова в миллисекундах."""
+    func(session, rows)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(session, rows)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"mean_ms": round(sum(timings) / len(timings), 4), "min_ms": round(min(timings), 4)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200, help="Размер страницы")
+    parser.add_argument("--repeat", type=int, default=200, help="Количество повторов")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, args.rows)
+        assert json.loads(orm_path(session, args.rows)) == json.loads(row_path(session, args.rows))
+        orm = measure(orm_path, session, args.rows, args.repeat)
+        rows = measure(row_path, session, args.rows, args.repeat)
+    print(json.dumps(
+        {
+            "rows": args.rows,
+            "orm_jsonable_encoder": orm,
+            "rows_orjson": rows,
+            "speedup": round(orm["mean_ms"] / rows["mean_ms"], 2),
+        },
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import pytest
+
+from backend.app.core.login_limiter import (
+    BucketRule,
+    InMemoryLoginRateLimiter,
+    LockoutPolicy,
+    LoginRateLimitedError,
+    RedisLoginRateLimiter,
+)
+
+pytestmark = pytest.mark.anyio
+
+IP = "10.0.0.1"
+
+
+def make_policy(ip_threshold: int = 100) -> LockoutPolicy:
+    return LockoutPolicy(
+        ip_rule=BucketRule(capacity=10, refill_per_second=1, lockout_threshold=ip_threshold),
+        user_rule=BucketRule(capacity=3, refill_per_second=0.5, lockout_threshold=3),
+        base_seconds=30,
+        max_seconds=120,
+        window_seconds=900,
+    )
+
+
+def make_redis_limiter(policy: LockoutPolicy) -> RedisLoginRateLimiter:
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return RedisLoginRateLimiter(fakeredis.FakeAsyncRedis(), policy)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def make_limiter(request, clock):
+    def factory(policy: LockoutPolicy | None = None):
+        policy = policy or make_policy()
+        if request.param == "memory":
+            return InMemoryLoginRateLimiter(policy, max_keys=1000)
+        return make_redis_limiter(policy)
+    return factory
+
+
+async def retry_after(limiter, ip: str | None, username: str) -> float:
+    with pytest.raises(LoginRateLimitedError) as exc_info:
+        await limiter.check(ip, username)
+    return exc_info.value.retry_after
+
+
+async def test_burst_then_rejection_with_refill_time(make_limiter):
+    limiter = make_limiter()
+    for _ in range(3):
+        await limiter.check(IP, "alice")
+    assert await retry_after(limiter, IP, "alice") == pytest.approx(2)
+    assert limiter.stats()["allowed"] == 3
+    assert limiter.stats()["rejected"] == 1
+
+
+async def test_rejected_attempt_does_not_consume_tokens(make_limiter, clock):
+    limiter = make_limiter()
+    for _ in range(3):
+        await limiter.check(IP, "alice")
+    for _ in range(5):
+        await retry_after(limiter, IP, "alice")
+    clock.advance(2)
+    await limiter.check(IP, "alice")
+    assert await retry_after(limiter, IP, "alice") == pytest.approx(2)
+
+
+async def test_bucket_refills_up_to_capacity(make_limiter, clock):
+    limiter = make_limiter()
+    for _ in range(3):
+        await limiter.check(IP, "alice")
+    clock.advance(3600)
+    for _ in range(3):
+        await limiter.check(IP, "alice")
+    await retry_after(limiter, IP, "alice")
+
+
+async def test_username_is_normalized(make_limiter):
+    limiter = make_limiter()
+    for username in ("alice", "Alice", " ALICE "):
+        await limiter.check(IP, username)
+    await retry_after(limiter, "10.0.0.2", "alice")
+
+
+async def test_ip_bucket_is_shared_between_usernames(make_limiter):
+    limiter = make_limiter()
+    for i in range(10):
+        await limiter.check(IP, f"user{i}")
+    await retry_after(limiter, IP, "someone-else")
+    await limiter.check("10.0.0.2", "someone-else")
+
+
+async def test_lockout_doubles_and_is_capped(make_limiter, clock):
+    limiter = make_limiter()
+    expected = {3: 30, 4: 60, 5: 120, 6: 120}
+    for failures in range(1, 7):
+        await limiter.record_failure(IP, "alice")
+        if failures in expected:
+            assert await retry_after(limiter, IP, "alice") == pytest.approx(expected[failures])
+        clock.advance(1)
+    assert limiter.stats()["lockouts"] == 4
+
+
+async def test_lockout_expires(make_limiter, clock):
+    limiter = make_limiter()
+    for _ in range(3):
+        await limiter.record_failure(IP, "alice")
+    await retry_after(limiter, IP, "alice")
+    clock.advance(31)
+    await limiter.check(IP, "alice")
+
+
+async def test_failures_outside_window_are_forgotten(make_limiter, clock):
+    limiter = make_limiter()
+    for _ in range(2):
+        await limiter.record_failure(IP, "alice")
+    clock.advance(901)
+    await limiter.record_failure(IP, "alice")
+    await limiter.check(IP, "alice")
+    assert limiter.stats()["lockouts"] == 0
+
+
+async def test_success_resets_user_but_not_ip(make_limiter):
+    limiter = make_limiter(make_policy(ip_threshold=4))
+    for _ in range(3):
+        await limiter.record_failure(IP, "alice")
+    await retry_after(limiter, IP, "alice")
+
+    await limiter.record_success(IP, "alice")
+    await limiter.check(IP, "alice")
+
+    await limiter.record_failure(IP, "alice")
+    assert await retry_after(limiter, IP, "bob") == pytest.approx(30)
+
+
+async def test_redis_errors_let_attempts_through():
+    class BrokenRedis:
+        async def eval(self, *args):
+            raise ConnectionError("redis is down")
+
+        async def hdel(self, *args):
+            raise ConnectionError("redis is down")
+
+    limiter = RedisLoginRateLimiter(BrokenRedis(), make_policy())
+    for _ in range(10):
+        await limiter.check(IP, "alice")
+        await limiter.record_failure(IP, "alice")
+    await limiter.record_success(IP, "alice")
+    assert limiter.stats()["rejected"] == 0
@@ -0,0 +1,45 @@
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.core.pagination import decode_cursor, encode_cursor
+
+
+def raw_cursor(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+    datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=3))),
+    datetime(2026, 1, 2, 3, 4, 5),
+])
+def test_round_trip_keeps_time_and_id(created_at):
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_cursor_is_url_safe_without_padding():
+    for task_id in range(1, 50):
+        cursor = encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), task_id)
+        assert "=" not in cursor
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+def test_order_of_equal_times_is_kept_by_id():
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(created_at, 7)) < decode_cursor(encode_cursor(created_at, 8))
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "!!!",
+    "a",
+    raw_cursor(b"no-separator"),
+    raw_cursor(b"2026-01-01T00:00:00|abc"),
+    raw_cursor(b"not-a-date|1"),
+    raw_cursor(b"\xff\xfe|1"),
+])
+def test_corrupted_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.core.jwt_utils import decode_jwt
+from backend.app.core.key_manager import key_manager
+from backend.app.core.refresh_tokens import (
+    RevokedSessions,
+    generate_refresh_token,
+    hash_refresh_token,
+    new_session_id,
+    refresh_token_expires_at,
+)
+from backend.app.database.models import RefreshTokenModels
+from backend.app.use_case.refresh_tokens import RefreshTokensUseCase
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeRefreshTokenRepository:
+    """RefreshTokenRepository в памяти с теми же методами, что использует юзкейс."""
+
+    def __init__(self):
+        self.tokens: dict[str, RefreshTokenModels] = {}
+
+    async def add(self, user_id: int, family_id: str, token_hash: str, expires_at: datetime) -> None:
+        self.tokens[token_hash] = RefreshTokenModels(
+            user_id=user_id,
+            family_id=family_id,
+            token_hash=token_hash,
+            expires_at=expires_at,
+            used_at=None,
+            revoked_at=None,
+        )
+
+    async def find_for_rotation(self, token_hash: str) -> tuple[RefreshTokenModels, str] | None:
+        token = self.tokens.get(token_hash)
+        if token is None or token.expires_at <= datetime.now(timezone.utc):
+            return None
+        return token, "alice"
+
+    async def revoke_unused_now(self, family_id: str) -> int:
+        revoked = 0
+        for token in self.tokens.values():
+            if token.family_id == family_id and token.revoked_at is None and token.used_at is None:
+                token.revoked_at = datetime.now(timezone.utc)
+                revoked += 1
+        return revoked
+
+    def by_token(self, token: str) -> RefreshTokenModels:
+        return self.tokens[hash_refresh_token(token)]
+
+
+@pytest.fixture(autouse=True)
+def jwt_keys(tmp_path, monkeypatch):
+    monkeypatch.setattr(key_manager, "private_key_path", tmp_path / "jwt-private.pem")
+    monkeypatch.setattr(key_manager, "public_key_path", tmp_path / "jwt-public.pem")
+    monkeypatch.setattr(key_manager, "previous_keys_dir", tmp_path / "previous")
+    key_manager.generate_if_missing("EdDSA")
+    key_manager.load()
+
+
+@pytest.fixture
+def repo() -> FakeRefreshTokenRepository:
+    return FakeRefreshTokenRepository()
+
+
+@pytest.fixture
+def revoked() -> RevokedSessions:
+    return RevokedSessions(ttl_seconds=900, maxsize=1000, sync_interval=5)
+
+
+@pytest.fixture
+async def login(repo) -> str:
+    token = generate_refresh_token()
+    await repo.add(1, new_session_id(), hash_refresh_token(token), refresh_token_expires_at())
+    return token
+
+
+async def rejected(use_case: RefreshTokensUseCase, token: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await use_case.execute(token)
+    assert exc_info.value.status_code == 401
+
+
+async def test_rotation_issues_new_pair_in_same_session(repo, revoked, login):
+    result = await RefreshTokensUseCase(repo, revoked, 10).execute(login)
+
+    assert result.refresh_token != login
+    old, new = repo.by_token(login), repo.by_token(result.refresh_token)
+    assert old.used_at is not None
+    assert new.used_at is None and new.family_id == old.family_id
+    payload = decode_jwt(result.access_token)
+    assert payload["sub"] == "1"
+    assert payload["sid"] == old.family_id
+
+
+async def test_unknown_and_expired_tokens_are_rejected(repo, revoked, login):
+    use_case = RefreshTokensUseCase(repo, revoked, 10)
+    await rejected(use_case, "unknown")
+    repo.by_token(login).expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    await rejected(use_case, login)
+
+
+async def test_reuse_within_grace_keeps_session(repo, revoked, login):
+    use_case = RefreshTokensUseCase(repo, revoked, 10)
+    result = await use_case.execute(login)
+
+    await rejected(use_case, login)
+
+    family_id = repo.by_token(login).family_id
+    assert not revoked.is_revoked(family_id)
+    assert repo.by_token(result.refresh_token).revoked_at is None
+    await use_case.execute(result.refresh_token)
+
+
+async def test_reuse_after_grace_revokes_session(repo, revoked, login):
+    use_case = RefreshTokensUseCase(repo, revoked, 10)
+    result = await use_case.execute(login)
+    repo.by_token(login).used_at -= timedelta(seconds=11)
+
+    await rejected(use_case, login)
+
+    family_id = repo.by_token(login).family_id
+    assert revoked.is_revoked(family_id)
+    assert repo.by_token(result.refresh_token).revoked_at is not None
+    await rejected(use_case, result.refresh_token)
+
+
+async def test_revoked_token_is_rejected_without_rotation(repo, revoked, login):
+    repo.by_token(login).revoked_at = datetime.now(timezone.utc)
+    await rejected(RefreshTokensUseCase(repo, revoked, 10), login)
+    assert repo.by_token(login).used_at is None
+    assert len(repo.tokens) == 1
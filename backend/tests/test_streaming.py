@@ -0,0 +1,77 @@
+import pytest
+
+from backend.app.core.streaming import LineTooLongError, iter_csv_records, iter_lines
+
+pytestmark = pytest.mark.anyio
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+async def test_lines_split_across_chunks():
+    lines = await collect(iter_lines(chunks(b"ab", b"c\nde", b"f\r\n", b"\ng", b"h"), 100))
+    assert lines == ["abc", "def", "", "gh"]
+
+
+async def test_bom_and_multibyte_character_split_between_chunks():
+    data = "\ufeffзадача\nещё\n".encode()
+    parts = [data[i:i + 3] for i in range(0, len(data), 3)]
+    assert await collect(iter_lines(chunks(*parts), 100)) == ["задача", "ещё"]
+
+
+async def test_line_of_exactly_the_limit_is_accepted():
+    assert await collect(iter_lines(chunks(b"x" * 10 + b"\n"), 10)) == ["x" * 10]
+
+
+async def test_long_line_reports_its_number():
+    with pytest.raises(LineTooLongError) as exc_info:
+        await collect(iter_lines(chunks(b"ok\n", b"y" * 6, b"y" * 6, b"\n"), 10))
+    assert exc_info.value.line_no == 2
+    assert exc_info.value.limit == 10
+
+
+async def test_stream_without_newlines_is_not_buffered_to_the_end():
+    consumed = 0
+
+    async def endless():
+        nonlocal consumed
+        while True:
+            consumed += 1
+            yield b"x" * 1024
+
+    with pytest.raises(LineTooLongError):
+        await collect(iter_lines(endless(), 4096))
+    assert consumed == 5
+
+
+async def test_invalid_utf8_is_reported():
+    with pytest.raises(UnicodeDecodeError):
+        await collect(iter_lines(chunks(b"\xff\xfe{\n"), 100))
+
+
+async def test_csv_quoted_fields_with_newlines_and_quotes():
+    data = b'title,description\r\nc1,"multi\r\nline ""q"""\r\nc2,\r\n'
+    records = await collect(iter_csv_records(iter_lines(chunks(data), 100), 100))
+    assert records == [
+        (1, ["title", "description"]),
+        (2, ["c1", 'multi\nline "q"']),
+        (4, ["c2", ""]),
+    ]
+
+
+async def test_csv_unterminated_quote_is_bounded():
+    data = b'title\n"open\n' + b"row\n" * 1000
+    with pytest.raises(LineTooLongError) as exc_info:
+        await collect(iter_csv_records(iter_lines(chunks(data), 100), 50))
+    assert exc_info.value.line_no == 2
+
+
+async def test_csv_last_record_without_closing_quote_is_returned():
+    records = await collect(iter_csv_records(iter_lines(chunks(b'a\n"b'), 100), 100))
+    assert records == [(1, ["a"]), (2, ["b"])]
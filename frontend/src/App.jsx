@@ -1,4 +1,5 @@
 import { useState } from "react";
+import { logout } from "./api/auth";
 import Sidebar from "./components/Layout/Sidebar";
 import TasksList from "./pages/TasksList";
 import CreateTask from "./pages/CreateTask";
@@ -8,13 +9,27 @@ export default function App() {
   const [stage, setStage] = useState("auth");
   const [page, setPage] = useState("tasks");
 
+  const handleSelect = (key) => {
+    if (key === "logout") {
+      // Токены стираются и при ошибке запроса, так что выход выполняется в любом случае.
+      logout()
+        .catch(() => {})
+        .then(() => {
+          setPage("tasks");
+          setStage("auth");
+        });
+      return;
+    }
+    setPage(key);
+  };
+
   if (stage === "auth") {
     return <LoginRegister onLoginSuccess={() => setStage("app")} />;
   }
 
   return (
     <div style={{ display: "flex" }}>
-      <Sidebar onSelect={setPage} />
+      <Sidebar onSelect={handleSelect} />
 
       <div style={{ padding: 20, flex: 1 }}>
         {page === "tasks" && <TasksList />}
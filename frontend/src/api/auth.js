@@ -1,7 +1,16 @@
-import api from "./axios";
+import api, { clearTokens } from "./axios";
 
 export const login = (username, password) =>
   api.post("/auth/login/", { username, password });
 
 export const register = (data) =>
   api.post("/auth/registration/", data);
+
+export const logout = async () => {
+  const refreshToken = localStorage.getItem("refresh_token");
+  try {
+    if (refreshToken) await api.post("/auth/logout/", { refresh_token: refreshToken });
+  } finally {
+    clearTokens();
+  }
+};
@@ -10,4 +10,68 @@ instance.interceptors.request.use((config) => {
   return config;
 });
 
+export const saveTokens = ({ access_token, refresh_token }) => {
+  localStorage.setItem("token", access_token);
+  if (refresh_token) localStorage.setItem("refresh_token", refresh_token);
+};
+
+export const clearTokens = () => {
+  localStorage.removeItem("token");
+  localStorage.removeItem("refresh_token");
+};
+
+// Вкладки делят токены через localStorage, поэтому обновление выполняется
+// под общей блокировкой: вкладка, дождавшаяся своей очереди, берёт токен,
+// который уже получила другая вкладка, а не предъявляет использованный
+// refresh-токен повторно.
+const withRefreshLock = (callback) =>
+  navigator.locks ? navigator.locks.request("taskapp-refresh", callback) : callback();
+
+const doRefresh = async (expiredToken) => {
+  const current = localStorage.getItem("token");
+  if (current && current !== expiredToken) return current;
+
+  const refreshToken = localStorage.getItem("refresh_token");
+  if (!refreshToken) throw new Error("Нет refresh-токена");
+  try {
+    const response = await axios.post(`${instance.defaults.baseURL}/auth/refresh/`, { refresh_token: refreshToken });
+    saveTokens(response.data);
+    return response.data.access_token;
+  } catch (err) {
+    // Токены стираем, только если их не обновили за это время в другом месте.
+    if (localStorage.getItem("refresh_token") === refreshToken) clearTokens();
+    throw err;
+  }
+};
+
+// Один запрос обновления на все ответы 401, пришедшие одновременно:
+// refresh-токен одноразовый, повторное использование завершает сессию.
+let refreshing = null;
+
+export const refreshTokens = (expiredToken = localStorage.getItem("token")) => {
+  if (!refreshing) {
+    refreshing = withRefreshLock(() => doRefresh(expiredToken)).finally(() => {
+      refreshing = null;
+    });
+  }
+  return refreshing;
+};
+
+instance.interceptors.response.use(
+  (response) => response,
+  async (error) => {
+    const config = error.config;
+    if (error.response?.status !== 401 || !config || config._retried || config.url?.startsWith("/auth/")) {
+      throw error;
+    }
+    config._retried = true;
+    const expiredToken = config.headers.Authorization?.replace(/^Bearer /, "");
+    const token = await refreshTokens(expiredToken).catch(() => {
+      throw error;
+    });
+    config.headers.Authorization = `Bearer ${token}`;
+    return instance(config);
+  }
+);
+
 export default instance;
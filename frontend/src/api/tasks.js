@@ -1,11 +1,65 @@
-import api from "./axios";
+import api, { refreshTokens } from "./axios";
 
 
-export const getTasks = () => api.get("/tasks/get/");
+export const getTasks = (params = {}) => api.get("/tasks/get/", { params });
 
 export const toggleTaskState = (taskId) =>
   api.put(`/tasks/update/${taskId}`);
 
 export const createTask = (data) => api.post("/tasks/create/", data);
 
-export const deleteTask = (taskId) => api.delete(`/tasks/delete/${taskId}`);
\ No newline at end of file
+export const deleteTask = (taskId) => api.delete(`/tasks/delete/${taskId}`);
+export const createTasks = (items) => api.post("/tasks/batch/create/", { items });
+
+export const toggleTasksState = (taskIds) =>
+  api.put("/tasks/batch/update/", { task_ids: taskIds });
+
+export const deleteTasks = (taskIds) =>
+  api.post("/tasks/batch/delete/", { task_ids: taskIds });
+
+// Подписка на поток изменений задач (Server-Sent Events).
+// EventSource не умеет передавать заголовок Authorization, поэтому поток читается через fetch.
+export const subscribeTasks = (onEvent) => {
+  const controller = new AbortController();
+
+  const connect = async () => {
+    while (!controller.signal.aborted) {
+      try {
+        const token = localStorage.getItem("token");
+        const response = await fetch(`${api.defaults.baseURL}/tasks/stream/`, {
+          headers: token ? { Authorization: `Bearer ${token}` } : {},
+          signal: controller.signal,
+        });
+        if (response.status === 401) {
+          await refreshTokens(token);
+          continue;
+        }
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buffer += value;
+          const messages = buffer.split("\n\n");
+          buffer = messages.pop();
+          for (const message of messages) {
+            const data = message
+              .split("\n")
+              .filter((line) => line.startsWith("data: "))
+              .map((line) => line.slice(6))
+              .join("\n");
+            if (data) onEvent(JSON.parse(data));
+          }
+        }
+      } catch {
+        if (controller.signal.aborted) return;
+      }
+      await new Promise((resolve) => setTimeout(resolve, 3000));
+    }
+  };
+
+  connect();
+  return () => controller.abort();
+};
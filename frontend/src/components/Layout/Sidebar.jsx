@@ -1,5 +1,5 @@
 import { Menu } from "antd";
-import { AppstoreOutlined } from "@ant-design/icons";
+import { AppstoreOutlined, LogoutOutlined } from "@ant-design/icons";
 
 export default function Sidebar({ onSelect }) {
   return (
@@ -24,6 +24,7 @@ export default function Sidebar({ onSelect }) {
             },
           ],
         },
+        { key: "logout", label: "Выйти", icon: <LogoutOutlined />, danger: true },
       ]}
     />
   );
@@ -2,6 +2,7 @@ import { useState } from "react";
 import { Form, Input, Button, Card, Typography, message } from "antd";
 import { UserOutlined, MailOutlined, LockOutlined } from "@ant-design/icons";
 import axios from "axios";
+import { saveTokens } from "../api/axios";
 import "../styles/auth.css";
 
 
@@ -17,7 +18,7 @@ export default function LoginRegister({ onLoginSuccess }) {
     setMode("login");
   } catch (err) {
     if (err.response?.status === 409) {
-      message.error("Пользователь уже существует");
+      message.error(err.response.data?.detail || "Пользователь уже существует");
     }
     else {
       message.error("Ошибка регистрации");
@@ -42,7 +43,7 @@ export default function LoginRegister({ onLoginSuccess }) {
       { headers: { "Content-Type": "application/x-www-form-urlencoded" } }
     );
 
-    localStorage.setItem("token", response.data.access_token);
+    saveTokens(response.data);
     message.success("Вход выполнен!");
     onLoginSuccess();
   } catch (err) {
@@ -1,22 +1,44 @@
 import { useEffect, useState } from "react";
 import { Card, Tag, Button, Space, Spin, message, Flex } from "antd";
 import { CheckCircleTwoTone, CloseCircleTwoTone, DeleteOutlined } from "@ant-design/icons";
-import { getTasks, toggleTaskState, deleteTask } from "../api/tasks";
+import { getTasks, toggleTaskState, deleteTask, subscribeTasks } from "../api/tasks";
 import { Popconfirm } from "antd";
 
 export default function TasksList() {
   const [tasks, setTasks] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const loadTasks = () => {
     setLoading(true);
     getTasks()
-      .then((r) => setTasks(r.data))
+      .then((r) => {
+        setTasks(r.data.items);
+        setNextCursor(r.data.next_cursor);
+      })
       .finally(() => setLoading(false));
   };
 
+  const loadMore = () => {
+    setLoadingMore(true);
+    getTasks({ cursor: nextCursor })
+      .then((r) => {
+        setTasks((prev) => [...prev, ...r.data.items]);
+        setNextCursor(r.data.next_cursor);
+      })
+      .finally(() => setLoadingMore(false));
+  };
+
   useEffect(() => {
     loadTasks();
+    // Изменения из других вкладок и устройств приходят через поток событий.
+    return subscribeTasks(() => {
+      getTasks().then((r) => {
+        setTasks(r.data.items);
+        setNextCursor(r.data.next_cursor);
+      });
+    });
   }, []);
 
   const handleToggle = async (id) => {
@@ -96,6 +118,12 @@ export default function TasksList() {
           </Card>
         ))}
       </Flex>
+
+      {nextCursor && (
+        <Button style={{ marginTop: 20 }} loading={loadingMore} onClick={loadMore}>
+          Загрузить ещё
+        </Button>
+      )}
     </div>
   );
 }